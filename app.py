@@ -1,68 +1,82 @@
-import sys
+import importlib.util
+import tempfile
 import streamlit as st
 import pandas as pd
-import numpy as np
 from pathlib import Path
-import plotly.express as px
-import plotly.graph_objects as go
-import requests
 import warnings
 
 warnings.filterwarnings("ignore")
 
-from src.bias_diagnostics import BiasDiagnostics
-from src.resume_parser import extract_text_from_pdf
+from src.resume_parser import PdfLimitError
 from src.indexer import SkillIndexer
 from src.matcher import SkillMatcher
-from src.agent_mcp import MCPResumeMatchAgent
+from src.catalog_store import load_catalog
+from src.job_market import AdzunaBackend, JobMarketClient
+from src.role_registry import get_roles
+from src.shortlist import ShortlistJob
+from src.pipeline_stages import (
+    StageCache, bias_stage, extract_stage, parse_stage, score_roles_stage, stage_key
+)
+from src.lazy import lazy_import
+
+# Heavy libraries load on the first stage that needs them (see src/lazy.py)
+go = lazy_import("plotly.graph_objects")
 
 # ==================================================
 # 1. CORE ENGINES & CONFIG
 # ==================================================
-ADZUNA_APP_ID = "709a7827"
-ADZUNA_APP_KEY = "4f538cc0961df5eee65e9c53f82d7ee2"
+# Upload guards: oversized files are refused, long ones truncated
+PDF_LIMITS = {"max_bytes": 20 * 1024 * 1024, "max_pages": 50, "time_budget": 15.0}
+
+# Live job listings are fresh for this long, then served stale while refreshing
+JOBS_TTL_SECONDS = 600
+
+# Background workers for batch shortlist screening
+SHORTLIST_WORKERS = 4
+
+# Per-rerun stage log: (stage, cache hit, seconds)
+STAGE_TIMINGS = []
 
-try:
-    from src.agents.agent_langchain import ResumeSkillAgent
-    LANGCHAIN_AVAILABLE = True
-except Exception:
-    LANGCHAIN_AVAILABLE = False
+# The LangChain agent is imported only when the deep-dive is requested
+LANGCHAIN_AVAILABLE = importlib.util.find_spec("langchain") is not None
 
 @st.cache_resource
 def load_skills_catalog():
     try:
-        df = pd.read_parquet("data/processed/skills_catalog.parquet")
-        return df["skill"].astype(str).str.lower().unique().tolist()
+        return load_catalog().skills.tolist()
     except:
         return ["python", "sql", "machine learning", "aws", "docker", "kubernetes", "system design"]
 
 @st.cache_resource
 def get_matcher():
     catalog = load_skills_catalog()
-    return SkillMatcher(catalog, SkillIndexer(catalog))
+    try:
+        store = load_catalog()
+        return store.matcher(store.indexer())
+    except Exception:
+        return SkillMatcher(catalog, SkillIndexer(catalog))
+
+@st.cache_resource
+def get_stage_cache():
+    """Stage results shared across reruns; keys are input hashes."""
+    return StageCache()
+
+def run_stage(stage, key, compute, ttl=None):
+    return get_stage_cache().run(stage, key, compute, timings=STAGE_TIMINGS, ttl=ttl)
 
 def calculate_economic_impact(score, role):
     base_salaries = {"Data Scientist": 180000, "Software Engineer": 190000, "AI Engineer": 220000, "ML Engineer": 210000}
     base = base_salaries.get(role, 150000)
     return round(base * ((score / 100) ** 2) * 3.5, 2)
 
+@st.cache_resource
+def get_job_market():
+    """Pooled, cached job listings client (set JOB_MARKET_URL to use a local stand-in)."""
+    return JobMarketClient(AdzunaBackend(), ttl=JOBS_TTL_SECONDS)
+
 def fetch_hiring_companies(role, location="us"):
-    """Fetches real-time job listings using Adzuna API"""
-    url = f"https://api.adzuna.com/v1/api/jobs/{location}/search/1"
-    params = {
-        "app_id": "709a7827",
-        "app_key": "4f538cc0961df5eee65e9c53f82d7ee2",
-        "results_per_page": 5,
-        "what": role,
-        "content-type": "application/json"
-    }
-    try:
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            return response.json().get('results', [])
-    except Exception:
-        return []
-    return []
+    """Live job listings for a role; cached, stale results refresh in the background."""
+    return get_job_market().get(role, location)
 
 def generate_radar_chart(resume_skills, role_skills):
     """Principal Level: Topological Skill Mapping."""
@@ -101,6 +115,54 @@ st.caption("Vignesh Murugesan's ATS with Resume vs JD comparison, bias diagnosti
 # ==================================================
 # 3. INPUT SECTION
 # ==================================================
+# Role definitions live in config/roles.yaml (re-read when the file changes)
+ROLE_SET = get_roles()
+ROLE_SKILLS = ROLE_SET.roles
+
+mode = st.radio("Mode", ["Single resume", "Batch shortlist"], horizontal=True)
+
+if mode == "Batch shortlist":
+    st.markdown('<p class="section-head">Batch Shortlist</p>', unsafe_allow_html=True)
+    batch_uploads = st.file_uploader("Upload Resumes (PDFs or a ZIP of PDFs)", type=["pdf", "zip"], accept_multiple_files=True)
+    batch_roles = st.multiselect("Score Against Roles", list(ROLE_SKILLS.keys()), default=["Data Scientist"])
+
+    if st.button("START SCREENING", disabled=not (batch_uploads and batch_roles)):
+        previous = st.session_state.get("shortlist_job")
+        if previous is not None:
+            previous.cancel()
+        try:
+            # Runs on background threads; survives reruns in session state
+            st.session_state["shortlist_job"] = ShortlistJob(
+                [(f.name, f.getvalue()) for f in batch_uploads],
+                {role: ROLE_SKILLS[role] for role in batch_roles},
+                get_matcher(),
+                workers=SHORTLIST_WORKERS,
+                pdf_limits=PDF_LIMITS
+            ).start()
+        except ValueError as e:
+            st.error(f"Upload rejected: {e}")
+
+    job = st.session_state.get("shortlist_job")
+    if job is not None:
+        polling = not job.done
+
+        # Re-renders itself every half second while the batch runs, without
+        # blocking the script; widget changes still rerun the page as usual
+        @st.fragment(run_every=0.5 if polling else None)
+        def shortlist_progress():
+            st.progress(job.progress, text=f"Screened {job.completed} / {job.total} resumes")
+            st.dataframe(job.table(), use_container_width=True, hide_index=True)
+            if job.errors:
+                st.warning("Failed: " + "; ".join(f"{name} ({error})" for name, error in job.errors))
+            if polling and job.done:
+                # Full rerun: stops polling and shows the download button
+                st.rerun()
+
+        shortlist_progress()
+        if job.done:
+            st.download_button("Download Shortlist (CSV)", job.table().to_csv(index=False), "shortlist.csv", "text/csv")
+    st.stop()
+
 st.markdown('<p class="section-head">Upload Resume & Job Description</p>', unsafe_allow_html=True)
 col_u1, col_u2 = st.columns(2)
 with col_u1:
@@ -108,16 +170,6 @@ with col_u1:
 with col_u2:
     uploaded_jd = st.file_uploader("Upload Job Description (PDF) [Optional]", type=["pdf"])
 
-ROLE_SKILLS = {
-    "Data Scientist": ["python", "sql", "machine learning", "statistics", "pandas", "numpy"],
-    "Data Engineer": ["python", "sql", "spark", "airflow", "etl", "data pipelines"],
-    "Data Analyst": ["sql", "excel", "power bi", "tableau", "statistics"],
-    "AI Engineer": ["python", "deep learning", "model deployment", "mlops"],
-    "ML Engineer": ["python", "mlops", "docker", "kubernetes"],
-    "Software Engineer": ["java", "python", "data structures", "algorithms", "system design"],
-    "DevOps Engineer": ["ci/cd", "docker", "kubernetes", "aws", "linux"],
-}
-
 selected_roles = st.multiselect("Select Target Roles for Multi-Match Analysis", 
                                 list(ROLE_SKILLS.keys()), default=["Data Scientist"])
 
@@ -125,21 +177,39 @@ selected_roles = st.multiselect("Select Target Roles for Multi-Match Analysis",
 # 4. PROCESSING PIPELINE
 # ==================================================
 if uploaded_resume and selected_roles:
-    resume_path = Path("temp_resume.pdf")
-    resume_path.write_bytes(uploaded_resume.read())
-    resume_text = extract_text_from_pdf(resume_path)
+    resume_bytes = uploaded_resume.getvalue()
+    try:
+        resume_text = run_stage(
+            "Parse resume", stage_key(resume_bytes, PDF_LIMITS),
+            lambda: parse_stage(resume_bytes, **PDF_LIMITS)
+        )
+    except PdfLimitError as e:
+        st.error(f"Resume rejected: {e}")
+        st.stop()
     
     matcher = get_matcher()
-    resume_skills_raw = matcher.extract_resume_skills(resume_text)
+    resume_skills_raw = run_stage(
+        "Extract resume skills", stage_key(resume_text, matcher.catalog_version),
+        lambda: extract_stage(matcher, resume_text)
+    )
     resume_skills = [s["skill"] for s in resume_skills_raw if s["confidence"] > 0.15]
     resume_skill_set = set(s.lower() for s in resume_skills)
 
     # --- Resume vs JD Feature ---
     if uploaded_jd:
-        jd_path = Path("temp_jd.pdf")
-        jd_path.write_bytes(uploaded_jd.read())
-        jd_text = extract_text_from_pdf(jd_path)
-        jd_skills_raw = matcher.extract_resume_skills(jd_text)
+        jd_bytes = uploaded_jd.getvalue()
+        try:
+            jd_text = run_stage(
+                "Parse JD", stage_key(jd_bytes, PDF_LIMITS),
+                lambda: parse_stage(jd_bytes, **PDF_LIMITS)
+            )
+        except PdfLimitError as e:
+            st.warning(f"Job description skipped: {e}")
+            jd_text = ""
+        jd_skills_raw = run_stage(
+            "Extract JD skills", stage_key(jd_text, matcher.catalog_version),
+            lambda: extract_stage(matcher, jd_text)
+        )
         jd_skill_set = set(s["skill"].lower() for s in jd_skills_raw)
         
         st.markdown('<p class="section-head">📑 RESUME VS JOB DESCRIPTION</p>', unsafe_allow_html=True)
@@ -150,14 +220,16 @@ if uploaded_resume and selected_roles:
 
     # --- Multi-Role Match Comparison ---
     st.markdown('<p class="section-head">🧩 MULTI-ROLE STRATEGIC ALIGNMENT</p>', unsafe_allow_html=True)
-    rows = []
-    for role in selected_roles:
-        r_set = set(s.lower() for s in ROLE_SKILLS[role])
-        match_count = len(resume_skill_set & r_set)
-        score = round((match_count / len(r_set)) * 100, 2)
-        rows.append({"Role": role, "Match %": score, "Matched": match_count, "Total": len(r_set)})
+    selected_role_skills = {role: ROLE_SKILLS[role] for role in selected_roles}
+    rows = run_stage(
+        "Score roles", stage_key(sorted(resume_skill_set), selected_role_skills, selected_roles),
+        lambda: score_roles_stage(resume_skill_set, ROLE_SET.matrix, selected_roles)
+    )
     
-    df_compare = pd.DataFrame(rows).sort_values("Match %", ascending=False)
+    # Warm listings for every selected role while the rest of the page renders
+    get_job_market().prefetch(selected_roles)
+
+    df_compare = pd.DataFrame(rows)
     st.table(df_compare)
 
     # --- CALIBRATION & TOPOLOGY PANEL ---
@@ -181,9 +253,12 @@ if uploaded_resume and selected_roles:
 
     # --- Bias Diagnostics ---
     st.markdown('<p class="section-head">BIAS DIAGNOSTICS</p>', unsafe_allow_html=True)
-    match_scores_map = {row["Role"]: row["Match %"] for _, row in df_compare.iterrows()}
-    bias_engine = BiasDiagnostics(resume_skills=resume_skills_raw, role_skills_map=ROLE_SKILLS, match_scores=match_scores_map)
-    st.json(bias_engine.summary())
+    match_scores_map = {row["Role"]: row["Match %"] for row in rows}
+    bias_summary = run_stage(
+        "Bias diagnostics", stage_key(resume_skills_raw, ROLE_SKILLS, match_scores_map),
+        lambda: bias_stage(resume_skills_raw, ROLE_SKILLS, match_scores_map)
+    )
+    st.json(bias_summary)
 
     # --- Live Hiring ---
     st.divider()
@@ -210,8 +285,25 @@ if uploaded_resume and selected_roles:
         st.divider()
         with st.expander("PRINCIPAL AGENT DEEP-DIVE"):
             if st.button("ORCHESTRATE ANALYSIS"):
-                agent = ResumeSkillAgent(verbose=False)
-                st.write(agent.run(resume_pdf_path=str(resume_path), role=best_role).get("summary", "Done."))
+                try:
+                    from src.agents.agent_langchain import ResumeSkillAgent
+                except Exception as e:
+                    # langchain is installed but the agent stack is not usable
+                    st.error(f"Agent deep-dive unavailable: {e}")
+                else:
+                    agent = ResumeSkillAgent(verbose=False)
+                    # The LangChain tool takes a path: use a private per-session file
+                    with tempfile.TemporaryDirectory() as tmp:
+                        resume_path = Path(tmp) / "resume.pdf"
+                        resume_path.write_bytes(resume_bytes)
+                        st.write(agent.run(resume_pdf_path=str(resume_path), role=best_role).get("summary", "Done."))
+
+    # --- Pipeline Stages ---
+    with st.expander("PIPELINE STAGES (cache hits & timings)"):
+        st.table(pd.DataFrame([
+            {"Stage": t["stage"], "Cache": "hit" if t["hit"] else "computed", "ms": round(t["seconds"] * 1000, 1)}
+            for t in STAGE_TIMINGS
+        ]))
 
 else:
     st.info("📊 Upload your dossier to begin the Assessment.")
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Benchmark: cold-start import time of the app, MCP server and CLI entry
+points, checked against a budget.
+
+Each entry point runs in a fresh interpreter under `python -X importtime`;
+its import cost is the sum of the top-level cumulative times, minus the
+cost of a bare interpreter (`site` etc.). Heavy libraries (sklearn,
+scipy.sparse, PyMuPDF, requests, plotly, LangChain) are meant to load on
+first use (see src/lazy.py), so a regression here usually means an eager
+import crept back in. `--top` lists the heaviest top-level imports.
+
+Entry points whose dependencies are not installed (e.g. streamlit for the
+app) are reported as skipped, not failed.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --repeat 5 --top 8
+    python -m benchmarks.bench_import_time --only mcp_server --strict
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# name -> (interpreter args, budget in ms above a bare interpreter)
+ENTRY_POINTS: Dict[str, Tuple[List[str], float]] = {
+    "app": (["app.py"], 1500.0),
+    "mcp_server": (["-c", "import mcp_server.server"], 600.0),
+    "rpc_server_cli": (["-m", "mcp_server.rpc_server", "--help"], 600.0),
+    "bulk_screen_cli": (["-m", "src.bulk_screen", "--help"], 900.0),
+    "catalog_store_cli": (["-m", "src.catalog_store", "--help"], 400.0),
+    "job_market_cli": (["-m", "src.job_market", "--help"], 200.0),
+}
+
+
+def import_profile(args: List[str]) -> Optional[List[Tuple[str, float]]]:
+    """
+    [(top-level module, cumulative ms)] for one cold run, or None if the
+    entry point failed to start (missing dependency).
+    """
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=300
+    )
+    if proc.returncode != 0:
+        return None
+
+    top = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        cumulative_us, name = fields[1], fields[2]
+        # Nested imports are indented by two spaces per level
+        if len(name) - len(name.lstrip(" ")) <= 1:
+            top.append((name.strip(), int(cumulative_us) / 1000))
+    return top
+
+
+def measure(args: List[str], repeat: int) -> Optional[Tuple[float, List[Tuple[str, float]]]]:
+    """
+    Median total import ms over `repeat` cold runs, with the slowest
+    run's top-level breakdown.
+    """
+    runs = []
+    for _ in range(repeat):
+        profile = import_profile(args)
+        if profile is None:
+            return None
+        runs.append((sum(ms for _, ms in profile), profile))
+    runs.sort(key=lambda r: r[0])
+    return statistics.median(total for total, _ in runs), runs[-1][1]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_import_time")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=0, help="show the N heaviest top-level imports")
+    parser.add_argument("--only", nargs="+", choices=sorted(ENTRY_POINTS))
+    parser.add_argument("--strict", action="store_true", help="fail on skipped entry points too")
+    args = parser.parse_args(argv)
+
+    baseline = measure(["-c", "pass"], args.repeat)[0]
+    print(f"bare interpreter: {baseline:.1f} ms (subtracted below)\n")
+    print(f"{'entry point':<20}{'import ms':>11}{'budget':>9}  status")
+
+    failed = False
+    for name in args.only or ENTRY_POINTS:
+        entry_args, budget = ENTRY_POINTS[name]
+        result = measure(entry_args, args.repeat)
+        if result is None:
+            print(f"{name:<20}{'-':>11}{budget:>9.0f}  skipped (failed to start)")
+            failed |= args.strict
+            continue
+
+        total, profile = result
+        net = max(total - baseline, 0.0)
+        ok = net <= budget
+        failed |= not ok
+        print(f"{name:<20}{net:>11.1f}{budget:>9.0f}  {'ok' if ok else 'OVER BUDGET'}")
+
+        for module, ms in sorted(profile, key=lambda p: -p[1])[:args.top]:
+            print(f"    {module:<40}{ms:>9.1f} ms")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Benchmark: indexed partial-ratio extraction vs. the brute-force loop.
+
+Compares `extract_skills_from_text` (PartialRatioIndex) with the original
+per-skill `fuzz.partial_ratio(skill, text)` scan on catalogs of 1k-100k
+skills and a multi-page synthetic resume, and checks both return the
+same records.
+
+Usage:
+    python -m benchmarks.bench_partial_ratio
+    python -m benchmarks.bench_partial_ratio --sizes 1000 10000 --threshold 90
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+import pandas as pd
+from rapidfuzz import fuzz
+
+from src.skill_extractor import extract_skills_from_text, get_partial_ratio_index
+
+CATALOG_PATH = "data/processed/skills_catalog.parquet"
+
+FILLER = (
+    "led delivered designed built managed improved team project across "
+    "stakeholders using production scalable reporting customers weekly "
+    "with and the for of in to on experience responsible senior years"
+).split()
+
+
+def legacy_extract(text: str, skills_catalog: List[str], threshold: int = 85) -> List[Dict]:
+    """The original O(catalog × text) implementation."""
+    found = []
+    text_lower = text.lower()
+    for skill in skills_catalog:
+        skill_lower = skill.lower()
+        if skill_lower in text_lower:
+            found.append({"skill": skill, "method": "exact", "confidence": 1.0})
+        else:
+            score = fuzz.partial_ratio(skill_lower, text_lower)
+            if score >= threshold:
+                found.append({"skill": skill, "method": "fuzzy", "confidence": score / 100})
+    return found
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+
+def make_resume(skills: List[str], n_chars: int, rng: random.Random) -> str:
+    words = []
+    while sum(len(w) + 1 for w in words) < n_chars:
+        if rng.random() < 0.15:
+            skill = rng.choice(skills)
+            words.append(_typo(skill, rng) if rng.random() < 0.3 else skill)
+        else:
+            words.append(rng.choice(FILLER))
+        if rng.random() < 0.08:
+            words[-1] += ".\n"
+    return " ".join(words)
+
+
+def make_catalog(base: List[str], size: int, rng: random.Random) -> List[str]:
+    if size <= len(base):
+        return rng.sample(base, size)
+    # Pad with synthetic two-word skills built from real ones
+    extra = set()
+    while len(extra) < size - len(base):
+        extra.add(f"{rng.choice(base)} {rng.choice(base)}")
+    return base + sorted(extra)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 38000, 100000])
+    parser.add_argument("--text-chars", type=int, default=8000)
+    parser.add_argument("--threshold", type=int, default=85)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    base = sorted({
+        s for s in pd.read_parquet(CATALOG_PATH)["skill"].astype(str).str.lower().str.strip()
+        if s
+    })
+    text = make_resume(base, args.text_chars, rng)
+
+    print(f"resume: {len(text)} chars, threshold {args.threshold}")
+    print(f"{'catalog':>8} {'build s':>8} {'legacy s':>9} {'indexed s':>10} {'speedup':>8} {'hits':>6}  same")
+
+    for size in args.sizes:
+        catalog = make_catalog(base, size, rng)
+
+        t0 = time.perf_counter()
+        get_partial_ratio_index(catalog)
+        build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        expected = legacy_extract(text, catalog, args.threshold)
+        legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        got = extract_skills_from_text(text, catalog, args.threshold)
+        indexed = time.perf_counter() - t0
+
+        print(
+            f"{size:>8} {build:>8.2f} {legacy:>9.2f} {indexed:>10.3f} "
+            f"{legacy / indexed:>7.1f}x {len(got):>6}  {got == expected}"
+        )
+
+
+if __name__ == "__main__":
+    main()
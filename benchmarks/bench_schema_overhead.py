@@ -0,0 +1,108 @@
+"""
+Benchmark: per-call overhead of the agent's in-process tool hops.
+
+One resume with hundreds of extracted skills goes through the
+extract -> score hops three ways (extraction itself is not run):
+- validated: ExtractSkillsRequest/Response + MatchScoreRequest/Response
+- construct: the same models built with `model_construct`
+- trusted:   plain records (TRUSTED_TOOLS convention)
+
+With pydantic v2, `model_construct` runs in Python and is slower than
+Rust-side validation for many small nested models; skipping the models
+entirely is what removes the overhead.
+
+Usage:
+    python -m benchmarks.bench_schema_overhead
+    python -m benchmarks.bench_schema_overhead --skills 1000 --repeat 2000
+"""
+
+import argparse
+import timeit
+from typing import Dict, List
+
+from mcp_server.schemas import (
+    ExtractSkillsRequest,
+    ExtractSkillsResponse,
+    MatchScoreRequest,
+    MatchScoreResponse,
+    SkillEvidence
+)
+from mcp_server.tools.match_tools import match_score
+
+METHODS = ("exact", "fuzzy", "semantic")
+
+
+def make_records(n: int) -> List[Dict]:
+    records = []
+    for i in range(n):
+        method = METHODS[i % 3]
+        record = {
+            "skill": f"skill {i}",
+            "confidence": 1.0 if method == "exact" else 0.5 + (i % 50) / 100,
+            "method": method,
+            "evidence_snippet": f"Skill {i}",
+        }
+        if method == "exact":
+            record.update(start=i * 10, end=i * 10 + 7)
+        records.append(record)
+    return records
+
+
+def validated(text: str, records: List[Dict], role_skills: List[str]) -> Dict:
+    ExtractSkillsRequest(resume_text=text)
+    response = ExtractSkillsResponse(skills=records)
+    skills = [s.skill for s in response.skills]
+
+    request = MatchScoreRequest(resume_skills=skills, role_skills=role_skills)
+    score = MatchScoreResponse(**match_score(request.resume_skills, request.role_skills))
+    return score.model_dump()
+
+
+def construct(text: str, records: List[Dict], role_skills: List[str]) -> Dict:
+    ExtractSkillsRequest.model_construct(resume_text=text)
+    response = ExtractSkillsResponse.model_construct(
+        skills=[SkillEvidence.model_construct(**r) for r in records]
+    )
+    skills = [s.skill for s in response.skills]
+
+    request = MatchScoreRequest.model_construct(resume_skills=skills, role_skills=role_skills)
+    score = MatchScoreResponse.model_construct(
+        **match_score(request.resume_skills, request.role_skills)
+    )
+    return score.model_dump()
+
+
+def trusted(text: str, records: List[Dict], role_skills: List[str]) -> Dict:
+    skills = [r["skill"] for r in records]
+    return match_score(skills, role_skills)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_schema_overhead")
+    parser.add_argument("--skills", type=int, nargs="+", default=[50, 300, 1000])
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    text = "resume text " * 500
+    role_skills = [f"skill {i}" for i in range(0, 40, 3)]
+    paths = {"validated": validated, "construct": construct, "trusted": trusted}
+
+    print(f"{'skills':>7}" + "".join(f"  {name + ' us':>13}" for name in paths) + "  speedup")
+    for n in args.skills:
+        records = make_records(n)
+        results = [fn(text, records, role_skills) for fn in paths.values()]
+        assert all(r == results[0] for r in results)
+
+        timings = [
+            timeit.timeit(lambda: fn(text, records, role_skills), number=args.repeat)
+            / args.repeat * 1e6
+            for fn in paths.values()
+        ]
+        print(
+            f"{n:>7}" + "".join(f"  {t:>13.1f}" for t in timings)
+            + f"  {timings[0] / timings[-1]:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+"""
+JSON-RPC server for MCP_TOOLS
+-----------------------------
+
+Long-running process that keeps the extraction engine warm and serves
+`MCP_TOOLS` as newline-delimited JSON-RPC 2.0 over stdio or a local
+socket (a Unix socket path, or a loopback TCP port).
+
+Methods:
+- initialize / tools/list / tools/call  (MCP conventions)
+- <tool name>, e.g. "resume.extract_skills"  (params = tool arguments)
+
+Execution:
+- a bounded worker pool (threads, or processes for CPU isolation); at most
+  `workers` tool calls run at once, including calls that timed out
+- per-tool concurrency limits: a request for a tool already at its limit
+  is rejected as busy instead of occupying a worker
+- request timeouts
+- backpressure: requests beyond `workers + max_queue` are rejected
+- graceful drain: on shutdown, new requests are refused and in-flight
+  requests finish before the pool is closed
+
+Usage:
+    python -m mcp_server.rpc_server --stdio
+    python -m mcp_server.rpc_server --socket /tmp/mcp.sock --workers 8 \\
+        --executor process --limit resume.extract_skills_batch=2
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Callable, Dict, List, Optional, TextIO, get_type_hints
+
+from pydantic import BaseModel, ValidationError
+
+from mcp_server.server import MCP_TOOLS
+
+PROTOCOL_VERSION = "2024-11-05"
+SERVER_INFO = {"name": "agentic-hiring-mcp", "version": "1.0"}
+
+# JSON-RPC error codes (-32000..-32099 are server-defined)
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_BUSY = -32000
+REQUEST_TIMEOUT = -32001
+SHUTTING_DOWN = -32002
+
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str, data=None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def request_model(tool: Callable) -> type:
+    """
+    The pydantic request type a tool function takes (its `req` annotation).
+    """
+    hints = get_type_hints(tool)
+    hints.pop("return", None)
+    return next(iter(hints.values()))
+
+
+def _warm_worker() -> None:
+    # Process workers build their own engine once, not per request
+    from src.engine_registry import get_engine
+    get_engine()
+
+
+def _call_tool(name: str, req: BaseModel) -> Dict:
+    return MCP_TOOLS[name](req).model_dump(mode="json")
+
+
+# --------------------------------------------------
+# Dispatcher
+# --------------------------------------------------
+class MCPServer:
+    """
+    Transport-independent JSON-RPC dispatcher with a bounded worker pool.
+
+    `submit(message)` returns a Future resolving to the JSON-RPC response
+    dict (or None for notifications); transports write responses as
+    their futures complete, so replies may arrive out of order.
+    """
+
+    def __init__(
+        self,
+        tools: Optional[Dict[str, Callable]] = None,
+        workers: int = 4,
+        executor: str = "thread",
+        max_queue: int = 64,
+        tool_limits: Optional[Dict[str, int]] = None,
+        timeout: float = 30.0,
+        warm: bool = True
+    ):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor}")
+
+        self.tools = dict(MCP_TOOLS if tools is None else tools)
+        self.models = {name: request_model(fn) for name, fn in self.tools.items()}
+        self.timeout = timeout
+        self.executor = executor
+
+        # Admission: running + queued requests never exceed this bound
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._limits = {
+            name: threading.BoundedSemaphore(n)
+            for name, n in (tool_limits or {}).items()
+        }
+
+        # The tool pool does the work, `workers` calls at a time. Dispatch
+        # threads only wait for results or timeouts (one per admitted
+        # request). A timed-out request keeps its admission slot and tool
+        # limit until its call really finishes, so hung tools still count.
+        self._dispatch = ThreadPoolExecutor(workers + max_queue, thread_name_prefix="mcp-dispatch")
+        self._pool = (
+            ProcessPoolExecutor(workers, initializer=_warm_worker if warm else None)
+            if executor == "process"
+            else ThreadPoolExecutor(workers, thread_name_prefix="mcp-tool")
+        )
+        if warm and executor == "thread" and tools is None:
+            _warm_worker()
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._idle = threading.Condition(self._lock)
+        self._closing = False
+
+    # ----------------------------
+    # Entry points
+    # ----------------------------
+    def submit(self, message) -> Future:
+        """
+        Accept one decoded JSON-RPC message (dict) or raw line (str).
+        """
+        future: Future = Future()
+        request_id = None
+        try:
+            if isinstance(message, (str, bytes)):
+                try:
+                    message = json.loads(message)
+                except ValueError:
+                    raise RPCError(PARSE_ERROR, "Parse error")
+
+            if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" \
+                    or not isinstance(message.get("method"), str):
+                raise RPCError(INVALID_REQUEST, "Invalid request")
+
+            request_id = message.get("id")
+            notification = "id" not in message
+            method = message["method"]
+            params = message.get("params")
+            if params is None:
+                params = {}
+            elif not isinstance(params, dict):
+                raise RPCError(INVALID_REQUEST, "Invalid request: params must be an object")
+
+            if method in ("initialize", "tools/list") or method.startswith("notifications/"):
+                result = self._builtin(method)
+                future.set_result(None if notification else self._ok(request_id, result))
+                return future
+
+            if method == "tools/call":
+                name, arguments, wrap = params.get("name"), params.get("arguments") or {}, True
+                if not isinstance(name, str):
+                    raise RPCError(INVALID_PARAMS, "Invalid params: name must be a string")
+            else:
+                name, arguments, wrap = method, params, False
+
+            if name not in self.tools:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown tool: {name}")
+            try:
+                req = self.models[name].model_validate(arguments)
+            except ValidationError as e:
+                raise RPCError(INVALID_PARAMS, "Invalid params", json.loads(e.json()))
+
+            release = self._admit(name)
+            try:
+                # Process workers look the tool up in their own MCP_TOOLS
+                call = _call_tool if self.executor == "process" else self._call_local
+                work = self._pool.submit(call, name, req)
+                self._dispatch.submit(
+                    self._run, name, work, release, wrap, request_id, notification, future
+                )
+            except BaseException:
+                self._free(release)
+                raise
+        except RPCError as e:
+            future.set_result(self._error(request_id, e))
+        except Exception as e:
+            # A bad message must never take the transport loop down
+            future.set_result(self._error(request_id, RPCError(INTERNAL_ERROR, str(e))))
+        return future
+
+    def handle(self, message) -> Optional[Dict]:
+        """
+        Synchronous convenience wrapper around `submit`.
+        """
+        return self.submit(message).result()
+
+    # ----------------------------
+    # Execution
+    # ----------------------------
+    def _admit(self, name: str) -> List[Callable[[], None]]:
+        """
+        Take an admission slot and the tool's limit (never blocking);
+        returns the callbacks that give them back.
+        """
+        limit = self._limits.get(name)
+        with self._lock:
+            if self._closing:
+                raise RPCError(SHUTTING_DOWN, "Server is shutting down")
+            if not self._slots.acquire(blocking=False):
+                raise RPCError(SERVER_BUSY, "Server busy: request queue is full")
+            if limit is not None and not limit.acquire(blocking=False):
+                self._slots.release()
+                raise RPCError(SERVER_BUSY, f"Server busy: {name} is at its concurrency limit")
+            self._in_flight += 1
+        return [self._release] + ([limit.release] if limit is not None else [])
+
+    def _release(self) -> None:
+        self._slots.release()
+        with self._lock:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.notify_all()
+
+    def _run(self, name, work, release, wrap, request_id, notification, future) -> None:
+        # Release callbacks run when the tool call is actually over, which
+        # for a timed-out call is after this method has replied
+        try:
+            try:
+                result = work.result(timeout=self.timeout)
+            except FutureTimeout:
+                if not work.cancel():
+                    work.add_done_callback(lambda _, hold=release: self._free(hold))
+                    release = []
+                raise RPCError(REQUEST_TIMEOUT, f"{name} timed out after {self.timeout}s")
+
+            if wrap:
+                result = {
+                    "content": [{"type": "text", "text": json.dumps(result)}],
+                    "structuredContent": result,
+                    "isError": False,
+                }
+            response = self._ok(request_id, result)
+        except RPCError as e:
+            response = self._error(request_id, e)
+        except Exception as e:
+            response = self._error(request_id, RPCError(INTERNAL_ERROR, str(e)))
+        finally:
+            self._free(release)
+        future.set_result(None if notification else response)
+
+    def _call_local(self, name: str, req: BaseModel) -> Dict:
+        return self.tools[name](req).model_dump(mode="json")
+
+    @staticmethod
+    def _free(release) -> None:
+        for fn in reversed(release):
+            fn()
+
+    def _builtin(self, method: str) -> Dict:
+        if method == "initialize":
+            return {
+                "protocolVersion": PROTOCOL_VERSION,
+                "serverInfo": SERVER_INFO,
+                "capabilities": {"tools": {}},
+            }
+        if method == "tools/list":
+            return {"tools": [
+                {
+                    "name": name,
+                    "description": (fn.__doc__ or "").strip(),
+                    "inputSchema": self.models[name].model_json_schema(),
+                }
+                for name, fn in self.tools.items()
+            ]}
+        return {}
+
+    @staticmethod
+    def _ok(request_id, result) -> Dict:
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id, error: RPCError) -> Dict:
+        body = {"code": error.code, "message": error.message}
+        if error.data is not None:
+            body["data"] = error.data
+        return {"jsonrpc": "2.0", "id": request_id, "error": body}
+
+    # ----------------------------
+    # Shutdown
+    # ----------------------------
+    def shutdown(self, drain_timeout: Optional[float] = None) -> bool:
+        """
+        Refuse new requests, wait for in-flight ones, then stop the pools.
+        Returns False if the drain timed out.
+        """
+        with self._lock:
+            self._closing = True
+            drained = self._idle.wait_for(lambda: not self._in_flight, drain_timeout)
+
+        self._dispatch.shutdown(wait=drained)
+        self._pool.shutdown(wait=drained, cancel_futures=not drained)
+        return drained
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+
+# --------------------------------------------------
+# Transports
+# --------------------------------------------------
+def serve_stream(server: MCPServer, reader: TextIO, writer: TextIO) -> None:
+    """
+    Serve newline-delimited JSON-RPC on a pair of text streams until EOF;
+    replies are written as they complete, then pending ones are awaited.
+    """
+    write_lock = threading.Lock()
+    pending = set()
+
+    def reply(future: Future) -> None:
+        response = future.result()
+        if response is not None:
+            line = json.dumps(response) + "\n"
+            with write_lock:
+                try:
+                    writer.write(line)
+                    writer.flush()
+                except (OSError, ValueError):
+                    pass  # client went away
+        pending.discard(future)
+
+    for line in reader:
+        if not line.strip():
+            continue
+        future = server.submit(line)
+        pending.add(future)
+        future.add_done_callback(reply)
+
+    for future in list(pending):
+        future.result()
+
+
+def serve_stdio(server: MCPServer) -> None:
+    serve_stream(server, sys.stdin, sys.stdout)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        reader = (line.decode("utf-8") for line in self.rfile)
+        writer = _SocketWriter(self.wfile)
+        serve_stream(self.server.mcp, reader, writer)
+
+
+class _SocketWriter:
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text: str) -> None:
+        self.wfile.write(text.encode("utf-8"))
+
+    def flush(self) -> None:
+        self.wfile.flush()
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class UnixMCPServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class TCPMCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def make_socket_server(server: MCPServer, address):
+    """
+    A Unix socket server for a path, or a loopback TCP server for
+    ("127.0.0.1", port). Call `serve_forever()` / `shutdown()` on it.
+    """
+    if isinstance(address, (str, os.PathLike)):
+        path = os.fspath(address)
+        if os.path.exists(path):
+            os.unlink(path)
+        transport = UnixMCPServer(path, _Handler)
+    else:
+        transport = TCPMCPServer(tuple(address), _Handler)
+    transport.mcp = server
+    return transport
+
+
+# --------------------------------------------------
+# Local client
+# --------------------------------------------------
+class MCPClient:
+    """
+    Minimal blocking client for a socket transport (one call at a time).
+    """
+
+    def __init__(self, address, timeout: Optional[float] = None):
+        if isinstance(address, (str, os.PathLike)):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(os.fspath(address))
+        else:
+            self._sock = socket.create_connection(tuple(address))
+        self._sock.settimeout(timeout)
+        self._file = self._sock.makefile("rwb")
+        self._next_id = 0
+
+    def request(self, method: str, params: Optional[Dict] = None) -> Dict:
+        self._next_id += 1
+        message = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params or {}}
+        self._file.write((json.dumps(message) + "\n").encode("utf-8"))
+        self._file.flush()
+        return json.loads(self._file.readline())
+
+    def call(self, tool: str, arguments: Dict) -> Dict:
+        """
+        Call a tool and return its result, raising RPCError on failure.
+        """
+        response = self.request(tool, arguments)
+        if "error" in response:
+            error = response["error"]
+            raise RPCError(error["code"], error["message"], error.get("data"))
+        return response["result"]
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> "MCPClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# --------------------------------------------------
+# CLI
+# --------------------------------------------------
+def _parse_limits(values):
+    limits = {}
+    for value in values or []:
+        name, _, n = value.partition("=")
+        limits[name] = int(n)
+    return limits
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m mcp_server.rpc_server")
+    transport = parser.add_mutually_exclusive_group(required=True)
+    transport.add_argument("--stdio", action="store_true")
+    transport.add_argument("--socket", help="Unix socket path")
+    transport.add_argument("--port", type=int, help="Loopback TCP port")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--limit", action="append", metavar="TOOL=N",
+                        help="Per-tool concurrency limit (repeatable)")
+    args = parser.parse_args(argv)
+
+    server = MCPServer(
+        workers=args.workers,
+        executor=args.executor,
+        max_queue=args.max_queue,
+        tool_limits=_parse_limits(args.limit),
+        timeout=args.timeout,
+    )
+
+    if args.stdio:
+        # EOF on stdin ends the session; pending replies are drained first
+        serve_stdio(server)
+        server.shutdown(args.drain_timeout)
+        return
+
+    transport_server = make_socket_server(
+        server, args.socket if args.socket else ("127.0.0.1", args.port)
+    )
+
+    def stop(signum, frame):
+        threading.Thread(target=transport_server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"MCP server listening on {args.socket or f'127.0.0.1:{args.port}'}", file=sys.stderr)
+    try:
+        transport_server.serve_forever()
+    finally:
+        transport_server.server_close()
+        drained = server.shutdown(args.drain_timeout)
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+        print(f"MCP server stopped (drained={drained})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
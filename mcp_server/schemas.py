@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Literal
+from typing import List, Literal, Optional
 
 
 class ExtractSkillsRequest(BaseModel):
@@ -11,6 +11,9 @@ class SkillEvidence(BaseModel):
     confidence: float
     method: Literal["exact", "fuzzy", "semantic"]
     evidence_snippet: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+    windows: Optional[List[List[int]]] = None
 
 
 class ExtractSkillsResponse(BaseModel):
@@ -35,3 +38,30 @@ class MatchScoreResponse(BaseModel):
     score: float
     matched_skills: List[str]
     missing_skills: List[str]
+
+
+# ----------------------------
+# Batch tools
+# ----------------------------
+class ExtractSkillsBatchRequest(BaseModel):
+    resume_texts: List[str]
+
+
+class ExtractSkillsBatchResponse(BaseModel):
+    results: List[ExtractSkillsResponse]
+
+
+class RoleSkills(BaseModel):
+    role: str
+    skills: List[str]
+
+
+class ScoreMatrixRequest(BaseModel):
+    resume_skills: List[List[str]]
+    roles: List[RoleSkills]
+
+
+class ScoreMatrixResponse(BaseModel):
+    roles: List[str]
+    scores: List[List[float]]                   # resumes × roles
+    results: List[List[MatchScoreResponse]]     # resumes × roles
@@ -1,9 +1,23 @@
-from mcp_server.tools.resume_tools import extract_skills_tool
+from mcp_server.tools.resume_tools import (
+    extract_skill_records,
+    extract_skills_batch_tool,
+    extract_skills_tool
+)
 from mcp_server.tools.skills_tools import search_skills_tool
-from mcp_server.tools.match_tools import match_score_tool
+from mcp_server.tools.match_tools import match_score, match_score_tool, score_matrix_tool
 
 MCP_TOOLS = {
     "resume.extract_skills": extract_skills_tool,
     "skills.search": search_skills_tool,
-    "match.score": match_score_tool
+    "match.score": match_score_tool,
+    "resume.extract_skills_batch": extract_skills_batch_tool,
+    "match.score_matrix": score_matrix_tool
+}
+
+# Trusted in-process calling convention: plain arguments in, plain records
+# out, no pydantic validation. Only for callers passing data the pipeline
+# produced itself; external (JSON-RPC) traffic goes through MCP_TOOLS.
+TRUSTED_TOOLS = {
+    "resume.extract_skills": extract_skill_records,
+    "match.score": match_score
 }
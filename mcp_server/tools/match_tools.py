@@ -1,22 +1,57 @@
+from typing import Dict, List
+
 from mcp_server.schemas import (
     MatchScoreRequest,
-    MatchScoreResponse
+    MatchScoreResponse,
+    ScoreMatrixRequest,
+    ScoreMatrixResponse
 )
+from src.role_matrix import RoleMatrix, match_role
+
+
+def match_score(resume_skills: List[str], role_skills: List[str]) -> Dict:
+    """
+    Trusted in-process variant: plain {"score", "matched_skills",
+    "missing_skills"} record, no schema round trip.
+    """
+    report = match_role(resume_skills, role_skills)
+    return {
+        "score": report["score"],
+        "matched_skills": report["matched_skills"],
+        "missing_skills": report["missing_skills"]
+    }
 
 
 def match_score_tool(
     req: MatchScoreRequest
 ) -> MatchScoreResponse:
-    resume_set = set(req.resume_skills)
-    role_set = set(req.role_skills)
+    return MatchScoreResponse(**match_score(req.resume_skills, req.role_skills))
+
 
-    matched = sorted(resume_set & role_set)
-    missing = sorted(role_set - resume_set)
+def score_matrix_tool(
+    req: ScoreMatrixRequest
+) -> ScoreMatrixResponse:
+    """
+    Score every resume against every role in one sparse product
+    (see `RoleMatrix`).
+    """
+    matrix = RoleMatrix([(r.role, r.skills) for r in req.roles])
+    scores = matrix.score_batch(req.resume_skills)
 
-    score = len(matched) / max(len(role_set), 1) * 100
+    results = [
+        [
+            MatchScoreResponse(
+                score=report["score"],
+                matched_skills=report["matched_skills"],
+                missing_skills=report["missing_skills"]
+            )
+            for report in scores.reports(i)
+        ]
+        for i in range(len(scores))
+    ]
 
-    return MatchScoreResponse(
-        score=round(score, 2),
-        matched_skills=matched,
-        missing_skills=missing
+    return ScoreMatrixResponse(
+        roles=matrix.roles,
+        scores=[[r.score for r in row] for row in results],
+        results=results
     )
@@ -1,27 +1,46 @@
 from mcp_server.schemas import (
+    ExtractSkillsBatchRequest,
+    ExtractSkillsBatchResponse,
     ExtractSkillsRequest,
     ExtractSkillsResponse
 )
-from src.matcher import SkillMatcher
-from src.indexer import SkillIndexer
-import pandas as pd
+from typing import Dict, List
+
+from src.engine_registry import get_engine
+from src.result_cache import extract_resume_skills_cached
+
+
+def extract_skill_records(resume_text: str) -> List[Dict]:
+    """
+    Trusted in-process variant: plain skill records, no schema round trip.
+    """
+    return extract_resume_skills_cached(get_engine().matcher, resume_text)
 
 
 def extract_skills_tool(
     req: ExtractSkillsRequest
 ) -> ExtractSkillsResponse:
     try:
-        skills_df = pd.read_parquet(
-            "data/processed/skills_catalog.parquet"
-        )
-        skills = skills_df["skill"].tolist()
-
-        indexer = SkillIndexer(skills)
-        matcher = SkillMatcher(skills, indexer)
-
-        extracted = matcher.extract_resume_skills(req.resume_text)
+        extracted = extract_skill_records(req.resume_text)
 
         return ExtractSkillsResponse(skills=extracted)
 
     except Exception as e:
         raise RuntimeError(f"Skill extraction failed: {e}")
+
+
+def extract_skills_batch_tool(
+    req: ExtractSkillsBatchRequest
+) -> ExtractSkillsBatchResponse:
+    try:
+        matcher = get_engine().matcher
+
+        results = [
+            ExtractSkillsResponse(skills=extract_resume_skills_cached(matcher, text))
+            for text in req.resume_texts
+        ]
+
+        return ExtractSkillsBatchResponse(results=results)
+
+    except Exception as e:
+        raise RuntimeError(f"Batch skill extraction failed: {e}")
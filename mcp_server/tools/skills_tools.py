@@ -2,25 +2,16 @@ from mcp_server.schemas import (
     SkillSearchRequest,
     SkillSearchResponse
 )
-import pandas as pd
+from src.engine_registry import get_engine
 
 
 def search_skills_tool(
     req: SkillSearchRequest
 ) -> SkillSearchResponse:
     try:
-        df = pd.read_parquet(
-            "data/processed/skills_catalog.parquet"
-        )
+        hits = get_engine().search_index.search(req.query, top_k=req.top_k)
 
-        results = (
-            df["skill"]
-            .astype(str)
-            .str.lower()
-            .str.contains(req.query.lower())
-        )
-
-        skills = df.loc[results, "skill"].head(req.top_k).tolist()
+        skills = [hit["skill"] for hit in hits]
 
         return SkillSearchResponse(skills=skills)
 
@@ -1,18 +1,12 @@
 from src.agent_mcp import MCPResumeMatchAgent
+from src.role_registry import get_roles
 
 resume_text = """
 Experienced Data Scientist with strong Python, SQL,
 machine learning, pandas, and scikit-learn experience.
 """
 
-ROLE_SKILLS = [
-    "python",
-    "sql",
-    "machine learning",
-    "statistics",
-    "pandas",
-    "numpy"
-]
+ROLE_SKILLS = get_roles().skills("Data Scientist")
 
 agent = MCPResumeMatchAgent()
 result = agent.run(resume_text, ROLE_SKILLS)
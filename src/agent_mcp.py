@@ -12,14 +12,12 @@ Design goals:
 - No UI or Streamlit dependencies
 """
 
-from typing import List, Dict
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-from mcp_server.schemas import (
-    ExtractSkillsRequest,
-    MatchScoreRequest,
-)
-
-from mcp_server.server import MCP_TOOLS
+from mcp_server.server import MCP_TOOLS, TRUSTED_TOOLS
 
 
 class MCPResumeMatchAgent:
@@ -39,7 +37,10 @@ class MCPResumeMatchAgent:
             "match.score",
         }
 
-        missing = required_tools - set(MCP_TOOLS.keys())
+        missing = (
+            (required_tools - set(MCP_TOOLS.keys()))
+            | (required_tools - set(TRUSTED_TOOLS.keys()))
+        )
         if missing:
             raise RuntimeError(
                 f"MCP tools missing at startup: {missing}. "
@@ -79,41 +80,140 @@ class MCPResumeMatchAgent:
                 reason="No role skills provided"
             )
 
+        resume_skills = self._extract(resume_text)
+        return self._score(resume_skills, role_skills)
+
+    # --------------------------------------------------
+    # Async execution
+    # --------------------------------------------------
+    async def arun(
+        self,
+        resume_text: str,
+        role_skills: List[str],
+        executor: Optional[Executor] = None
+    ) -> Dict:
+        """
+        Async variant of `run`: CPU-bound extraction runs on `executor`
+        (default: the loop's thread pool) so the event loop stays free.
+        """
+        if not isinstance(resume_text, str) or not resume_text.strip():
+            return self._empty_result(
+                reason="Empty or invalid resume text"
+            )
+
+        if not role_skills:
+            return self._empty_result(
+                reason="No role skills provided"
+            )
+
+        loop = asyncio.get_running_loop()
+        resume_skills = await loop.run_in_executor(
+            executor, self._extract, resume_text
+        )
+        return self._score(resume_skills, role_skills)
+
+    async def arun_many(
+        self,
+        jobs: Iterable[Tuple[str, List[str]]],
+        concurrency: int = 8,
+        executor: Optional[Executor] = None
+    ) -> AsyncIterator[Tuple[int, Dict]]:
+        """
+        Evaluate many (resume_text, role_skills) jobs concurrently.
+
+        At most `concurrency` jobs run at once (jobs are pulled lazily from
+        `jobs`). Yields (job index, result) as jobs complete; a failed job
+        yields an empty result with the error as reason. Resumes repeated
+        across nearby jobs (one resume, many roles) are extracted once.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        extractions: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+
+        def extract(resume_text: str) -> asyncio.Future:
+            future = extractions.get(resume_text)
+            if future is None:
+                future = loop.run_in_executor(executor, self._extract, resume_text)
+                extractions[resume_text] = future
+                while len(extractions) > 4 * max(concurrency, 1):
+                    extractions.popitem(last=False)
+            return future
+
+        async def job(index: int, resume_text: str, role_skills: List[str]):
+            try:
+                if not isinstance(resume_text, str) or not resume_text.strip():
+                    return index, self._empty_result(reason="Empty or invalid resume text")
+                if not role_skills:
+                    return index, self._empty_result(reason="No role skills provided")
+                resume_skills = await extract(resume_text)
+                return index, self._score(resume_skills, role_skills)
+            except Exception as e:
+                return index, self._empty_result(reason=str(e))
+            finally:
+                semaphore.release()
+
+        pending = set()
+        jobs_iter = enumerate(jobs)
+        exhausted = False
+
+        try:
+            while pending or not exhausted:
+                # Top up the fan-out while semaphore slots are free
+                while not exhausted and not semaphore.locked():
+                    try:
+                        index, (resume_text, role_skills) = next(jobs_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    await semaphore.acquire()
+                    pending.add(asyncio.ensure_future(job(index, resume_text, role_skills)))
+
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Consumer stopped early: don't leave jobs running
+            for task in pending:
+                task.cancel()
+
+    # --------------------------------------------------
+    # Workflow steps
+    # --------------------------------------------------
+    def _extract(self, resume_text: str) -> List[str]:
         # -------------------------
         # 1. Extract resume skills
         # -------------------------
-        extract_request = ExtractSkillsRequest(
-            resume_text=resume_text
-        )
-
-        extract_response = MCP_TOOLS["resume.extract_skills"](
-            extract_request
-        )
+        # Trusted in-process call: plain records, no schema round trip
+        # (inputs were checked in `run`, outputs come from our pipeline)
+        records = TRUSTED_TOOLS["resume.extract_skills"](resume_text)
 
         resume_skills = [
-            s.skill for s in extract_response.skills
-            if isinstance(s.skill, str)
+            s["skill"] for s in records
+            if isinstance(s["skill"], str)
         ]
 
+        return resume_skills
+
+    def _score(self, resume_skills: List[str], role_skills: List[str]) -> Dict:
         # -------------------------
         # 2. Score match
         # -------------------------
-        score_request = MatchScoreRequest(
-            resume_skills=resume_skills,
-            role_skills=role_skills,
-        )
-
-        score_response = MCP_TOOLS["match.score"](
-            score_request
+        score_response = TRUSTED_TOOLS["match.score"](
+            resume_skills,
+            [str(s) for s in role_skills],
         )
 
         # -------------------------
         # 3. Assemble explanation
         # -------------------------
-        score = float(score_response.score)
+        score = float(score_response["score"])
 
-        matched = list(score_response.matched_skills)
-        missing = list(score_response.missing_skills)
+        matched = list(score_response["matched_skills"])
+        missing = list(score_response["missing_skills"])
 
         summary = self._build_summary(
             score=score,
@@ -3,43 +3,33 @@
 from typing import Dict, List
 from langchain.tools import tool
 
-def _get_all_skills() -> Dict[str, List[str]]:
-    """Master skill dictionary used by the AI Agent."""
-    return {
-        "data scientist": ["python", "sql", "machine learning", "statistics", "pandas", "numpy"],
-        "data engineer": ["python", "sql", "spark", "airflow", "etl", "data pipelines"],
-        "ml engineer": ["python", "mlops", "docker", "kubernetes", "model deployment"],
-        "ai engineer": ["python", "deep learning", "model deployment", "mlops"],
-        "data analyst": ["sql", "excel", "power bi", "tableau", "statistics"],
-        "software engineer": ["java", "python", "data structures", "algorithms", "system design"],
-        "devops engineer": ["ci/cd", "docker", "kubernetes", "aws", "linux"]
-    }
+from src.role_registry import get_roles
 
 @tool("match_to_role")
 def match_to_role(resume_skills: List[str], role_title: str) -> Dict:
     """Matches resume skills against a specific job role dynamically."""
     
-    # 1. Clean the input
-    role_key = str(role_title).strip().lower()
-    role_map = _get_all_skills()
+    # 1. Resolve the title ("Sr. ML Eng" -> "ML Engineer") against the role registry
+    roles = get_roles()
+    role = roles.resolve(str(role_title))
+    matrix = roles.matrix
     
-    # 2. Get requirements (Fallback to empty list if role not found)
+    # 2. Get requirements (Fallback to no requirements if role not found)
     # THIS REMOVES THE VALUEERROR PERMANENTLY
-    required_skills = role_map.get(role_key, [])
+    role_index = matrix.index.get(role) if role is not None else None
     
-    # 3. Process matching
+    # 3. Process matching (one row against the encoded role matrix)
     resume_set = set(s.lower() for s in resume_skills) if resume_skills else set()
-    required_set = set(required_skills)
-    
-    matched = sorted(list(resume_set & required_set))
-    missing = sorted(list(required_set - resume_set))
     
     # 4. Calculate score
-    if not required_set:
+    if role_index is None or not matrix.sizes[role_index]:
         score = 0.0
+        matched, missing = [], []
         note = f"Role '{role_title}' not in master list. Showing all found skills."
     else:
-        score = round((len(matched) / len(required_set)) * 100, 2)
+        report = matrix.score(resume_set).report(0, role_index)
+        score = report["score"]
+        matched, missing = report["matched_skills"], report["missing_skills"]
         note = "Success"
 
     return {
@@ -5,8 +5,8 @@ from pathlib import Path
 from langchain.tools import tool
 
 from src.resume_parser import extract_text_from_pdf
-from src.matcher import SkillMatcher
-from src.indexer import SkillIndexer
+from src.engine_registry import get_engine
+from src.result_cache import extract_resume_skills_cached
 
 
 @tool("extract_resume_skills")
@@ -24,14 +24,8 @@ def extract_resume_skills(resume_pdf_path: str) -> Dict[str, List[Dict]]:
     if not resume_text.strip():
         return {"skills": []}
 
-    import pandas as pd
-    skills_df = pd.read_parquet("data/processed/skills_catalog.parquet")
-    skills_catalog = (
-        skills_df["skill"].astype(str).str.lower().unique().tolist()
-    )
-
-    matcher = SkillMatcher(skills_catalog, SkillIndexer(skills_catalog))
-    extracted = matcher.extract_resume_skills(resume_text)
+    matcher = get_engine().matcher
+    extracted = extract_resume_skills_cached(matcher, resume_text)
 
     structured_skills = [
         {
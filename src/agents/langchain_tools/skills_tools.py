@@ -1,25 +1,28 @@
 # src/agents/langchain_tools/skills_tools.py
 
-from typing import Dict
-from pathlib import Path
+from typing import TYPE_CHECKING, Dict
 from langchain.tools import tool
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import FAISS
+
+from src.catalog_store import load_catalog
+
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
 _embeddings = None
 _vector_store = None
 
 
-def _load_vector_store() -> FAISS:
+def _load_vector_store() -> "FAISS":
     global _embeddings, _vector_store
 
     if _vector_store:
         return _vector_store
 
-    import pandas as pd
-    skills_path = Path("data/processed/skills_catalog.parquet")
-    df = pd.read_parquet(skills_path)
-    skills = df["skill"].astype(str).str.lower().tolist()
+    # Embedding model and FAISS load on the first search, not at import
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain_community.vectorstores import FAISS
+
+    skills = load_catalog().skills.tolist()
 
     _embeddings = HuggingFaceEmbeddings(
         model_name="sentence-transformers/all-MiniLM-L6-v2"
@@ -0,0 +1,313 @@
+# src/bulk_screen.py
+"""
+Headless bulk screening: extract skills for a file of resumes and score
+every resume against every role in a role file.
+
+Input is read in record batches (parquet, CSV or JSONL), extraction runs
+on a process pool, and each batch is written as one parquet file per role
+under `<out>/role=<role>/`. A checkpoint is written after every batch, so
+an interrupted run picks up where it stopped.
+
+Usage:
+    python -m src.bulk_screen data/processed/resume_clean.parquet \\
+        --roles config/roles.yaml --out outputs/bulk_screen --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from src.catalog_store import DEFAULT_ARTIFACT, DEFAULT_SOURCE, load_catalog
+from src.role_matrix import RoleMatrix
+from src.role_registry import DEFAULT_ROLES, load_role_file
+
+CHECKPOINT_NAME = "_checkpoint.json"
+REPORT_NAME = "_report.json"
+
+
+# -------------------------------------------------------------------
+# Inputs
+# -------------------------------------------------------------------
+def load_roles(path=DEFAULT_ROLES) -> Dict[str, List[str]]:
+    """
+    {role: [skill, ...]} from a YAML, JSON or parquet role file
+    (skills lowercased; see `src.role_registry`).
+    """
+    return load_role_file(path)[0]
+
+
+def read_batches(path, batch_size: int = 1000) -> Iterator[pd.DataFrame]:
+    """
+    Yield DataFrames of at most `batch_size` rows from a parquet, CSV or
+    JSONL file without loading the whole file.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            # fastparquet-only installs: no record-batch reader
+            df = pd.read_parquet(path)
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start:start + batch_size]
+            return
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield batch.to_pandas()
+
+    elif suffix == ".csv":
+        yield from pd.read_csv(path, chunksize=batch_size)
+
+    elif suffix in (".jsonl", ".ndjson"):
+        yield from pd.read_json(path, lines=True, chunksize=batch_size)
+
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+
+
+# -------------------------------------------------------------------
+# Scoring
+# -------------------------------------------------------------------
+def score_roles(
+    extracted: List[List[Dict]],
+    matrix: RoleMatrix,
+    min_confidence: float = 0.15
+) -> List[List[Dict]]:
+    """
+    Coverage of every role for a batch of resumes' extracted skills, in
+    one sparse product (same scoring as `SkillMatcher.match_to_role`).
+    """
+    resume_sets = [
+        {s["skill"].lower() for s in skills if s["confidence"] > min_confidence}
+        for skills in extracted
+    ]
+    scores = matrix.score_batch(resume_sets)
+
+    rows = []
+    for i, resume_set in enumerate(resume_sets):
+        resume_rows = scores.reports(i)
+        for row in resume_rows:
+            row["n_resume_skills"] = len(resume_set)
+        rows.append(resume_rows)
+    return rows
+
+
+# -------------------------------------------------------------------
+# Output & checkpoint
+# -------------------------------------------------------------------
+def _partition_dir(out: Path, role: str) -> Path:
+    safe = "".join(c if c.isalnum() or c in " -_." else "_" for c in role)
+    return out / f"role={safe}"
+
+
+def write_batch(out: Path, batch_no: int, rows: List[Dict]) -> None:
+    """
+    One parquet file per role for this batch. File names are derived from
+    the batch number, so re-running a batch overwrites instead of duplicating.
+    """
+    df = pd.DataFrame(rows)
+    for role, part in df.groupby("role", sort=False):
+        directory = _partition_dir(out, role)
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"part-{batch_no:06d}.parquet"
+        tmp = target.with_suffix(".parquet.tmp")
+        part.drop(columns="role").to_parquet(tmp, index=False)
+        os.replace(tmp, target)
+
+
+def run_fingerprint(input_path, roles: Dict, batch_size: int, min_confidence: float) -> str:
+    """
+    A checkpoint is only valid for the same input, roles and batching.
+    """
+    stat = Path(input_path).stat()
+    h = hashlib.sha256()
+    h.update(json.dumps({
+        "input": str(Path(input_path).resolve()),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "roles": roles,
+        "batch_size": batch_size,
+        "min_confidence": min_confidence,
+    }, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_checkpoint(out: Path, fingerprint: str) -> Dict:
+    try:
+        with open(out / CHECKPOINT_NAME, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return {"batches_done": 0, "rows_done": 0}
+
+    if checkpoint.get("fingerprint") != fingerprint:
+        raise ValueError(
+            f"{out} holds a checkpoint for a different run; "
+            "use --restart or another --out"
+        )
+    return checkpoint
+
+
+def write_checkpoint(out: Path, data: Dict) -> None:
+    tmp = out / (CHECKPOINT_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, out / CHECKPOINT_NAME)
+
+
+# -------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------
+def bulk_screen(
+    input_path,
+    out,
+    roles: Dict[str, List[str]],
+    matcher,
+    text_column: str = "skills",
+    id_column: str = "resume_id",
+    batch_size: int = 1000,
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+    min_confidence: float = 0.15,
+    restart: bool = False,
+    progress=None
+) -> Dict:
+    """
+    Screen every resume in `input_path` against `roles`; returns a
+    throughput report. `progress(report)` is called after each batch.
+    """
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    if restart:
+        (out / CHECKPOINT_NAME).unlink(missing_ok=True)
+
+    fingerprint = run_fingerprint(input_path, roles, batch_size, min_confidence)
+    checkpoint = read_checkpoint(out, fingerprint)
+    skip = checkpoint["batches_done"]
+
+    report = {
+        "input": str(input_path),
+        "out": str(out),
+        "batches_skipped": skip,
+        "batches_done": skip,
+        "rows_done": checkpoint["rows_done"],
+        "rows_this_run": 0,
+        "elapsed_s": 0.0,
+        "rows_per_s": 0.0,
+    }
+
+    role_matrix = RoleMatrix(roles)
+
+    # One pool for the whole run: batch frames are queued as their texts
+    # are handed to the pool, and results come back in the same order.
+    frames: deque = deque()
+
+    def texts() -> Iterator[str]:
+        for batch_no, df in enumerate(read_batches(input_path, batch_size)):
+            if batch_no < skip or df.empty:
+                continue
+            frames.append((batch_no, df))
+            for value in df[text_column].tolist():
+                yield "" if pd.isna(value) else str(value)
+
+    results = matcher.extract_resume_skills_batch(
+        texts(), workers=workers, chunksize=chunksize
+    )
+
+    started = time.perf_counter()
+    while True:
+        first = next(results, None)
+        if first is None:
+            break
+        batch_no, df = frames.popleft()
+        extracted = [first] + list(islice(results, len(df) - 1))
+
+        rows = []
+        ids = df[id_column].tolist() if id_column in df else range(len(df))
+        for resume_id, resume_rows in zip(ids, score_roles(extracted, role_matrix, min_confidence)):
+            for row in resume_rows:
+                row["resume_id"] = resume_id
+                rows.append(row)
+        write_batch(out, batch_no, rows)
+
+        report["batches_done"] = batch_no + 1
+        report["rows_done"] += len(df)
+        report["rows_this_run"] += len(df)
+        report["elapsed_s"] = round(time.perf_counter() - started, 3)
+        report["rows_per_s"] = round(
+            report["rows_this_run"] / max(report["elapsed_s"], 1e-9), 1
+        )
+        write_checkpoint(out, {
+            "fingerprint": fingerprint,
+            "batches_done": report["batches_done"],
+            "rows_done": report["rows_done"],
+        })
+        if progress is not None:
+            progress(report)
+
+    with open(out / REPORT_NAME, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+# -------------------------------------------------------------------
+# CLI
+# -------------------------------------------------------------------
+def _print_progress(report: Dict) -> None:
+    print(
+        f"batch {report['batches_done']:>6}  rows {report['rows_done']:>9}  "
+        f"{report['rows_per_s']:>8.1f} rows/s  {report['elapsed_s']:>8.1f}s",
+        file=sys.stderr,
+        flush=True
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.bulk_screen")
+    parser.add_argument("input", help="Resumes as .parquet, .csv or .jsonl")
+    parser.add_argument("--roles", default=str(DEFAULT_ROLES), help="YAML/JSON role -> skills file")
+    parser.add_argument("--out", default="outputs/bulk_screen")
+    parser.add_argument("--text-column", default="skills")
+    parser.add_argument("--id-column", default="resume_id")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=32)
+    parser.add_argument("--min-confidence", type=float, default=0.15)
+    parser.add_argument("--semantic", action="store_true", help="Include the TF-IDF semantic stage")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--catalog-source", default=str(DEFAULT_SOURCE))
+    parser.add_argument("--catalog-artifact", default=str(DEFAULT_ARTIFACT))
+    args = parser.parse_args(argv)
+
+    store = load_catalog(args.catalog_source, args.catalog_artifact)
+    matcher = store.matcher(store.indexer() if args.semantic else None)
+
+    report = bulk_screen(
+        args.input,
+        args.out,
+        load_roles(args.roles),
+        matcher,
+        text_column=args.text_column,
+        id_column=args.id_column,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        min_confidence=args.min_confidence,
+        restart=args.restart,
+        progress=_print_progress,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+# src/catalog_store.py
+"""
+Precompiled skills catalog artifact.
+
+`compile-catalog` turns the skills parquet into one versioned binary file
+holding the cleaned/validated skill strings, the exact-match automaton
+and the fuzzy candidate index as flat arrays.
+`CatalogStore` opens that file with mmap, so processes share its pages
+instead of each re-reading parquet and rebuilding the same structures.
+
+Usage:
+    python -m src.catalog_store compile-catalog \\
+        --source data/processed/skills_catalog.parquet \\
+        --out data/processed/skills_catalog.skcat
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.fuzzy_index import FuzzySkillIndex
+from src.indexer import SkillIndexer
+from src.matcher import SkillMatcher
+from src.skill_automaton import SkillAutomaton
+
+DEFAULT_SOURCE = Path("data/processed/skills_catalog.parquet")
+DEFAULT_ARTIFACT = Path("data/processed/skills_catalog.skcat")
+
+MAGIC = b"SKCAT\x00\x00\x00"
+FORMAT_VERSION = 1
+_ALIGN = 64
+
+PathLike = Union[str, Path]
+
+
+# -------------------------------------------------------------------
+# Hashing & cleaning
+# -------------------------------------------------------------------
+def stat_key(path: PathLike) -> Tuple[int, int]:
+    """
+    (mtime_ns, size) of a file, or (0, 0) if it is missing.
+    """
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return 0, 0
+
+
+def file_sha256(path: PathLike) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def clean_catalog(skills: Iterable) -> List[str]:
+    """
+    Lowercase, strip and de-duplicate raw catalog entries.
+    """
+    cleaned = {
+        s.lower().strip()
+        for s in skills
+        if isinstance(s, str)
+    }
+    cleaned.discard("")
+    return sorted(cleaned)
+
+
+def catalog_hash(skills: List[str]) -> str:
+    h = hashlib.sha256(f"skcat-v{FORMAT_VERSION}\n".encode())
+    h.update("\n".join(skills).encode("utf-8"))
+    return h.hexdigest()
+
+
+# -------------------------------------------------------------------
+# Compilation
+# -------------------------------------------------------------------
+def build_sections(skills: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Build every array stored in the artifact from a cleaned catalog.
+    """
+    valid_skill = np.array([SkillMatcher.is_valid_skill(s) for s in skills], dtype=bool)
+    valid_phrase = np.array([SkillMatcher.is_valid_phrase(s) for s in skills], dtype=bool)
+
+    automaton = SkillAutomaton(s for s, ok in zip(skills, valid_phrase) if ok)
+    fuzzy = FuzzySkillIndex(s for s, ok in zip(skills, valid_skill) if ok)
+
+    sections = {
+        "skills": np.array(skills, dtype=str),
+        "valid_skill": valid_skill,
+        "valid_phrase": valid_phrase,
+    }
+    sections.update({f"automaton/{k}": v for k, v in automaton.to_arrays().items()})
+    sections.update({f"fuzzy/{k}": v for k, v in fuzzy.to_arrays().items()})
+    return sections
+
+
+def write_artifact(
+    path: PathLike,
+    sections: Dict[str, np.ndarray],
+    meta: Dict
+) -> None:
+    """
+    Write sections as aligned raw buffers behind a JSON header.
+    The file is written to a temp path and swapped in atomically.
+    """
+    path = Path(path)
+    layout = {}
+    offset = 0
+    for name, arr in sections.items():
+        arr = np.ascontiguousarray(arr)
+        sections[name] = arr
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout[name] = {
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+            "offset": offset,
+        }
+        offset += arr.nbytes
+
+    header = json.dumps({**meta, "sections": layout}).encode("utf-8")
+    prefix = len(MAGIC) + 8 + len(header)
+    data_start = -(-prefix // _ALIGN) * _ALIGN
+
+    tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<II", FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(b"\x00" * (data_start - prefix))
+        for name, arr in sections.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+
+
+def compile_catalog(
+    source: PathLike = DEFAULT_SOURCE,
+    out: PathLike = DEFAULT_ARTIFACT
+) -> Path:
+    """
+    Compile the skills parquet into a catalog artifact.
+    """
+    import pandas as pd
+
+    skills = clean_catalog(pd.read_parquet(source)["skill"].tolist())
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "content_hash": catalog_hash(skills),
+        "source": str(source),
+        "source_sha256": file_sha256(source),
+        "source_stat": list(stat_key(source)),
+        "n_skills": len(skills),
+    }
+
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_artifact(out, build_sections(skills), meta)
+    return out
+
+
+def read_header(path: PathLike) -> Dict:
+    with open(path, "rb") as f:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"Not a skills catalog artifact: {path}")
+        version, header_len = struct.unpack("<II", f.read(8))
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Catalog artifact version {version} != {FORMAT_VERSION}: {path}"
+            )
+        header = json.loads(f.read(header_len).decode("utf-8"))
+
+    prefix = len(MAGIC) + 8 + header_len
+    header["data_start"] = -(-prefix // _ALIGN) * _ALIGN
+    return header
+
+
+# -------------------------------------------------------------------
+# Store
+# -------------------------------------------------------------------
+class CatalogStore:
+    """
+    Read-only, mmap-backed view of a compiled catalog artifact.
+
+    Arrays are zero-copy views into the shared mapping; derived engines
+    (automaton, fuzzy index, matcher) are built from them on first use.
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self.header = read_header(self.path)
+        self.content_hash: str = self.header["content_hash"]
+
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self._automaton: Optional[SkillAutomaton] = None
+        self._fuzzy: Optional[FuzzySkillIndex] = None
+        self._indexer: Optional[SkillIndexer] = None
+        self._skill_set: Optional[FrozenSet[str]] = None
+
+    def __len__(self) -> int:
+        return self.header["n_skills"]
+
+    def __repr__(self) -> str:
+        return f"CatalogStore({str(self.path)!r}, hash={self.content_hash[:12]})"
+
+    def array(self, name: str) -> np.ndarray:
+        arr = self._arrays.get(name)
+        if arr is None:
+            spec = self.header["sections"][name]
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            if count == 0:
+                return np.empty(spec["shape"], dtype=dtype)
+            arr = np.frombuffer(
+                self._mmap,
+                dtype=dtype,
+                count=count,
+                offset=self.header["data_start"] + spec["offset"],
+            ).reshape(spec["shape"])
+            self._arrays[name] = arr
+        return arr
+
+    def _prefixed(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {
+            name[len(prefix):]: self.array(name)
+            for name in self.header["sections"]
+            if name.startswith(prefix)
+        }
+
+    # ----------------------------
+    # Catalog views
+    # ----------------------------
+    @property
+    def skills(self) -> np.ndarray:
+        return self.array("skills")
+
+    @property
+    def skill_set(self) -> FrozenSet[str]:
+        if self._skill_set is None:
+            self._skill_set = frozenset(self.skills.tolist())
+        return self._skill_set
+
+    # ----------------------------
+    # Engines
+    # ----------------------------
+    @property
+    def automaton(self) -> SkillAutomaton:
+        with self._lock:
+            if self._automaton is None:
+                self._automaton = SkillAutomaton.from_arrays(
+                    self._prefixed("automaton/")
+                )
+            return self._automaton
+
+    @property
+    def fuzzy_index(self) -> FuzzySkillIndex:
+        with self._lock:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzySkillIndex.from_arrays(
+                    self._prefixed("fuzzy/"), threshold=90
+                )
+            return self._fuzzy
+
+    def indexer(self) -> SkillIndexer:
+        """
+        TF-IDF indexer for this catalog, loaded from the on-disk cache
+        next to the artifact and fitted only on a cache miss.
+        """
+        with self._lock:
+            if self._indexer is None:
+                self._indexer = SkillIndexer.load_or_fit(
+                    self.skills.tolist(),
+                    cache_dir=self.path.parent / "skill_indexer"
+                )
+            return self._indexer
+
+    def matcher(self, indexer=None, **kwargs) -> SkillMatcher:
+        return SkillMatcher.from_store(self, indexer, **kwargs)
+
+
+# -------------------------------------------------------------------
+# Process-wide access (keyed by content hash)
+# -------------------------------------------------------------------
+# Weak values: a store (and its mmap) goes away once no engine, matcher
+# or load_catalog entry references it, e.g. after a catalog hot reload
+_STORES: "weakref.WeakValueDictionary[str, CatalogStore]" = weakref.WeakValueDictionary()
+_STORES_LOCK = threading.Lock()
+
+
+def open_catalog(artifact: PathLike = DEFAULT_ARTIFACT) -> CatalogStore:
+    """
+    Open an artifact, reusing an existing mapping with the same content hash.
+    """
+    content_hash = read_header(artifact)["content_hash"]
+    with _STORES_LOCK:
+        store = _STORES.get(content_hash)
+        if store is None:
+            store = CatalogStore(artifact)
+            _STORES[store.content_hash] = store
+        return store
+
+
+# (source, artifact) -> (source stat, artifact stat, store) of the last check
+_LOADED: Dict[Tuple[str, str], Tuple[Tuple[int, int], Tuple[int, int], CatalogStore]] = {}
+
+
+def load_catalog(
+    source: PathLike = DEFAULT_SOURCE,
+    artifact: PathLike = DEFAULT_ARTIFACT
+) -> CatalogStore:
+    """
+    Open the catalog artifact, compiling it first if it is missing,
+    from an older format, or stale relative to `source`.
+
+    Calls with unchanged (mtime_ns, size) for both files return the
+    current store without touching either file; the source is hashed
+    only when its stat differs from the one recorded at compile time.
+    """
+    artifact = Path(artifact)
+    key = (str(source), str(artifact))
+    stats = (stat_key(source), stat_key(artifact))
+    with _STORES_LOCK:
+        loaded = _LOADED.get(key)
+        if loaded is not None and loaded[:2] == stats:
+            return loaded[2]
+
+        try:
+            header = read_header(artifact)
+            stale = (
+                Path(source).exists()
+                and header.get("source_stat") != list(stats[0])
+                and header.get("source_sha256") != file_sha256(source)
+            )
+        except (OSError, ValueError):
+            stale = True
+
+        if stale:
+            compile_catalog(source, artifact)
+
+    store = open_catalog(artifact)
+    with _STORES_LOCK:
+        _LOADED[key] = (stats[0], stat_key(artifact), store)
+    return store
+
+
+# -------------------------------------------------------------------
+# CLI
+# -------------------------------------------------------------------
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.catalog_store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    compile_p = sub.add_parser(
+        "compile-catalog",
+        help="Compile the skills parquet into an mmap-able artifact"
+    )
+    compile_p.add_argument("--source", default=str(DEFAULT_SOURCE))
+    compile_p.add_argument("--out", default=str(DEFAULT_ARTIFACT))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compile-catalog":
+        out = compile_catalog(args.source, args.out)
+        header = read_header(out)
+        print(
+            f"Compiled {header['n_skills']} skills -> {out} "
+            f"(hash {header['content_hash'][:12]}, "
+            f"{out.stat().st_size / 1e6:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# src/engine_registry.py
+"""
+Process-wide, warm extraction engines.
+
+Front ends (MCP tools, agents) resolve the matcher/indexer from here
+instead of rebuilding them per request. The registry watches the catalog
+source and artifact; when either changes it rebuilds in a background
+thread and swaps the new engine in with a single assignment, so callers
+always see a complete engine (old or new, never half-built).
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.catalog_store import DEFAULT_ARTIFACT, DEFAULT_SOURCE, CatalogStore, load_catalog
+from src.indexer import SkillIndexer
+from src.matcher import SkillMatcher
+from src.skill_search import SkillSearchIndex
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return 0, 0
+
+
+@dataclass(frozen=True)
+class Engine:
+    """
+    One immutable build: catalog store, TF-IDF indexer and matcher.
+    """
+    store: CatalogStore
+    indexer: Optional[SkillIndexer]
+    matcher: SkillMatcher
+    built_at: float = field(default_factory=time.time)
+
+    @property
+    def version(self) -> str:
+        return self.store.content_hash
+
+    @cached_property
+    def search_index(self) -> SkillSearchIndex:
+        # Built on first search, then shared by every request on this engine
+        return SkillSearchIndex(self.store.skills.tolist())
+
+
+class EngineRegistry:
+    """
+    Lazily builds one `Engine` and keeps it warm.
+
+    `get()` is cheap: it returns the current engine and, at most every
+    `check_interval` seconds, stats the catalog files. A change triggers
+    one background rebuild; requests keep using the previous engine until
+    the new one is swapped in.
+    """
+
+    def __init__(
+        self,
+        source=DEFAULT_SOURCE,
+        artifact=DEFAULT_ARTIFACT,
+        semantic: bool = True,
+        check_interval: float = 2.0
+    ):
+        self.source = Path(source)
+        self.artifact = Path(artifact)
+        self.semantic = semantic
+        self.check_interval = check_interval
+
+        self._engine: Optional[Engine] = None
+        self._files = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._rebuilding: Optional[threading.Thread] = None
+
+    def _files_key(self):
+        return _stat_key(self.source), _stat_key(self.artifact)
+
+    def _build(self) -> Engine:
+        store = load_catalog(self.source, self.artifact)
+        indexer = store.indexer() if self.semantic else None
+        return Engine(store=store, indexer=indexer, matcher=store.matcher(indexer))
+
+    def get(self) -> Engine:
+        engine = self._engine
+        if engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._files = self._files_key()
+                    self._engine = self._build()
+                    self._checked_at = time.monotonic()
+                return self._engine
+
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._maybe_rebuild()
+        return engine
+
+    def _maybe_rebuild(self) -> None:
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if self._rebuilding is not None:
+                return
+            files = self._files_key()
+            if files == self._files:
+                return
+            self._rebuilding = threading.Thread(
+                target=self._rebuild, args=(files,), name="engine-rebuild", daemon=True
+            )
+            self._rebuilding.start()
+
+    def _rebuild(self, files) -> None:
+        try:
+            engine = self._build()
+            # Recompiling the artifact touches it; record the post-build state
+            files = self._files_key()
+        except Exception:
+            # Keep serving the previous engine; retry on the next file change
+            engine = None
+
+        with self._lock:
+            if engine is not None:
+                self._engine = engine
+            self._files = files
+            self._rebuilding = None
+
+    def refresh(self) -> Engine:
+        """
+        Rebuild synchronously (e.g. after compiling a new catalog).
+        """
+        engine = self._build()
+        with self._lock:
+            self._engine = engine
+            self._files = self._files_key()
+            self._checked_at = time.monotonic()
+        return engine
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until a running background rebuild has finished.
+        """
+        thread = self._rebuilding
+        if thread is not None:
+            thread.join(timeout)
+
+
+_REGISTRY: Optional[EngineRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> EngineRegistry:
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = EngineRegistry()
+        return _REGISTRY
+
+
+def get_engine() -> Engine:
+    return get_registry().get()
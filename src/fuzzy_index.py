@@ -0,0 +1,184 @@
+# src/fuzzy_index.py
+
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# Bigram keys pack (length, occurrence, char1, char2) into one int64
+_CHAR_BITS = 21
+_OCC_BITS = 8
+
+
+def _bigram_keys(s: str, length: int) -> np.ndarray:
+    """
+    Bigram keys tagged with their occurrence number, so that set
+    intersection behaves like multiset intersection ("aa" twice != once).
+    """
+    seen: Dict[str, int] = defaultdict(int)
+    keys = []
+    for i in range(len(s) - 1):
+        g = s[i:i + 2]
+        seen[g] += 1
+        occ = min(seen[g], (1 << _OCC_BITS) - 1)
+        keys.append(
+            (((length << _OCC_BITS) | occ) << (2 * _CHAR_BITS))
+            | (ord(g[0]) << _CHAR_BITS)
+            | ord(g[1])
+        )
+    return np.array(keys, dtype=np.int64)
+
+
+class FuzzySkillIndex:
+    """
+    Candidate index for token-level fuzzy skill matching.
+
+    Skills are bucketed by length and indexed by tagged bigrams. For a
+    token, only length-compatible skills sharing enough bigrams to possibly
+    reach `threshold` under `fuzz.ratio` are scored, so results are
+    identical to scoring the full catalog × token cross product.
+
+    All state lives in flat numpy arrays (see `to_arrays`) so the index
+    can be stored in and mmapped from a catalog artifact.
+    """
+
+    ARRAY_NAMES = ("skills", "length_ptr", "post_keys", "post_ptr", "post_ids")
+
+    def __init__(self, skills: Iterable[str], threshold: float = 90):
+        skills = sorted(dict.fromkeys(skills), key=lambda s: (len(s), s))
+        max_len = len(skills[-1]) if skills else 0
+
+        lengths = np.array([len(s) for s in skills], dtype=np.int64)
+        length_ptr = np.searchsorted(lengths, np.arange(max_len + 2))
+
+        keys, ids = [], []
+        for i, skill in enumerate(skills):
+            k = _bigram_keys(skill, len(skill))
+            keys.append(k)
+            ids.append(np.full(len(k), i, dtype=np.int32))
+
+        keys = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+        ids = np.concatenate(ids) if ids else np.empty(0, dtype=np.int32)
+        order = np.argsort(keys, kind="stable")
+        keys, ids = keys[order], ids[order]
+
+        post_keys, post_ptr = np.unique(keys, return_index=True)
+
+        self.threshold = threshold
+        self._set_arrays({
+            "skills": np.array(skills, dtype=str),
+            "length_ptr": length_ptr.astype(np.int64),
+            "post_keys": post_keys,
+            "post_ptr": np.append(post_ptr, len(keys)).astype(np.int64),
+            "post_ids": ids,
+        })
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Dict[str, np.ndarray],
+        threshold: float = 90
+    ) -> "FuzzySkillIndex":
+        """
+        Rebuild an index from `to_arrays` output without recompiling.
+        """
+        self = cls.__new__(cls)
+        self.threshold = threshold
+        self._set_arrays(arrays)
+        return self
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, f"_{name}") for name in self.ARRAY_NAMES}
+
+    def _set_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        for name in self.ARRAY_NAMES:
+            setattr(self, f"_{name}", arrays[name])
+
+    @property
+    def skills(self) -> List[str]:
+        return self._skills.tolist()
+
+    # ----------------------------
+    # Bounds
+    # ----------------------------
+    def _max_distance(self, a: int, b: int) -> int:
+        # fuzz.ratio = 100 * (1 - indel / (a + b))
+        return int((1 - self.threshold / 100) * (a + b) + 1e-9)
+
+    def _length_range(self, n: int) -> range:
+        r = 1 - self.threshold / 100
+        lo = int(np.ceil(n * (1 - r) / (1 + r) - 1e-9))
+        hi = int(np.floor(n * (1 + r) / (1 - r) + 1e-9))
+        return range(max(lo, 1), min(hi, len(self._length_ptr) - 2) + 1)
+
+    def _min_shared_bigrams(self, a: int, b: int) -> int:
+        # Bigrams kept intact on both sides of the LCS: lcs - 1 - indel
+        d = self._max_distance(a, b)
+        lcs = (a + b - d) / 2
+        return int(np.floor(lcs - 1 - d))
+
+    # ----------------------------
+    # Candidate generation
+    # ----------------------------
+    def candidates(self, token: str) -> np.ndarray:
+        """
+        Skill ids that could score >= threshold against `token`.
+        """
+        found = []
+
+        for length in self._length_range(len(token)):
+            lo, hi = self._length_ptr[length], self._length_ptr[length + 1]
+            if lo == hi:
+                continue
+
+            need = self._min_shared_bigrams(length, len(token))
+            if need <= 0:
+                found.append(np.arange(lo, hi, dtype=np.int32))
+                continue
+
+            keys = _bigram_keys(token, length)
+            j = np.searchsorted(self._post_keys, keys)
+            hit = j < len(self._post_keys)
+            hit[hit] = self._post_keys[j[hit]] == keys[hit]
+            j = j[hit]
+            if len(j) < need:
+                continue
+
+            lists = [
+                self._post_ids[self._post_ptr[k]:self._post_ptr[k + 1]]
+                for k in j
+            ]
+            ids, counts = np.unique(np.concatenate(lists), return_counts=True)
+            found.append(ids[counts >= need])
+
+        if not found:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(found)
+
+    # ----------------------------
+    # Matching
+    # ----------------------------
+    def match(self, tokens: Iterable[str]) -> Dict[str, float]:
+        """
+        Return {skill: best fuzz.ratio over tokens} for scores >= threshold.
+        """
+        best: Dict[str, float] = {}
+
+        for token in set(tokens):
+            ids = self.candidates(token)
+            if not len(ids):
+                continue
+
+            choices = self._skills[ids].tolist()
+            for skill, score, _ in process.extract(
+                token,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=self.threshold,
+                limit=None,
+            ):
+                if score > best.get(skill, 0):
+                    best[skill] = score
+
+        return best
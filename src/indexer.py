@@ -1,5 +1,21 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from src.lazy import lazy_import
+
+# Loaded on first fit/load/search, not at import
+sklearn = lazy_import("sklearn")
+sparse = lazy_import("scipy.sparse")
+
+DEFAULT_CACHE_DIR = Path("data/processed/skill_indexer")
+
+# Bump when the persisted layout or vectorizer settings change
+INDEX_FORMAT_VERSION = 1
 
 
 class SkillIndexer:
@@ -10,24 +26,172 @@ class SkillIndexer:
     def __init__(self, skills):
         self.skills = list(skills)
 
-        self.vectorizer = TfidfVectorizer(
+        self.vectorizer = self._make_vectorizer()
+
+        self.skill_vectors = self.vectorizer.fit_transform(self.skills)
+
+    @staticmethod
+    def _make_vectorizer():
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(
             ngram_range=(1, 2),
             stop_words=None
         )
 
-        self.skill_vectors = self.vectorizer.fit_transform(self.skills)
+    @staticmethod
+    def catalog_hash(skills) -> str:
+        """
+        Key a fitted index by the exact skill list it was fitted on.
+        """
+        h = hashlib.sha256(
+            f"skill-indexer-v{INDEX_FORMAT_VERSION}-sklearn{sklearn.__version__}\n".encode()
+        )
+        h.update("\n".join(skills).encode("utf-8"))
+        return h.hexdigest()
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+    def save(self, path):
+        """
+        Persist vocabulary, IDF vector and CSR skill matrix as .npy files
+        (loadable with mmap) plus a small JSON manifest.
+        """
+        path = Path(path)
+        tmp = path.with_name(path.name + f".tmp{os.getpid()}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        vocab = sorted(self.vectorizer.vocabulary_, key=self.vectorizer.vocabulary_.get)
+        matrix = sparse.csr_matrix(self.skill_vectors)
+
+        np.save(tmp / "skills.npy", np.array(self.skills, dtype=str))
+        np.save(tmp / "vocab.npy", np.array(vocab, dtype=str))
+        np.save(tmp / "idf.npy", self.vectorizer.idf_)
+        np.save(tmp / "data.npy", matrix.data)
+        np.save(tmp / "indices.npy", matrix.indices)
+        np.save(tmp / "indptr.npy", matrix.indptr)
+
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": INDEX_FORMAT_VERSION,
+                "catalog_hash": self.catalog_hash(self.skills),
+                "sklearn_version": sklearn.__version__,
+                "shape": list(matrix.shape),
+            }, f, indent=2)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Restore a saved index without refitting.
+        """
+        path = Path(path)
+        with open(path / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported SkillIndexer format in {path}")
+
+        def _load(name):
+            return np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
 
+        self = cls.__new__(cls)
+        self.skills = _load("skills").tolist()
+
+        self.vectorizer = cls._make_vectorizer()
+        self.vectorizer.vocabulary_ = {
+            term: i for i, term in enumerate(_load("vocab").tolist())
+        }
+        self.vectorizer.idf_ = np.asarray(_load("idf"))
+
+        self.skill_vectors = sparse.csr_matrix(
+            (_load("data"), _load("indices"), _load("indptr")),
+            shape=tuple(meta["shape"]),
+            copy=False
+        )
+        self.catalog_hash_ = meta["catalog_hash"]
+        return self
+
+    @classmethod
+    def load_or_fit(cls, skills, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Load the cached index for this catalog, fitting and saving it
+        only when no index exists for the catalog hash yet.
+        """
+        skills = list(skills)
+        key = cls.catalog_hash(skills)
+        path = Path(cache_dir) / key[:16]
+
+        try:
+            indexer = cls.load(path)
+            if indexer.catalog_hash_ == key:
+                return indexer
+        except (OSError, ValueError, KeyError):
+            pass
+
+        indexer = cls(skills)
+        try:
+            indexer.save(path)
+        except OSError:
+            # Read-only deployments still get a working (unsaved) index
+            pass
+        return indexer
+
+    # ----------------------------
+    # Search
+    # ----------------------------
     def search(self, text, top_k=5):
-        text_vec = self.vectorizer.transform([text])
-        sims = cosine_similarity(text_vec, self.skill_vectors)[0]
-
-        top_idx = sims.argsort()[-top_k:][::-1]
-
-        return [
-            {
-                "skill": self.skills[i],
-                "similarity": float(sims[i])
-            }
-            for i in top_idx
-            if sims[i] > 0.2
-        ]
+        return self.search_batch([text], top_k=top_k, min_sim=0.2)[0]
+
+    def similarity_matrix(self, texts, min_sim=0.0):
+        """
+        Sparse (n_texts × n_skills) cosine similarities above `min_sim`.
+
+        TF-IDF rows are already L2-normalised, so cosine similarity is a
+        plain sparse-sparse product; only non-zero entries materialise.
+        """
+        if getattr(self, "_skill_vectors_t", None) is None:
+            self._skill_vectors_t = sparse.csr_matrix(self.skill_vectors.T)
+
+        query = self.vectorizer.transform(list(texts))
+        sims = sparse.csr_matrix(query @ self._skill_vectors_t)
+
+        if min_sim > 0:
+            sims.data[sims.data <= min_sim] = 0
+            sims.eliminate_zeros()
+        return sims
+
+    def search_batch(self, texts, top_k=5, min_sim=0.0):
+        """
+        Top-k skills for many texts at once.
+
+        Returns one (ragged) list of {"skill", "similarity"} per text,
+        keeping similarities strictly above `min_sim`. `top_k=None`
+        returns every hit above the threshold.
+        """
+        sims = self.similarity_matrix(texts, min_sim=min_sim)
+        results = []
+
+        for row in range(sims.shape[0]):
+            lo, hi = sims.indptr[row], sims.indptr[row + 1]
+            data = sims.data[lo:hi]
+            cols = sims.indices[lo:hi]
+
+            if top_k is not None and len(data) > top_k:
+                keep = np.argpartition(-data, max(top_k, 1) - 1)[:max(top_k, 0)]
+                data, cols = data[keep], cols[keep]
+
+            order = np.lexsort((cols, -data))
+            results.append([
+                {
+                    "skill": self.skills[cols[i]],
+                    "similarity": float(data[i])
+                }
+                for i in order
+            ])
+
+        return results
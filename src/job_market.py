@@ -0,0 +1,276 @@
+# src/job_market.py
+"""
+Job-market listings client.
+
+- pooled `requests.Session` with connect/read timeouts
+- TTL cache keyed by (role, location)
+- stale-while-revalidate: an entry past its TTL but within `stale_ttl` is
+  returned immediately while a background refresh runs
+- concurrent prefetch for several roles
+- pluggable backend: `AdzunaBackend` talks to the Adzuna search API (or
+  any server with the same shape, e.g. `FixtureServer` for tests and
+  offline runs)
+
+Run a local stand-in with:
+    python -m src.job_market --serve fixtures.json --port 8765
+and point the app at it with JOB_MARKET_URL=http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.lazy import lazy_import
+
+requests = lazy_import("requests")
+
+ADZUNA_URL = "https://api.adzuna.com/v1/api"
+
+# (connect, read) seconds; a slow upstream must not stall a page render
+DEFAULT_TIMEOUT = (3.05, 8.0)
+
+
+class AdzunaBackend:
+    """
+    Adzuna job search over a pooled session. `base_url` can point at any
+    server exposing `/jobs/<location>/search/1` (see `FixtureServer`).
+    """
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_size: int = 8,
+        results_per_page: int = 5
+    ):
+        self.app_id = app_id or os.environ.get("ADZUNA_APP_ID", "709a7827")
+        self.app_key = app_key or os.environ.get("ADZUNA_APP_KEY", "4f538cc0961df5eee65e9c53f82d7ee2")
+        self.base_url = (base_url or os.environ.get("JOB_MARKET_URL", ADZUNA_URL)).rstrip("/")
+        self.timeout = timeout
+        self.results_per_page = results_per_page
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def search(self, role: str, location: str = "us") -> List[Dict]:
+        response = self.session.get(
+            f"{self.base_url}/jobs/{location}/search/1",
+            params={
+                "app_id": self.app_id,
+                "app_key": self.app_key,
+                "results_per_page": self.results_per_page,
+                "what": role,
+                "content-type": "application/json"
+            },
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json().get("results", [])
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class JobMarketClient:
+    """
+    Cached front for a backend with a `search(role, location)` method.
+
+    `get` never raises: upstream failures fall back to the last known
+    listings (however old) or an empty list.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        ttl: float = 600.0,
+        stale_ttl: float = 3600.0,
+        workers: int = 4
+    ):
+        self.backend = backend if backend is not None else AdzunaBackend()
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+
+        self._entries: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="job-market"
+        )
+
+    @staticmethod
+    def _key(role: str, location: str) -> Tuple[str, str]:
+        return role.strip().lower(), location.strip().lower()
+
+    # ----------------------------
+    # Access
+    # ----------------------------
+    def get(self, role: str, location: str = "us") -> List[Dict]:
+        key = self._key(role, location)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age <= self.ttl:
+                return entry[1]
+            if age <= self.stale_ttl:
+                self._refresh(key, role, location)
+                return entry[1]
+
+        try:
+            return self._refresh(key, role, location).result()
+        except Exception:
+            return entry[1] if entry is not None else []
+
+    def prefetch(self, roles: Iterable[str], location: str = "us") -> List[Future]:
+        """
+        Start background fetches for every role not fresh in the cache.
+        """
+        futures = []
+        for role in roles:
+            key = self._key(role, location)
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                futures.append(self._refresh(key, role, location))
+        return futures
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if hasattr(self.backend, "close"):
+            self.backend.close()
+
+    # ----------------------------
+    # Refresh
+    # ----------------------------
+    def _refresh(self, key: Tuple[str, str], role: str, location: str) -> Future:
+        """
+        One in-flight fetch per key; concurrent callers share it.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(self._fetch, key, role, location)
+                self._inflight[key] = future
+            return future
+
+    def _fetch(self, key: Tuple[str, str], role: str, location: str) -> List[Dict]:
+        try:
+            results = self.backend.search(role, location)
+            with self._lock:
+                self._entries[key] = (time.monotonic(), results)
+            return results
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+# -------------------------------------------------------------------
+# Local stand-in server
+# -------------------------------------------------------------------
+class FixtureServer:
+    """
+    Adzuna-shaped HTTP server on localhost for tests and offline runs.
+
+    `listings` maps a role (matched case-insensitively against `what`) to
+    its results; unknown roles get an empty list. `delay` simulates a slow
+    upstream.
+    """
+
+    def __init__(
+        self,
+        listings: Dict[str, List[Dict]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0
+    ):
+        self.listings = {role.lower(): results for role, results in listings.items()}
+        self.delay = delay
+        self.requests: List[Dict] = []
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                fixture.requests.append({"path": url.path, **query})
+                if fixture.delay:
+                    time.sleep(fixture.delay)
+
+                parts = url.path.strip("/").split("/")
+                if len(parts) < 4 or parts[-4] != "jobs" or parts[-2:] != ["search", "1"]:
+                    self.send_error(404)
+                    return
+
+                results = fixture.listings.get(query.get("what", "").lower(), [])
+                body = json.dumps({"count": len(results), "results": results}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve job listings fixtures in the Adzuna format")
+    parser.add_argument("--serve", required=True, help="JSON file mapping role -> list of listings")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with open(args.serve, encoding="utf-8") as f:
+        listings = json.load(f)
+
+    server = FixtureServer(listings, host=args.host, port=args.port)
+    print(f"Serving {len(listings)} roles at {server.url}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
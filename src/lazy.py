@@ -0,0 +1,37 @@
+# src/lazy.py
+"""
+Deferred imports for heavy dependencies.
+
+`lazy_import("sklearn")` returns a module stand-in that performs the real
+import on first attribute access, so modules can keep `sklearn.foo`-style
+call sites while start-up (landing page, MCP server, CLI --help) does not
+pay for libraries only some stages use. Measure with
+`python -m benchmarks.bench_import_time`.
+"""
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Proxy for a module that is imported when first used.
+    """
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        # Later lookups hit the copied attributes, not __getattr__
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    The module itself if already imported, else a `LazyModule` for it.
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
@@ -1,7 +1,15 @@
+import hashlib
 import json
-from rapidfuzz import fuzz
-from typing import List, Dict
+import multiprocessing as mp
+import os
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from src.fuzzy_index import FuzzySkillIndex
+from src.role_matrix import match_role
+from src.skill_automaton import SkillAutomaton
+from src.text_document import TokenizedDocument
 
 class SkillMatcher:
     """
@@ -9,13 +17,79 @@ class SkillMatcher:
     Priority: correctness > sophistication
     """
 
-    def __init__(self, skills_catalog, indexer=None):
+    SEMANTIC_MODES = ("document", "window")
+
+    def __init__(
+        self,
+        skills_catalog,
+        indexer=None,
+        semantic_mode: str = "document",
+        semantic_aggregate: str = "max"
+    ):
         self.skills_catalog = {
             s.lower().strip()
             for s in skills_catalog
             if isinstance(s, str)
         }
         self.indexer = indexer  # optional
+        self._set_semantic_mode(semantic_mode, semantic_aggregate)
+        self._catalog_version = None
+
+        # Compiled once per catalog: single-pass exact matching
+        self.automaton = SkillAutomaton(
+            s for s in sorted(self.skills_catalog)
+            if self.is_valid_phrase(s)
+        )
+        self.fuzzy_index = FuzzySkillIndex(
+            (s for s in sorted(self.skills_catalog) if self.is_valid_skill(s)),
+            threshold=90
+        )
+
+    @classmethod
+    def from_store(
+        cls,
+        store,
+        indexer=None,
+        semantic_mode: str = "document",
+        semantic_aggregate: str = "max"
+    ) -> "SkillMatcher":
+        """
+        Build a matcher from a compiled `CatalogStore` without re-cleaning,
+        re-validating or recompiling the catalog.
+        """
+        matcher = cls.__new__(cls)
+        matcher.skills_catalog = store.skill_set
+        matcher.indexer = indexer
+        matcher._set_semantic_mode(semantic_mode, semantic_aggregate)
+        matcher.automaton = store.automaton
+        matcher.fuzzy_index = store.fuzzy_index
+        matcher.artifact_path = store.path
+        matcher._catalog_version = store.content_hash
+        return matcher
+
+    @property
+    def catalog_version(self) -> str:
+        """
+        Content hash of the skills catalog (used to key cached results).
+        """
+        if self._catalog_version is None:
+            h = hashlib.sha256()
+            h.update("\n".join(sorted(self.skills_catalog)).encode("utf-8"))
+            self._catalog_version = h.hexdigest()
+        return self._catalog_version
+
+    def _set_semantic_mode(self, mode: str, aggregate: str) -> None:
+        """
+        document: one TF-IDF query for the whole text, top 5 hits.
+        window:   one batched query per sentence/line window, hits
+                  aggregated per skill by max or mean similarity.
+        """
+        if mode not in self.SEMANTIC_MODES:
+            raise ValueError(f"Unknown semantic_mode: {mode}")
+        if aggregate not in ("max", "mean"):
+            raise ValueError(f"Unknown semantic_aggregate: {aggregate}")
+        self.semantic_mode = mode
+        self.semantic_aggregate = aggregate
 
     # ----------------------------
     # Skill hygiene
@@ -29,59 +103,64 @@ class SkillMatcher:
             and not skill.isnumeric()
         )
 
+    @staticmethod
+    def is_valid_phrase(skill: str) -> bool:
+        """
+        Multi-word variant of `is_valid_skill`: every word must be alphabetic.
+        """
+        return (
+            isinstance(skill, str)
+            and len(skill) >= 3
+            and skill == " ".join(skill.split())
+            and all(w.isalpha() for w in skill.split())
+        )
+
     # ----------------------------
     # Resume skill extraction
     # ----------------------------
-    def extract_resume_skills(self, resume_text: str) -> List[Dict]:
-        resume_text_l = resume_text.lower()
+    def extract_resume_skills(
+        self,
+        resume_text: Union[str, TokenizedDocument]
+    ) -> List[Dict]:
+        doc = TokenizedDocument.ensure(resume_text)
         extracted = []
 
-        # ---- Exact match (safe) ----
-        for skill in self.skills_catalog:
-            if not self.is_valid_skill(skill):
-                continue
-
-            if f" {skill} " in f" {resume_text_l} ":
-                extracted.append({
-                    "skill": skill,
-                    "confidence": 1.0,
-                    "method": "exact",
-                    "evidence_snippet": skill
-                })
-
-        # ---- Fuzzy match (token-level) ----
-        tokens = resume_text_l.split()
-
-        for skill in self.skills_catalog:
-            if not self.is_valid_skill(skill):
-                continue
-
-            score = max(
-                (fuzz.ratio(skill, t) for t in tokens),
-                default=0
-            )
+        # ---- Exact match (single pass, word boundaries) ----
+        for hit in self.automaton.find(doc):
+            extracted.append({
+                "skill": hit["skill"],
+                "confidence": 1.0,
+                "method": "exact",
+                "evidence_snippet": doc.span(hit["start"], hit["end"]),
+                "start": hit["start"],
+                "end": hit["end"]
+            })
 
-            if score >= 90:
-                extracted.append({
-                    "skill": skill,
-                    "confidence": score / 100,
-                    "method": "fuzzy",
-                    "evidence_snippet": skill
-                })
+        # ---- Fuzzy match (token-level, indexed) ----
+        for skill, score in self.fuzzy_index.match(doc.tokens).items():
+            extracted.append({
+                "skill": skill,
+                "confidence": score / 100,
+                "method": "fuzzy",
+                "evidence_snippet": skill
+            })
 
         # ---- Semantic match (OPTIONAL, SAFE) ----
         if self.indexer is not None:
             try:
-                hits = self.indexer.search(resume_text, top_k=5)
-                for hit in hits:
-                    skill = hit.get("skill", "").lower()
-                    if self.is_valid_skill(skill):
-                        extracted.append({
-                            "skill": skill,
-                            "confidence": float(hit.get("similarity", 0)),
-                            "method": "semantic",
-                            "evidence_snippet": skill
-                        })
+                if self.semantic_mode == "window":
+                    extracted.extend(self._semantic_windows(doc))
+                else:
+                    hits = self.indexer.search(doc.normalized, top_k=5)
+                    for hit in hits:
+                        skill = hit.get("skill", "").lower()
+                        if self.is_valid_skill(skill):
+                            extracted.append({
+                                "skill": skill,
+                                "confidence": float(hit.get("similarity", 0)),
+                                "method": "semantic",
+                                "evidence_snippet": skill
+                            })
             except Exception:
                 # Do NOT crash the pipeline
                 pass
@@ -95,6 +174,157 @@ class SkillMatcher:
 
         return list(unique.values())
 
+    def _semantic_windows(
+        self,
+        doc: Union[str, TokenizedDocument],
+        top_k: int = 5,
+        min_sim: float = 0.2
+    ) -> List[Dict]:
+        """
+        Windowed semantic stage: every window goes through the indexer in
+        one sparse matrix product; each skill keeps the windows it hit.
+        """
+        doc = TokenizedDocument.ensure(doc)
+        windows = doc.sentences
+        if not windows:
+            return []
+
+        per_window = self.indexer.search_batch(
+            [doc.normalized[s:e] for s, e in windows],
+            top_k=top_k,
+            min_sim=min_sim
+        )
+
+        hits: Dict[str, List[Tuple[float, Tuple[int, int]]]] = {}
+        for window, window_hits in zip(windows, per_window):
+            for hit in window_hits:
+                skill = hit["skill"].lower()
+                if self.is_valid_skill(skill):
+                    hits.setdefault(skill, []).append((hit["similarity"], window))
+
+        results = []
+        for skill, found in hits.items():
+            sims = [sim for sim, _ in found]
+            best_sim, (start, end) = max(found, key=lambda f: f[0])
+            confidence = (
+                max(sims) if self.semantic_aggregate == "max"
+                else sum(sims) / len(sims)
+            )
+            results.append({
+                "skill": skill,
+                "confidence": float(confidence),
+                "method": "semantic",
+                "evidence_snippet": doc.span(start, end),
+                "start": start,
+                "end": end,
+                "windows": [list(w) for _, w in found]
+            })
+        return results
+
+    # ----------------------------
+    # Incremental extraction
+    # ----------------------------
+    def extract_resume_skills_incremental(
+        self,
+        pages: Iterable[str]
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Extract skills page by page as pages arrive (e.g. from
+        `iter_pdf_pages`), so matching starts before the whole PDF is read.
+
+        Yields (page index, records) with the records that are new or
+        improved by that page; offsets refer to the pages joined by "\\n".
+        The semantic stage sees one page at a time, so its scores can
+        differ from a whole-document run.
+        """
+        best: Dict[str, Dict] = {}
+        offset = 0
+
+        for page_no, page in enumerate(pages):
+            changed = []
+            for record in self.extract_resume_skills(page):
+                if record.get("start") is not None:
+                    record["start"] += offset
+                    record["end"] += offset
+                if "windows" in record:
+                    record["windows"] = [[s + offset, e + offset] for s, e in record["windows"]]
+
+                current = best.get(record["skill"])
+                if current is None or record["confidence"] > current["confidence"]:
+                    best[record["skill"]] = record
+                    changed.append(record)
+
+            offset += len(page) + 1
+            yield page_no, changed
+
+    # ----------------------------
+    # Batch extraction
+    # ----------------------------
+    def extract_resume_skills_batch(
+        self,
+        texts: Iterable[Union[str, TokenizedDocument]],
+        workers: Optional[int] = None,
+        chunksize: int = 16
+    ) -> Iterator[List[Dict]]:
+        """
+        Extract skills for many resumes on a process pool.
+
+        Yields one result list per input, in input order. Inputs are read
+        lazily and at most `2 * workers` chunks are in flight, so memory
+        stays flat for arbitrarily long iterables.
+
+        Workers get the catalog once: forked workers inherit this matcher,
+        spawned workers re-open the mmap'd catalog artifact (or unpickle the
+        matcher once in their initializer when there is no artifact).
+        `workers <= 1` runs in-process.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        chunksize = max(int(chunksize), 1)
+
+        if workers <= 1:
+            for text in texts:
+                yield self.extract_resume_skills(text)
+            return
+
+        if "fork" in mp.get_all_start_methods():
+            # Forked workers inherit initargs in memory (nothing is pickled),
+            # and each pool gets its own matcher even when batches overlap
+            ctx = mp.get_context("fork")
+            initargs = (self,)
+        else:
+            ctx = mp.get_context("spawn")
+            initargs = (self._worker_spec(),)
+
+        pool = ctx.Pool(workers, initializer=_init_worker, initargs=initargs)
+        try:
+            iter_texts = iter(texts)
+            chunks = iter(lambda: list(islice(iter_texts, chunksize)), [])
+            pending = deque()
+
+            for chunk in chunks:
+                pending.append(pool.apply_async(_extract_chunk, (chunk,)))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().get()
+
+            while pending:
+                yield from pending.popleft().get()
+
+            pool.close()
+        finally:
+            # Early exit (generator closed / error) must not leave workers behind
+            pool.terminate()
+            pool.join()
+
+    def _worker_spec(self):
+        """
+        What a spawned worker needs to rebuild this matcher.
+        """
+        artifact = getattr(self, "artifact_path", None)
+        if artifact is None:
+            return self
+        return (str(artifact), self.indexer, self.semantic_mode, self.semantic_aggregate)
+
     # ----------------------------
     # Save extracted skills
     # ----------------------------
@@ -106,19 +336,16 @@ class SkillMatcher:
     # Match to role
     # ----------------------------
     def match_to_role(self, resume_skills, role_skills):
-        resume_set = {s["skill"] for s in resume_skills}
-        role_set = {s.lower() for s in role_skills}
-
-        matched = sorted(resume_set & role_set)
-        missing = sorted(role_set - resume_set)
-
-        coverage = len(matched) / max(len(role_set), 1)
+        scored = match_role(
+            [s["skill"] for s in resume_skills],
+            [s.lower() for s in role_skills]
+        )
 
         report = {
-            "matched_skills": matched,
-            "missing_skills": missing,
-            "coverage": round(coverage, 3),
-            "score": round(coverage * 100, 2),
+            "matched_skills": scored["matched_skills"],
+            "missing_skills": scored["missing_skills"],
+            "coverage": scored["coverage"],
+            "score": scored["score"],
             "explanation": "Exact + fuzzy (+ optional semantic) skill matching"
         }
 
@@ -126,3 +353,27 @@ class SkillMatcher:
             json.dump(report, f, indent=2)
 
         return report
+
+
+# -------------------------------------------------------------------
+# Process-pool workers (see SkillMatcher.extract_resume_skills_batch)
+# -------------------------------------------------------------------
+_WORKER_MATCHER: Optional[SkillMatcher] = None
+
+
+def _init_worker(spec) -> None:
+    global _WORKER_MATCHER
+    if isinstance(spec, SkillMatcher):
+        _WORKER_MATCHER = spec
+        return
+
+    from src.catalog_store import open_catalog
+
+    artifact, indexer, mode, aggregate = spec
+    _WORKER_MATCHER = open_catalog(artifact).matcher(
+        indexer, semantic_mode=mode, semantic_aggregate=aggregate
+    )
+
+
+def _extract_chunk(texts: List[Union[str, TokenizedDocument]]) -> List[List[Dict]]:
+    return [_WORKER_MATCHER.extract_resume_skills(t) for t in texts]
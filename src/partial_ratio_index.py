@@ -0,0 +1,276 @@
+# src/partial_ratio_index.py
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz
+from scipy import sparse
+
+from src.text_document import normalize_text
+
+# rapidfuzz scores every window exhaustively only for needles up to 64
+# chars; longer skills are always scored on the full text.
+_EXHAUSTIVE_MAX = 64
+
+# Skills are grouped by length into buckets with upper bound L; each
+# bucket scans the text in chunks of length L + stride (stride = ceil(L / 2))
+# so that every window of length <= L fits in at least one chunk.
+_LENGTHS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 16, 18, 20, 24, 28, 32, 40, 48, 56, 64)
+
+
+def _bigrams(s: str) -> List[str]:
+    return [s[i:i + 2] for i in range(len(s) - 1)]
+
+
+class PartialRatioIndex:
+    """
+    Indexed approximate-substring matcher: `fuzz.partial_ratio(skill, text)`
+    for a whole catalog without scoring every skill against the full text.
+
+    Filtering is conservative, so scores and hits are identical to the
+    brute-force loop:
+
+    1. q-gram filter. A window scoring >= threshold differs from the
+       skill by at most `d` indels, which break a bounded number of skill
+       bigram positions (see `_need`). So the window, and therefore the
+       text chunk containing it, must hold a minimum number of the
+       skill's distinct bigrams. Chunk × skill counts come from one
+       sparse product per length group.
+    2. Window scoring. Only the chunks that pass are scored with
+       rapidfuzz.
+    3. Confirmation. A chunk excerpt can over-score at its artificial
+       edges, so a skill that passes on an excerpt is re-scored once on
+       the full text before it is reported.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills: List[str] = list(skills)
+        self._lowered: List[str] = [s.lower() for s in self.skills]
+        self._lengths = np.array([len(s) for s in self._lowered], dtype=np.int64)
+
+        gram_sets = [set(_bigrams(s)) for s in self._lowered]
+        self._distinct = np.array([len(g) for g in gram_sets], dtype=np.int64)
+
+        self._gram_ids: Dict[str, int] = {}
+        for grams in gram_sets:
+            for g in grams:
+                self._gram_ids.setdefault(g, len(self._gram_ids))
+        n_grams = max(len(self._gram_ids), 1)
+
+        # One (bigram × skill) incidence matrix per length group
+        self._groups: List[Tuple[int, np.ndarray, sparse.csr_matrix]] = []
+        lower = 0
+        for length in _LENGTHS:
+            members = np.flatnonzero(
+                (self._lengths > lower) & (self._lengths <= length)
+            )
+            lower = length
+            if not len(members):
+                continue
+
+            rows, cols = [], []
+            for col, i in enumerate(members.tolist()):
+                for g in gram_sets[i]:
+                    rows.append(self._gram_ids[g])
+                    cols.append(col)
+
+            incidence = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                shape=(n_grams, len(members))
+            )
+            self._groups.append((length, members, incidence))
+
+        self._long = np.flatnonzero(self._lengths > _LENGTHS[-1])
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    # ----------------------------
+    # Bounds
+    # ----------------------------
+    def _need(self, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Minimum distinct skill bigrams a chunk must hold, as
+        (interior windows, text-edge windows).
+
+        partial_ratio scores windows of the skill's length everywhere, plus
+        shorter prefix/suffix windows at the two ends of the text:
+        score = 100 * (1 - indel / (len(skill) + len(window))).
+        - Full-length window: indel d is even, half deletions and half
+          insertions, which break at most 1.5·d skill bigram positions.
+        - Shorter edge window: at most 2·d positions.
+        """
+        slack = (1 - threshold / 100) * 2 * self._lengths + 1e-9
+        max_indel = np.floor(slack).astype(np.int64)
+        max_even = max_indel - (max_indel % 2)
+
+        interior = self._distinct - 3 * (max_even // 2)
+        edge = self._distinct - 2 * max_indel
+        return interior, edge
+
+    # ----------------------------
+    # Candidate windows
+    # ----------------------------
+    def _chunk_matrix(
+        self,
+        ids: np.ndarray,
+        n: int,
+        length: int
+    ) -> Tuple[sparse.csr_matrix, List[Tuple[int, int]]]:
+        """
+        Binary (chunk × bigram) matrix for chunks of `length + stride`
+        chars, where `ids` are the text's bigram ids (-1 = not in catalog).
+        """
+        stride = max(-(-length // 2), 1)
+        size = length + stride
+        n_chunks = max(-(-(n - size) // stride), 0) + 1
+        spans = [
+            (c * stride, min(c * stride + size, n)) for c in range(n_chunks)
+        ]
+
+        # Bigram at position p lies in chunk c iff c·stride <= p and
+        # p + 2 <= c·stride + size; that is at most size // stride chunks.
+        pos = np.flatnonzero(ids >= 0)
+        rows, cols = [], []
+        for back in range(size // stride + 1):
+            c = pos // stride - back
+            ok = (c >= 0) & (c < n_chunks) & (pos + 2 <= c * stride + size)
+            rows.append(c[ok])
+            cols.append(ids[pos[ok]])
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(n_chunks, max(len(self._gram_ids), 1))
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        return matrix, spans
+
+    def candidate_windows(
+        self,
+        text: str,
+        threshold: float = 85
+    ) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        {skill index: [(start, end), ...]} text spans that may contain a
+        window scoring >= threshold. An empty list means "score the full
+        text" (filter cannot help for that skill).
+        """
+        text_lower = normalize_text(text)
+        n = len(text_lower)
+        need, edge_need = self._need(threshold)
+
+        windows: Dict[int, List[Tuple[int, int]]] = {}
+
+        full_text = (self._lengths >= n) | (need <= 0)
+        full_text[self._long] = True
+        for i in np.flatnonzero(full_text).tolist():
+            windows[i] = []
+
+        gram_ids = self._gram_ids
+        ids = np.array(
+            [gram_ids.get(g, -1) for g in _bigrams(text_lower)],
+            dtype=np.int64
+        )
+
+        for length, members, incidence in self._groups:
+            chunks, spans = self._chunk_matrix(ids, n, length)
+            counts = (chunks @ incidence).tocoo()
+            last = len(spans) - 1
+
+            # Prefix/suffix windows only exist in the first and last chunk
+            at_edge = (counts.row == 0) | (counts.row == last)
+            required = np.where(
+                at_edge,
+                edge_need[members[counts.col]],
+                need[members[counts.col]]
+            )
+            passing = (counts.data >= required) & ~full_text[members[counts.col]]
+            rows, cols = counts.row[passing], counts.col[passing]
+
+            # Skills whose edge bound is vacuous still need the edge chunks
+            loose = np.flatnonzero(
+                (edge_need[members] <= 0) & ~full_text[members]
+            )
+            rows = np.concatenate([rows, np.zeros(len(loose), dtype=rows.dtype),
+                                   np.full(len(loose), last, dtype=rows.dtype)])
+            cols = np.concatenate([cols, loose, loose]).astype(np.int64)
+
+            order = np.lexsort((rows, cols))
+            rows, cols = rows[order], cols[order]
+            bounds = np.flatnonzero(np.diff(cols)) + 1
+
+            for skill_rows, col in zip(
+                np.split(rows, bounds),
+                cols[np.concatenate([[0], bounds])].tolist() if len(cols) else []
+            ):
+                windows[int(members[col])] = self._merge(skill_rows.tolist(), spans)
+
+        return windows
+
+    @staticmethod
+    def _merge(rows: List[int], spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Merge overlapping/touching chunk spans (chunks overlap by half).
+        """
+        merged = []
+        prev = None
+        for r in rows:
+            if prev is not None and r - prev <= 2:
+                merged[-1] = (merged[-1][0], spans[r][1])
+            elif r != prev:
+                merged.append(spans[r])
+            prev = r
+        return merged
+
+    # ----------------------------
+    # Matching
+    # ----------------------------
+    def match(self, text: str, threshold: float = 85) -> List[Dict]:
+        """
+        Return {"skill", "method", "confidence"} records in catalog order,
+        using the same exact/fuzzy rules as `extract_skills_from_text`.
+        """
+        text_lower = normalize_text(text)
+        found = []
+
+        for i, spans in sorted(self.candidate_windows(text_lower, threshold).items()):
+            skill_lower = self._lowered[i]
+
+            if skill_lower in text_lower:
+                found.append({
+                    "skill": self.skills[i],
+                    "method": "exact",
+                    "confidence": 1.0
+                })
+                continue
+
+            score = self._score(skill_lower, text_lower, spans, threshold)
+            if score >= threshold:
+                found.append({
+                    "skill": self.skills[i],
+                    "method": "fuzzy",
+                    "confidence": score / 100
+                })
+
+        return found
+
+    @staticmethod
+    def _score(
+        skill: str,
+        text: str,
+        spans: List[Tuple[int, int]],
+        threshold: float
+    ) -> float:
+        # Scoring excerpts only pays off when they cover a small part
+        if not spans or sum(e - s for s, e in spans) * 2 >= len(text):
+            return fuzz.partial_ratio(skill, text)
+
+        for start, end in spans:
+            if fuzz.partial_ratio(skill, text[start:end]) >= threshold:
+                # Confirm on the full text (excerpt edges can over-score)
+                return fuzz.partial_ratio(skill, text)
+
+        return 0.0
@@ -0,0 +1,138 @@
+# src/pipeline_stages.py
+"""
+Pure pipeline stages for the Streamlit app, memoised by input hash.
+
+Every widget interaction reruns `app.py` top to bottom; each stage here is
+keyed by hashes of its inputs, so a rerun only recomputes the stages whose
+inputs changed (e.g. a new role selection re-scores roles but does not
+re-parse or re-extract the resume). Each run records per-stage cache hits
+and timings for display.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.bias_diagnostics import BiasDiagnostics
+from src.result_cache import extract_resume_skills_cached
+from src.resume_parser import extract_text_from_pdf
+from src.role_matrix import RoleMatrix
+
+
+def stage_key(*parts) -> str:
+    """
+    Stable hash of JSON-serialisable stage inputs (bytes are hashed raw).
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            h.update(bytes(part))
+        else:
+            h.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class StageCache:
+    """
+    Bounded memo of stage results with an optional per-stage TTL.
+
+    Shared across reruns and sessions; results are keyed by content, so
+    sharing is safe. `run` appends a (stage, hit, seconds) timing for the
+    current rerun to `timings`.
+    """
+
+    def __init__(self, max_items: int = 512):
+        self.max_items = max_items
+        self._items: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        stage: str,
+        key: str,
+        compute: Callable[[], Any],
+        timings: Optional[List[Dict]] = None,
+        ttl: Optional[float] = None
+    ) -> Any:
+        started = time.perf_counter()
+        hit, value = self._get((stage, key), ttl)
+        if not hit:
+            value = compute()
+            with self._lock:
+                self._items[(stage, key)] = (time.monotonic(), value)
+                self._items.move_to_end((stage, key))
+                while len(self._items) > self.max_items:
+                    self._items.popitem(last=False)
+
+        if timings is not None:
+            timings.append({
+                "stage": stage,
+                "hit": hit,
+                "seconds": time.perf_counter() - started
+            })
+        return value
+
+    def _get(self, item: Tuple[str, str], ttl: Optional[float]) -> Tuple[bool, Any]:
+        with self._lock:
+            if item not in self._items:
+                return False, None
+            stored_at, value = self._items[item]
+            if ttl is not None and time.monotonic() - stored_at > ttl:
+                del self._items[item]
+                return False, None
+            self._items.move_to_end(item)
+            return True, value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+# -------------------------------------------------------------------
+# Stages (pure: outputs depend only on the arguments)
+# -------------------------------------------------------------------
+def parse_stage(pdf_bytes: bytes, **limits) -> str:
+    return extract_text_from_pdf(pdf_bytes, **limits)
+
+
+def extract_stage(matcher, text: str) -> List[Dict]:
+    return extract_resume_skills_cached(matcher, text)
+
+
+def score_roles_stage(
+    resume_skills: Iterable[str],
+    matrix: RoleMatrix,
+    roles: Iterable[str]
+) -> List[Dict]:
+    """
+    Coverage of each selected role, best first. `matrix` is the shared
+    encoded role matrix (e.g. `get_roles().matrix`); only the selected
+    roles are scored.
+    """
+    selected = matrix.subset(roles)
+    scores = selected.score([s.lower() for s in resume_skills])
+    return [
+        {
+            "Role": selected.roles[j],
+            "Match %": round(float(scores.coverage[0, j]) * 100, 2),
+            "Matched": int(scores.counts[0, j]),
+            "Total": int(selected.sizes[j])
+        }
+        for j in scores.ranking(0)
+    ]
+
+
+def bias_stage(
+    resume_records: List[Dict],
+    role_skills: Dict[str, List[str]],
+    match_scores: Dict[str, float]
+) -> Dict:
+    return BiasDiagnostics(
+        resume_skills=resume_records,
+        role_skills_map=role_skills,
+        match_scores=match_scores
+    ).summary()
@@ -0,0 +1,269 @@
+# src/result_cache.py
+"""
+Content-addressed result cache shared by every entry point (Streamlit
+app, MCP tools, LangChain tools, agents).
+
+Keys are SHA-256 over (kind, pipeline version, catalog version, options,
+normalised text), so a result is reused whenever the same text is seen
+again with the same catalog and pipeline, and never reused across them.
+
+Two tiers:
+- in-memory LRU (per process)
+- sqlite file on disk (shared across processes, size-bounded; least
+  recently used entries are evicted first)
+
+The disk tier is opt-in: set HIRING_CACHE_PATH (e.g.
+data/processed/result_cache.sqlite) or pass a path to `ResultCache`.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.text_document import normalize_text
+
+# Bump when extraction/scoring logic changes so old entries stop matching
+PIPELINE_VERSION = "1"
+
+# Disk tier for the process-wide cache; None (unset) keeps it in memory
+DEFAULT_CACHE_PATH: Optional[Path] = (
+    Path(os.environ["HIRING_CACHE_PATH"]) if os.environ.get("HIRING_CACHE_PATH") else None
+)
+
+
+def cache_key(kind: str, text: str, catalog_version: str = "", **options) -> str:
+    h = hashlib.sha256()
+    header = json.dumps(
+        [kind, PIPELINE_VERSION, catalog_version, options],
+        sort_keys=True,
+        default=str
+    )
+    h.update(header.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(normalize_text(text).encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier JSON value cache with hit/miss counters.
+
+    `path=None` keeps the memory tier only. Disk failures (read-only or
+    locked file) degrade to memory-only instead of raising.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_CACHE_PATH,
+        memory_items: int = 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        self.path = Path(path) if path is not None else None
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._disk_bytes = 0
+        self.stats: Dict[str, int] = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0, "evictions": 0
+        }
+
+        if self.path is not None:
+            try:
+                self._open()
+            except sqlite3.Error:
+                self._db = None
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+            " size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        db.commit()
+        self._disk_bytes = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._db = db
+
+    # ----------------------------
+    # Access
+    # ----------------------------
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._memory[key]
+
+            value = self._disk_get(key)
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["disk_hits"] += 1
+            self._remember(key, value)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.stats["sets"] += 1
+            self._remember(key, value)
+            self._disk_set(key, value)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ----------------------------
+    # Tiers
+    # ----------------------------
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # sqlite handles must not cross fork(); reopen in child processes
+        if self._pid != os.getpid() and self.path is not None:
+            self._pid = os.getpid()
+            self._memory.clear()
+            try:
+                self._open()
+            except sqlite3.Error:
+                self._db = None
+        return self._db
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if self._connection() is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def _disk_set(self, key: str, value: Any) -> None:
+        if self._connection() is None:
+            return
+        blob = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        if len(blob) > self.max_disk_bytes:
+            return
+        try:
+            old = self._db.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time())
+            )
+            self._disk_bytes += len(blob) - (old[0] if old else 0)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+            self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self) -> None:
+        """
+        Drop least recently used entries down to 90% of the size bound.
+        """
+        target = int(self.max_disk_bytes * 0.9)
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ).fetchall():
+            if self._disk_bytes <= target:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._disk_bytes -= size
+            self.stats["evictions"] += 1
+
+
+_CACHE: Optional[ResultCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    """
+    The process-wide cache used by all entry points.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = ResultCache()
+        return _CACHE
+
+
+# -------------------------------------------------------------------
+# Cached pipeline steps
+# -------------------------------------------------------------------
+def extract_resume_skills_cached(
+    matcher,
+    text: str,
+    cache: Optional[ResultCache] = None
+) -> List[Dict]:
+    """
+    `matcher.extract_resume_skills(text)` through the cache.
+
+    Keys use the normalised (lowercased) text; evidence snippets that
+    point into the text are re-sliced from the caller's original text,
+    so a hit differing only in case still reports its own snippets.
+    """
+    cache = cache or get_cache()
+    key = cache_key(
+        "extract",
+        text,
+        matcher.catalog_version,
+        semantic=matcher.indexer is not None,
+        mode=matcher.semantic_mode,
+        aggregate=matcher.semantic_aggregate,
+    )
+
+    records = cache.get(key)
+    if records is None:
+        records = matcher.extract_resume_skills(text)
+        cache.set(key, records)
+
+    # Callers get their own copies; cached values stay untouched
+    records = [dict(r) for r in records]
+    for r in records:
+        if r.get("start") is not None and r.get("method") != "fuzzy":
+            r["evidence_snippet"] = text[r["start"]:r["end"]]
+    return records
@@ -1,10 +1,165 @@
 # src/resume_parser.py
 
-import fitz  # PyMuPDF
-
-def extract_text_from_pdf(pdf_path: str) -> str:
-    doc = fitz.open(pdf_path)
-    text = []
-    for page in doc:
-        text.append(page.get_text())
-    return "\n".join(text)
+import multiprocessing as mp
+import os
+import time
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from src.lazy import lazy_import
+
+fitz = lazy_import("fitz")  # PyMuPDF, loaded on first open
+
+# A path, raw PDF bytes, or a binary file-like object (e.g. a Streamlit upload)
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# Below this many pages a process pool costs more than it saves
+PARALLEL_MIN_PAGES = 16
+
+
+class PdfLimitError(ValueError):
+    """
+    The PDF exceeds a configured size, page or time limit.
+    """
+
+
+def _load(source: PdfSource) -> Union[str, bytes]:
+    """
+    Normalise a source to a path (str) or the PDF bytes.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    if hasattr(source, "read"):
+        return source.read()
+    return os.fspath(source)
+
+
+def open_pdf(source: PdfSource) -> "fitz.Document":
+    """
+    Open a PDF from a path, or from memory without touching disk.
+    """
+    source = _load(source)
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+# Per-worker document for the page-parallel path (set by the initializer,
+# so the PDF bytes are sent once per worker rather than once per task)
+_WORKER_DOC: "Optional[fitz.Document]" = None
+
+
+def _init_page_worker(source: Union[str, bytes]) -> None:
+    global _WORKER_DOC
+    _WORKER_DOC = open_pdf(source)
+
+
+def _page_range_text(start: int, stop: int) -> List[str]:
+    return [_WORKER_DOC[i].get_text() for i in range(start, stop)]
+
+
+def iter_pdf_pages(
+    pdf: PdfSource,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    workers: int = 1,
+    strict: bool = False
+) -> Iterator[str]:
+    """
+    Yield page text one page at a time.
+
+    - max_bytes: refuse files larger than this (PdfLimitError)
+    - max_pages: stop after this many pages
+    - time_budget: stop once this many seconds have been spent
+    - workers: extract page ranges on a process pool for documents of at
+      least PARALLEL_MIN_PAGES pages (pages are still yielded in order)
+    - strict: raise PdfLimitError instead of truncating at max_pages /
+      time_budget
+    """
+    source = _load(pdf)
+    size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+    if max_bytes is not None and size > max_bytes:
+        raise PdfLimitError(f"PDF is {size} bytes (limit {max_bytes})")
+
+    started = time.monotonic()
+
+    def out_of_time() -> bool:
+        if time_budget is None or time.monotonic() - started <= time_budget:
+            return False
+        if strict:
+            raise PdfLimitError(f"PDF extraction exceeded {time_budget}s")
+        return True
+
+    with open_pdf(source) as doc:
+        n_pages = doc.page_count
+        if max_pages is not None and n_pages > max_pages:
+            if strict:
+                raise PdfLimitError(f"PDF has {n_pages} pages (limit {max_pages})")
+            n_pages = max_pages
+
+        if workers <= 1 or n_pages < PARALLEL_MIN_PAGES:
+            for i in range(n_pages):
+                if out_of_time():
+                    return
+                yield doc[i].get_text()
+            return
+
+    deadline = started + time_budget if time_budget is not None else None
+    try:
+        for pages in _parallel_ranges(source, n_pages, workers, deadline):
+            for text in pages:
+                if out_of_time():
+                    return
+                yield text
+    except PdfLimitError:
+        # A page range was still running when the budget ran out
+        if strict:
+            raise PdfLimitError(f"PDF extraction exceeded {time_budget}s") from None
+
+
+def _parallel_ranges(
+    source: Union[str, bytes],
+    n_pages: int,
+    workers: int,
+    deadline: Optional[float] = None
+) -> Iterator[List[str]]:
+    """
+    Page-range chunks extracted on a process pool, yielded in page order.
+    Each worker opens the document once; the pool is torn down as soon as
+    the consumer stops. Workers are spawned, not forked, since MuPDF and
+    the host app (Streamlit) run threads. Waiting for a chunk past
+    `deadline` (time.monotonic()) raises PdfLimitError.
+    """
+    step = max(-(-n_pages // (workers * 4)), 1)
+    ranges: List[Tuple[int, int]] = [
+        (start, min(start + step, n_pages)) for start in range(0, n_pages, step)
+    ]
+    pool = mp.get_context("spawn").Pool(
+        workers, initializer=_init_page_worker, initargs=(source,)
+    )
+    try:
+        results = [
+            pool.apply_async(_page_range_text, (start, stop))
+            for start, stop in ranges
+        ]
+        for result in results:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                pages = result.get(timeout)
+            except mp.TimeoutError:
+                raise PdfLimitError("PDF extraction exceeded its time budget")
+            yield pages
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def extract_text_from_pdf(pdf: PdfSource, **limits) -> str:
+    """
+    Full document text (pages joined by newlines). Accepts the same
+    limits as `iter_pdf_pages`.
+    """
+    return "\n".join(iter_pdf_pages(pdf, **limits))
@@ -0,0 +1,177 @@
+# src/role_matrix.py
+"""
+Role coverage as sparse linear algebra.
+
+Roles × skills is encoded once as a binary CSR matrix R. A batch of N
+resumes is encoded as a binary N × skills matrix X; the matched-skill
+counts for every (resume, role) pair are the single product X @ R.T, and
+coverage is that divided by the role sizes.
+
+Skill names are compared exactly as given; callers normalise (lowercase
+etc.) before encoding. The skill vocabulary is sorted, so matched/missing
+index arrays map to alphabetically sorted skill names.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.lazy import lazy_import
+
+sparse = lazy_import("scipy.sparse")
+
+
+class RoleScores:
+    """
+    Scores of N resumes against every role of a RoleMatrix.
+
+    - counts:   N × roles matched-skill counts
+    - coverage: N × roles fraction of each role's skills present
+    """
+
+    def __init__(
+        self,
+        matrix: "RoleMatrix",
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        counts: np.ndarray
+    ):
+        self.matrix = matrix
+        self.indptr = indptr
+        self.indices = indices
+        self.counts = counts
+        self.coverage = counts / np.maximum(matrix.sizes, 1)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def _has(self, i: int, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        role_cols = self.matrix.role_columns[j]
+        have = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        return role_cols, np.isin(role_cols, have, assume_unique=True)
+
+    def matched(self, i: int, j: int) -> np.ndarray:
+        """Skill indices of role j present in resume i."""
+        role_cols, hit = self._has(i, j)
+        return role_cols[hit]
+
+    def missing(self, i: int, j: int) -> np.ndarray:
+        """Skill indices of role j absent from resume i."""
+        role_cols, hit = self._has(i, j)
+        return role_cols[~hit]
+
+    def report(self, i: int, j: int) -> Dict:
+        """
+        Plain {"role", "score", "coverage", "matched_skills",
+        "missing_skills"} record for resume i against role j.
+        """
+        role_cols, hit = self._has(i, j)
+        coverage = float(self.coverage[i, j])
+        names = self.matrix.skills
+        return {
+            "role": self.matrix.roles[j],
+            "score": round(coverage * 100, 2),
+            "coverage": round(coverage, 3),
+            "matched_skills": [names[c] for c in role_cols[hit]],
+            "missing_skills": [names[c] for c in role_cols[~hit]],
+        }
+
+    def reports(self, i: int) -> List[Dict]:
+        """One report per role for resume i, in role order."""
+        return [self.report(i, j) for j in range(len(self.matrix.roles))]
+
+    def ranking(self, i: int) -> List[int]:
+        """Role indices for resume i, best coverage first (stable)."""
+        return np.argsort(-self.coverage[i], kind="stable").tolist()
+
+
+class RoleMatrix:
+    """
+    Sparse roles × skills engine: build once, score many resumes.
+
+    `roles` is a {role: skills} mapping or a sequence of (role, skills)
+    pairs (pairs may repeat a role name; rows keep their order).
+    """
+
+    def __init__(
+        self,
+        roles: Union[Dict[str, Iterable[str]], Iterable[Tuple[str, Iterable[str]]]]
+    ):
+        pairs = roles.items() if isinstance(roles, dict) else roles
+        role_sets = [(role, set(skills)) for role, skills in pairs]
+
+        self.roles: List[str] = [role for role, _ in role_sets]
+        self.skills: List[str] = sorted(set().union(*(s for _, s in role_sets)))
+        self.vocab: Dict[str, int] = {s: j for j, s in enumerate(self.skills)}
+        self.index: Dict[str, int] = {}
+        for j, role in enumerate(self.roles):
+            self.index.setdefault(role, j)
+
+        self.matrix = self.encode([skills for _, skills in role_sets])
+        self.sizes = np.diff(self.matrix.indptr)
+        # Role of each stored entry (for the single-resume fast path)
+        self._entry_roles = np.repeat(np.arange(len(self.roles)), self.sizes)
+        self.role_columns: List[np.ndarray] = [
+            self.matrix.indices[self.matrix.indptr[j]:self.matrix.indptr[j + 1]]
+            for j in range(len(self.roles))
+        ]
+
+    def _rows(self, skill_sets: Sequence[Iterable[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        indptr = [0]
+        indices: List[int] = []
+        vocab = self.vocab
+        for skills in skill_sets:
+            indices.extend(sorted({vocab[s] for s in skills if s in vocab}))
+            indptr.append(len(indices))
+        return np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int32)
+
+    def encode(self, skill_sets: Sequence[Iterable[str]]) -> "sparse.csr_matrix":
+        """
+        Binary rows over the role vocabulary (skills no role asks for are
+        dropped; they cannot change coverage).
+        """
+        indptr, indices = self._rows(skill_sets)
+        return sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(indptr) - 1, len(self.skills))
+        )
+
+    def score_batch(self, resume_skill_sets: Sequence[Iterable[str]]) -> RoleScores:
+        """Score N resumes against all roles in one sparse product."""
+        resumes = self.encode(resume_skill_sets)
+        counts = np.asarray((resumes @ self.matrix.T).todense())
+        return RoleScores(self, resumes.indptr, resumes.indices, counts)
+
+    def score(self, resume_skills: Iterable[str]) -> RoleScores:
+        """
+        Score one resume (row 0 of the result). Same result as a batch of
+        one, without building sparse matrices.
+        """
+        indptr, indices = self._rows([resume_skills])
+        have = np.zeros(len(self.skills), dtype=bool)
+        have[indices] = True
+        counts = np.bincount(
+            self._entry_roles[have[self.matrix.indices]], minlength=len(self.roles)
+        )
+        return RoleScores(self, indptr, indices, counts[np.newaxis, :])
+
+    def subset(self, roles: Iterable[str]) -> "RoleMatrix":
+        """A matrix over the given roles only (in the given order)."""
+        return RoleMatrix([
+            (role, [self.skills[c] for c in self.role_columns[self.index[role]]])
+            for role in roles
+        ])
+
+
+@lru_cache(maxsize=256)
+def _single_role(role_skills: Tuple[str, ...]) -> RoleMatrix:
+    return RoleMatrix([("role", role_skills)])
+
+
+def match_role(resume_skills: Iterable[str], role_skills: Iterable[str]) -> Dict:
+    """
+    Report for one resume against one ad-hoc skill list; role matrices for
+    repeated skill lists are reused.
+    """
+    return _single_role(tuple(sorted(set(role_skills)))).score(resume_skills).report(0, 0)
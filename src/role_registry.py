@@ -0,0 +1,250 @@
+# src/role_registry.py
+"""
+Role definitions loaded from a file instead of code.
+
+A role file maps role -> required skills, as YAML/JSON:
+
+    Data Scientist: [python, sql, machine learning]
+    ML Engineer:
+      skills: [python, mlops, docker, kubernetes]
+      aliases: [Machine Learning Engineer, MLE]
+
+or as parquet with columns `role`, `skills` (list) and optional `aliases`
+(list). Skills are only lowercased and whitespace-collapsed, keeping the
+catalog spelling ("ci/cd"), so they compare directly with lowercased
+extracted skills.
+
+Titles resolve through a key index: lowercase, punctuation stripped,
+common abbreviations expanded and seniority words dropped, so
+"Sr. ML Eng" and "ml engineer" hit the same dict entry. Keys that miss
+fall back to a fuzzy match among roles sharing a title word.
+
+The registry re-reads the file when it changes (checked at most every
+`check_interval` seconds); a broken edit keeps the previous roles.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import yaml
+from rapidfuzz import fuzz
+
+from src.role_matrix import RoleMatrix
+
+DEFAULT_ROLES = Path(os.environ.get("HIRING_ROLES_PATH", "config/roles.yaml"))
+
+# Title words dropped before lookup (seniority / level, not the role)
+_SENIORITY = {
+    "sr", "senior", "jr", "junior", "lead", "principal", "staff", "chief",
+    "head", "associate", "intern", "mid", "level", "i", "ii", "iii", "iv"
+}
+
+# Title word abbreviations -> full word
+_TITLE_WORDS = {
+    "eng": "engineer", "engr": "engineer", "engineering": "engineer",
+    "dev": "developer", "sci": "scientist", "science": "scientist",
+    "mgr": "manager", "analytics": "analyst", "ops": "operations",
+    "swe": "software engineer", "sde": "software engineer",
+    "ds": "data scientist", "de": "data engineer", "da": "data analyst",
+    "mle": "ml engineer",
+}
+
+# Multi-word phrases folded to the short form used in role names
+_TITLE_PHRASES = [
+    ("machine learning", "ml"),
+    ("artificial intelligence", "ai"),
+]
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9/+#]+")
+
+# Minimum rapidfuzz token_sort_ratio for the fuzzy fallback
+FUZZY_CUTOFF = 85
+
+
+def title_key(title: str) -> str:
+    """
+    Canonical lookup key for a role title.
+    """
+    words = []
+    for word in _NON_WORD_RE.sub(" ", str(title).lower()).split():
+        words.extend(_TITLE_WORDS.get(word, word).split())
+    text = " ".join(w for w in words if w not in _SENIORITY)
+    for phrase, short in _TITLE_PHRASES:
+        text = text.replace(phrase, short)
+    return text
+
+
+def load_role_file(path) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+    """
+    ({role: sorted lowercased skills}, {role: aliases}) from YAML, JSON or
+    parquet.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pandas as pd
+        df = pd.read_parquet(path)
+        raw = {
+            str(row["role"]): {
+                "skills": list(row["skills"]),
+                "aliases": list(row["aliases"]) if "aliases" in df and row["aliases"] is not None else [],
+            }
+            for _, row in df.iterrows()
+        }
+    else:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+
+    if not isinstance(raw, dict):
+        raise ValueError(f"Role file must map role -> skills: {path}")
+
+    roles, aliases = {}, {}
+    for role, spec in raw.items():
+        if isinstance(spec, dict):
+            skills, role_aliases = spec.get("skills") or [], spec.get("aliases") or []
+        else:
+            skills, role_aliases = spec or [], []
+        roles[str(role)] = sorted({
+            " ".join(str(s).lower().split()) for s in skills if str(s).strip()
+        })
+        aliases[str(role)] = [str(a) for a in role_aliases]
+    return roles, aliases
+
+
+class RoleSet:
+    """
+    One immutable load of a role file, with its title index.
+    """
+
+    def __init__(
+        self,
+        roles: Dict[str, List[str]],
+        aliases: Optional[Dict[str, List[str]]] = None,
+        version: str = ""
+    ):
+        self.roles = roles
+        self.version = version
+
+        self._keys: Dict[str, str] = {}
+        for role in roles:
+            self._keys.setdefault(title_key(role), role)
+        for role, role_aliases in (aliases or {}).items():
+            for alias in role_aliases:
+                self._keys.setdefault(title_key(alias), role)
+
+        # Title word -> keys containing it (candidates for the fuzzy fallback)
+        self._words: Dict[str, Set[str]] = {}
+        for key in self._keys:
+            for word in key.split():
+                self._words.setdefault(word, set()).add(key)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def __contains__(self, title: str) -> bool:
+        return self.resolve(title) is not None
+
+    def resolve(self, title: str) -> Optional[str]:
+        """
+        Canonical role name for a title, or None.
+        """
+        if title in self.roles:
+            return title
+        key = title_key(title)
+        role = self._keys.get(key)
+        if role is not None or not key:
+            return role
+
+        candidates = set().union(*(self._words.get(w, ()) for w in key.split()))
+        best, best_score = None, FUZZY_CUTOFF
+        for candidate in sorted(candidates):
+            score = fuzz.token_sort_ratio(key, candidate)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return self._keys[best] if best is not None else None
+
+    def skills(self, title: str) -> Optional[List[str]]:
+        role = self.resolve(title)
+        return self.roles[role] if role is not None else None
+
+    @cached_property
+    def matrix(self) -> RoleMatrix:
+        # Encoded on first use, then shared until the next reload
+        return RoleMatrix(self.roles)
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return 0, 0
+
+
+class RoleRegistry:
+    """
+    Keeps the current `RoleSet` for a role file, reloading it when the file
+    changes.
+    """
+
+    def __init__(self, path=DEFAULT_ROLES, check_interval: float = 2.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+
+        self._roles: Optional[RoleSet] = None
+        self._file = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self) -> RoleSet:
+        file_key = _stat_key(self.path)
+        roles, aliases = load_role_file(self.path)
+        self._file = file_key
+        return RoleSet(roles, aliases, version=f"{file_key[0]}:{file_key[1]}")
+
+    def get(self) -> RoleSet:
+        roles = self._roles
+        if roles is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return roles
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if self._roles is None:
+                self._roles = self._load()
+            elif _stat_key(self.path) != self._file:
+                try:
+                    self._roles = self._load()
+                except Exception:
+                    # Keep serving the previous roles until the file is fixed
+                    self._file = _stat_key(self.path)
+            return self._roles
+
+    def refresh(self) -> RoleSet:
+        """
+        Reload synchronously.
+        """
+        with self._lock:
+            self._roles = self._load()
+            self._checked_at = time.monotonic()
+            return self._roles
+
+
+_REGISTRY: Optional[RoleRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_role_registry() -> RoleRegistry:
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = RoleRegistry()
+        return _REGISTRY
+
+
+def get_roles() -> RoleSet:
+    return get_role_registry().get()
@@ -0,0 +1,213 @@
+# src/shortlist.py
+"""
+Batch screening of uploaded resume PDFs into a ranked shortlist.
+
+Uploads (PDFs, or zips of PDFs) are parsed and scored on a background
+thread pool; finished rows are collected as they arrive, so a UI can poll
+`ShortlistJob.progress` / `ShortlistJob.table()` and render partial
+results while the rest of the batch is still running.
+"""
+
+import io
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from src.bias_diagnostics import BiasDiagnostics
+from src.result_cache import extract_resume_skills_cached
+from src.resume_parser import extract_text_from_pdf
+from src.role_matrix import RoleMatrix
+
+# Zip guards: member count and uncompressed size per member
+MAX_ZIP_MEMBERS = 500
+MAX_MEMBER_BYTES = 20 * 1024 * 1024
+
+# Bias flag thresholds over the BiasDiagnostics signals (indicative only)
+FEW_SKILLS = 5
+LOW_SKILL_DIVERSITY = 0.5
+ROLE_SIZE_CORRELATION = 0.8
+
+
+def expand_uploads(uploads: Iterable[Tuple[str, bytes]]) -> Iterator[Tuple[str, bytes]]:
+    """
+    (name, pdf bytes) for every PDF in `uploads`; zip archives are opened
+    in memory and their PDF members yielded as "archive.zip/member.pdf".
+    """
+    for name, data in uploads:
+        if not name.lower().endswith(".zip"):
+            yield name, data
+            continue
+
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            members = [
+                m for m in archive.infolist()
+                if not m.is_dir()
+                and m.filename.lower().endswith(".pdf")
+                and not PurePosixPath(m.filename).name.startswith(".")
+                and "__MACOSX" not in m.filename
+            ]
+            if len(members) > MAX_ZIP_MEMBERS:
+                raise ValueError(f"{name}: {len(members)} PDFs (limit {MAX_ZIP_MEMBERS})")
+            for member in members:
+                if member.file_size > MAX_MEMBER_BYTES:
+                    raise ValueError(f"{name}/{member.filename}: {member.file_size} bytes (limit {MAX_MEMBER_BYTES})")
+                yield f"{name}/{member.filename}", archive.read(member)
+
+
+def bias_flags(summary: Dict) -> List[str]:
+    """
+    Short flags from a `BiasDiagnostics.summary()`, so the shortlist
+    reports the same signals as the single-resume view.
+    """
+    flags = []
+    if summary["skill_count_bias"]["skill_count"] < FEW_SKILLS:
+        flags.append("few skills")
+    if summary["skill_diversity_bias"]["skill_diversity_ratio"] < LOW_SKILL_DIVERSITY:
+        flags.append("low skill diversity")
+    role_advantage = summary["role_advantage_bias"] or {}
+    corr = role_advantage.get("correlation_required_skills_vs_score")
+    if corr is not None and abs(corr) >= ROLE_SIZE_CORRELATION:
+        flags.append("role-size skew")
+    return flags
+
+
+def screen_resume(
+    name: str,
+    pdf_bytes: bytes,
+    matcher,
+    matrix: RoleMatrix,
+    pdf_limits: Optional[Dict] = None,
+    min_confidence: float = 0.15
+) -> Dict:
+    """
+    One shortlist row: score per role, best role, its gaps and bias flags.
+    """
+    text = extract_text_from_pdf(pdf_bytes, **(pdf_limits or {}))
+    records = extract_resume_skills_cached(matcher, text) if text.strip() else []
+    skills = [r["skill"].lower() for r in records if r["confidence"] > min_confidence]
+
+    scores = matrix.score(skills)
+    best = scores.ranking(0)[0]
+    best_report = scores.report(0, best)
+
+    row = {"Candidate": name}
+    for j, role in enumerate(matrix.roles):
+        row[f"{role} %"] = round(float(scores.coverage[0, j]) * 100, 2)
+    bias = BiasDiagnostics(
+        resume_skills=records,
+        role_skills_map={
+            role: [matrix.skills[c] for c in matrix.role_columns[j]]
+            for j, role in enumerate(matrix.roles)
+        },
+        match_scores={
+            role: row[f"{role} %"] for role in matrix.roles
+        }
+    ).summary()
+
+    row.update({
+        "Best Role": best_report["role"],
+        "Best %": best_report["score"],
+        "Gaps": ", ".join(best_report["missing_skills"]),
+        "Skills": len(set(skills)),
+        "Bias Flags": ", ".join(bias_flags(bias)),
+    })
+    return row
+
+
+class ShortlistJob:
+    """
+    Screens a batch of uploads on a thread pool.
+
+    Thread-safe to poll from another thread: `progress`, `rows`, `errors`
+    and `table()` reflect the results finished so far. Text extraction
+    and PDF parsing are largely native code; the pool keeps the caller
+    free rather than parallelising pure-Python matching.
+    """
+
+    def __init__(
+        self,
+        uploads: Iterable[Tuple[str, bytes]],
+        roles: Dict[str, List[str]],
+        matcher,
+        workers: int = 4,
+        pdf_limits: Optional[Dict] = None,
+        min_confidence: float = 0.15
+    ):
+        self.files = list(expand_uploads(uploads))
+        self.matrix = RoleMatrix(roles)
+        self.matcher = matcher
+        self.pdf_limits = pdf_limits
+        self.min_confidence = min_confidence
+
+        self.rows: List[Dict] = []
+        self.errors: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="shortlist"
+        )
+
+    @property
+    def total(self) -> int:
+        return len(self.files)
+
+    @property
+    def completed(self) -> int:
+        with self._lock:
+            return len(self.rows) + len(self.errors)
+
+    @property
+    def progress(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return all(f.done() for f in self._futures)
+
+    def start(self) -> "ShortlistJob":
+        for name, data in self.files:
+            self._futures.append(self._executor.submit(self._screen, name, data))
+        self._executor.shutdown(wait=False)
+        return self
+
+    def _screen(self, name: str, data: bytes) -> None:
+        # Results are recorded before the future resolves, so `done`
+        # implies every finished row is already visible
+        try:
+            row = screen_resume(
+                name, data, self.matcher, self.matrix,
+                self.pdf_limits, self.min_confidence
+            )
+        except Exception as e:
+            with self._lock:
+                self.errors.append((name, str(e)))
+            return
+        with self._lock:
+            self.rows.append(row)
+
+    def cancel(self) -> None:
+        for future in self._futures:
+            future.cancel()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        for future in list(self._futures):
+            try:
+                future.exception(timeout)
+            except Exception:
+                pass
+
+    def table(self) -> pd.DataFrame:
+        """
+        Finished rows, best score first.
+        """
+        with self._lock:
+            rows = list(self.rows)
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).sort_values(
+            ["Best %", "Candidate"], ascending=[False, True], ignore_index=True
+        )
@@ -0,0 +1,146 @@
+# src/skill_automaton.py
+
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from src.text_document import TokenizedDocument
+
+
+class SkillAutomaton:
+    """
+    Word-level multi-pattern automaton over a skills catalog.
+
+    The catalog is compiled once into a word trie stored as flat numpy
+    arrays (sorted vocabulary, sorted transition keys, terminal table), so
+    it can be saved into and mmapped from a catalog artifact. `find` walks
+    every token start position at once, one vectorised step per trie
+    depth, and reports each catalog skill with character offsets.
+    """
+
+    ARRAY_NAMES = ("skills", "vocab", "keys", "next", "terminal")
+
+    def __init__(self, skills: Iterable[str]):
+        skills = [s for s in dict.fromkeys(skills) if s.split()]
+        vocab = sorted({w for s in skills for w in s.split()})
+        word_id = {w: i for i, w in enumerate(vocab)}
+        n_vocab = max(len(vocab), 1)
+
+        goto: Dict[Tuple[int, int], int] = {}
+        terminal = [-1]
+
+        for skill_id, skill in enumerate(skills):
+            state = 0
+            for word in skill.split():
+                key = (state, word_id[word])
+                if key not in goto:
+                    goto[key] = len(terminal)
+                    terminal.append(-1)
+                state = goto[key]
+            terminal[state] = skill_id
+
+        keys = np.array(
+            [s * n_vocab + w for s, w in goto],
+            dtype=np.int64
+        )
+        nxt = np.array(list(goto.values()), dtype=np.int32)
+        order = np.argsort(keys)
+
+        self._set_arrays({
+            "skills": np.array(skills, dtype=str),
+            "vocab": np.array(vocab, dtype=str),
+            "keys": keys[order],
+            "next": nxt[order],
+            "terminal": np.array(terminal, dtype=np.int32),
+        })
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SkillAutomaton":
+        """
+        Rebuild an automaton from `to_arrays` output without recompiling.
+        """
+        self = cls.__new__(cls)
+        self._set_arrays(arrays)
+        return self
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, f"_{name}") for name in self.ARRAY_NAMES}
+
+    def _set_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        for name in self.ARRAY_NAMES:
+            setattr(self, f"_{name}", arrays[name])
+        self._n_vocab = max(len(self._vocab), 1)
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    @property
+    def skills(self) -> List[str]:
+        return self._skills.tolist()
+
+    # ----------------------------
+    # Matching
+    # ----------------------------
+    def _word_ids(self, words: List[str]) -> np.ndarray:
+        words = np.array(words, dtype=str)
+        ids = np.searchsorted(self._vocab, words)
+        ids[ids == len(self._vocab)] = 0
+        return np.where(self._vocab[ids] == words, ids, -1)
+
+    def find(self, doc: Union[str, TokenizedDocument]) -> List[Dict]:
+        """
+        Return the first occurrence of every catalog skill in `doc`.
+
+        Each hit is {"skill", "start", "end"} with offsets into the text.
+        """
+        doc = TokenizedDocument.ensure(doc)
+        if not len(doc) or not len(self._keys):
+            return []
+
+        ids = self._word_ids(doc.tokens)
+        starts, ends, joins = doc.starts, doc.ends, doc.joins
+        n = len(doc)
+
+        # One walker per token start; drop walkers as soon as they fall off
+        origin = np.flatnonzero(ids >= 0)
+        state = np.zeros(len(origin), dtype=np.int64)
+        hits = []
+        depth = 0
+
+        while len(origin):
+            pos = origin + depth
+            alive = pos < n
+            if depth:
+                alive[alive] &= joins[pos[alive]]
+            origin, state, pos = origin[alive], state[alive], pos[alive]
+
+            word = ids[pos]
+            alive = word >= 0
+            origin, state, pos, word = origin[alive], state[alive], pos[alive], word[alive]
+
+            key = state * self._n_vocab + word
+            j = np.searchsorted(self._keys, key)
+            j[j == len(self._keys)] = 0
+            alive = self._keys[j] == key
+            origin, pos = origin[alive], pos[alive]
+            state = self._next[j[alive]].astype(np.int64)
+
+            skill_ids = self._terminal[state]
+            done = skill_ids >= 0
+            hits.extend(zip(
+                starts[origin[done]].tolist(),
+                ends[pos[done]].tolist(),
+                skill_ids[done].tolist(),
+            ))
+            depth += 1
+
+        found: Dict[int, Dict] = {}
+        for start, end, skill_id in sorted(hits):
+            if skill_id not in found:
+                found[skill_id] = {
+                    "skill": str(self._skills[skill_id]),
+                    "start": start,
+                    "end": end,
+                }
+
+        return sorted(found.values(), key=lambda h: (h["start"], h["end"]))
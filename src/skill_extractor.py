@@ -1,38 +1,44 @@
 # src/skill_extractor.py
 
-from rapidfuzz import fuzz
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Sequence, Tuple, Union
+
+from src.partial_ratio_index import PartialRatioIndex
+from src.text_document import TokenizedDocument, normalize_text
+
+
+@lru_cache(maxsize=4)
+def _cached_index(skills: Tuple[str, ...]) -> PartialRatioIndex:
+    return PartialRatioIndex(skills)
+
+
+def get_partial_ratio_index(skills_catalog: Sequence[str]) -> PartialRatioIndex:
+    """
+    Build (or reuse) the approximate-substring index for a catalog.
+    """
+    if isinstance(skills_catalog, PartialRatioIndex):
+        return skills_catalog
+    return _cached_index(tuple(skills_catalog))
+
 
 def extract_skills_from_text(
-    text: str,
-    skills_catalog: List[str],
+    text: Union[str, TokenizedDocument],
+    skills_catalog: Union[List[str], PartialRatioIndex],
     threshold: int = 85
 ) -> List[Dict]:
     """
     Hybrid extraction:
     - exact match
-    - fuzzy match
+    - fuzzy match (partial_ratio >= threshold)
+
+    Candidate skills and text windows are selected with a q-gram index,
+    so only plausible windows are scored; results are the same as
+    scoring every skill against the full text.
     """
-    found = []
-
-    text_lower = text.lower()
-
-    for skill in skills_catalog:
-        skill_lower = skill.lower()
-
-        if skill_lower in text_lower:
-            found.append({
-                "skill": skill,
-                "method": "exact",
-                "confidence": 1.0
-            })
-        else:
-            score = fuzz.partial_ratio(skill_lower, text_lower)
-            if score >= threshold:
-                found.append({
-                    "skill": skill,
-                    "method": "fuzzy",
-                    "confidence": score / 100
-                })
-
-    return found
+    if isinstance(text, TokenizedDocument):
+        text_lower = text.normalized
+    else:
+        text_lower = normalize_text(text)
+
+    index = get_partial_ratio_index(skills_catalog)
+    return index.match(text_lower, threshold=threshold)
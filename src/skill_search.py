@@ -0,0 +1,140 @@
+# src/skill_search.py
+
+import bisect
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# Characters after which a substring hit counts as a word-start hit
+_WORD_BREAKS = set(" -/_.&+(")
+
+MATCH_KINDS = ("exact", "prefix", "word", "substring")
+
+
+def _grams(s: str, n: int) -> List[str]:
+    return [s[i:i + n] for i in range(len(s) - n + 1)]
+
+
+class SkillSearchIndex:
+    """
+    In-memory literal substring / prefix search over a skills catalog.
+
+    Skills are ranked once by (length, name) and every posting list holds
+    ranks in ascending order, so the best hits of each match kind come
+    first and a query stops as soon as `top_k` results are certain.
+
+    Ranking: exact > prefix > word-start > other substring, then shorter
+    skill, then alphabetical. Queries are plain text (no regex).
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        unique = {str(s).strip().lower() for s in skills if str(s).strip()}
+        self.skills: List[str] = sorted(unique, key=lambda s: (len(s), s))
+        self._rank: Dict[str, int] = {s: i for i, s in enumerate(self.skills)}
+
+        # Prefix search: ranks in lexicographic order
+        lex = sorted(range(len(self.skills)), key=self.skills.__getitem__)
+        self._lex_keys = [self.skills[i] for i in lex]
+        self._lex_ranks = np.array(lex, dtype=np.int32)
+
+        # 1-3 character grams: all positions, and word-start positions only
+        grams: Dict[str, List[int]] = {}
+        word_grams: Dict[str, List[int]] = {}
+        for rank, s in enumerate(self.skills):
+            seen, seen_word = set(), set()
+            for n in (1, 2, 3):
+                for i, g in enumerate(_grams(s, n)):
+                    if g not in seen:
+                        seen.add(g)
+                        grams.setdefault(g, []).append(rank)
+                    if (i == 0 or s[i - 1] in _WORD_BREAKS) and g not in seen_word:
+                        seen_word.add(g)
+                        word_grams.setdefault(g, []).append(rank)
+
+        self._postings = {g: np.array(r, dtype=np.int32) for g, r in grams.items()}
+        self._word_postings = {g: np.array(r, dtype=np.int32) for g, r in word_grams.items()}
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    # ----------------------------
+    # Candidates
+    # ----------------------------
+    def _prefix_ranks(self, query: str) -> np.ndarray:
+        lo = bisect.bisect_left(self._lex_keys, query)
+        hi = bisect.bisect_left(self._lex_keys, query + "\U0010ffff", lo)
+        return np.sort(self._lex_ranks[lo:hi])
+
+    def _candidates(self, query: str, word_start: bool) -> np.ndarray:
+        """
+        Ranks that may contain `query` (exact for queries up to 3 chars).
+        """
+        head = query[:3]
+        first = (self._word_postings if word_start else self._postings).get(head)
+        if first is None:
+            return np.empty(0, dtype=np.int32)
+
+        lists = [first] + [
+            self._postings.get(g, np.empty(0, dtype=np.int32))
+            for g in set(_grams(query, 3)) - {head}
+        ]
+        lists.sort(key=len)
+        ranks = lists[0]
+        for other in lists[1:]:
+            if not len(ranks):
+                break
+            ranks = ranks[np.isin(ranks, other, assume_unique=True)]
+        return ranks
+
+    def _is_word_hit(self, skill: str, query: str) -> bool:
+        start = skill.find(query)
+        while start > 0:
+            if skill[start - 1] in _WORD_BREAKS:
+                return True
+            start = skill.find(query, start + 1)
+        return start == 0
+
+    # ----------------------------
+    # Search
+    # ----------------------------
+    def search(self, query: str, top_k: int = 5) -> List[Dict]:
+        """
+        Return up to `top_k` {"skill", "match"} hits, best first.
+        """
+        query = query.strip().lower()
+        if not query or top_k <= 0:
+            return []
+
+        results: List[Dict] = []
+        taken = set()
+
+        def take(ranks, kind, verify=None) -> bool:
+            # Walk the rank-ordered list in small blocks; stop at top_k
+            for block in range(0, len(ranks), 64):
+                for r in ranks[block:block + 64].tolist():
+                    if r in taken:
+                        continue
+                    skill = self.skills[r]
+                    if verify is not None and not verify(skill):
+                        continue
+                    taken.add(r)
+                    results.append({"skill": skill, "match": kind})
+                    if len(results) >= top_k:
+                        return True
+            return False
+
+        exact = self._rank.get(query)
+        if exact is not None and take(np.array([exact]), "exact"):
+            return results
+
+        if take(self._prefix_ranks(query), "prefix"):
+            return results
+
+        # Short queries are answered exactly by the gram postings
+        verify_word = None if len(query) <= 3 else (lambda s: self._is_word_hit(s, query))
+        if take(self._candidates(query, word_start=True), "word", verify_word):
+            return results
+
+        verify_sub = None if len(query) <= 3 else (lambda s: query in s)
+        take(self._candidates(query, word_start=False), "substring", verify_sub)
+        return results
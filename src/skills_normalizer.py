@@ -3,6 +3,8 @@
 from typing import List, Dict, Set
 import re
 
+from src.text_document import normalize_text
+
 # -------------------------------------------------------------------
 # Canonical Skill Ontology
 # -------------------------------------------------------------------
@@ -48,14 +50,18 @@ _ALIAS_TO_CANONICAL = {
 # Core Normalization Functions
 # -------------------------------------------------------------------
 
+_DISALLOWED_RE = re.compile(r"[^a-z0-9\s\+\-\.]")
+_SPACE_RE = re.compile(r"\s+")
+
+
 def _basic_clean(skill: str) -> str:
     """
     Perform minimal, deterministic cleaning.
     Avoid aggressive NLP to preserve traceability.
     """
-    skill = skill.lower()
-    skill = re.sub(r"[^a-z0-9\s\+\-\.]", "", skill)
-    skill = re.sub(r"\s+", " ", skill).strip()
+    skill = normalize_text(skill)
+    skill = _DISALLOWED_RE.sub("", skill)
+    skill = _SPACE_RE.sub(" ", skill).strip()
     return skill
 
 
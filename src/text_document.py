@@ -0,0 +1,126 @@
+# src/text_document.py
+
+import re
+import string
+from dataclasses import dataclass, field
+from typing import List, Tuple, Union
+
+import numpy as np
+
+# Whitespace-delimited chunks; surrounding punctuation is trimmed so that
+# "python," or "(sql)" still hit, while "scikit-learn" stays one token.
+_CHUNK_RE = re.compile(r"\S+")
+_PUNCT = string.punctuation
+
+# Sentence / line boundaries
+_WINDOW_BREAK_RE = re.compile(r"\n+|(?<=[.!?;])\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase without changing string length, so offsets into the
+    normalised text are valid offsets into the original.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") expand when lowercased; keep those as-is
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def tokenize_with_offsets(text: str) -> List[Tuple[str, int, int, bool]]:
+    """
+    Split text into (token, start, end, joins_previous) tuples.
+
+    joins_previous is False when punctuation separates the token from the
+    previous one, so multi-word skills never span "machine, learning".
+    """
+    tokens = []
+    trailing_break = True
+
+    for m in _CHUNK_RE.finditer(text):
+        chunk = m.group()
+        start = m.start()
+
+        stripped_left = chunk.lstrip(_PUNCT)
+        start += len(chunk) - len(stripped_left)
+        word = stripped_left.rstrip(_PUNCT)
+        end = start + len(word)
+
+        if not word:
+            trailing_break = True
+            continue
+
+        tokens.append((word, start, end, not trailing_break and start == m.start()))
+        trailing_break = len(word) != len(stripped_left)
+
+    return tokens
+
+
+def sentence_windows(text: str) -> List[Tuple[int, int]]:
+    """
+    Split text into (start, end) sentence/line windows, whitespace trimmed.
+    """
+    windows = []
+    pos = 0
+    for m in list(_WINDOW_BREAK_RE.finditer(text)) + [None]:
+        end = m.start() if m else len(text)
+        segment = text[pos:end]
+        stripped = segment.strip()
+        if any(c.isalnum() for c in stripped):
+            start = pos + (len(segment) - len(segment.lstrip()))
+            windows.append((start, start + len(stripped)))
+        pos = m.end() if m else len(text)
+    return windows
+
+
+@dataclass
+class TokenizedDocument:
+    """
+    One tokenisation of an input text, shared by every extraction stage.
+
+    - normalized: lowercased text, offset-compatible with `text`
+    - tokens / starts / ends: punctuation-trimmed tokens with offsets
+    - joins: whether a token continues the previous one (no punctuation)
+    - sentences: (start, end) sentence/line windows
+    """
+    text: str
+    normalized: str
+    tokens: List[str]
+    starts: np.ndarray
+    ends: np.ndarray
+    joins: np.ndarray
+    sentences: List[Tuple[int, int]] = field(default_factory=list)
+
+    @classmethod
+    def from_text(cls, text: str) -> "TokenizedDocument":
+        normalized = normalize_text(text)
+        parsed = tokenize_with_offsets(normalized)
+
+        if parsed:
+            tokens, starts, ends, joins = zip(*parsed)
+        else:
+            tokens, starts, ends, joins = (), (), (), ()
+
+        return cls(
+            text=text,
+            normalized=normalized,
+            tokens=list(tokens),
+            starts=np.array(starts, dtype=np.int64),
+            ends=np.array(ends, dtype=np.int64),
+            joins=np.array(joins, dtype=bool),
+            sentences=sentence_windows(normalized),
+        )
+
+    @classmethod
+    def ensure(cls, doc: Union[str, "TokenizedDocument"]) -> "TokenizedDocument":
+        return doc if isinstance(doc, cls) else cls.from_text(doc)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def span(self, start: int, end: int) -> str:
+        """
+        Original-case text for a character span.
+        """
+        return self.text[start:end]
@@ -0,0 +1,10 @@
+import pytest
+
+from src.result_cache import ResultCache
+
+
+@pytest.fixture(autouse=True)
+def memory_result_cache(monkeypatch):
+    # Keep the process-wide result cache off disk (and empty) in every test,
+    # even when HIRING_CACHE_PATH is set in the environment
+    monkeypatch.setattr("src.result_cache._CACHE", ResultCache(path=None))
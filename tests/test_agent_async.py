@@ -0,0 +1,26 @@
+import asyncio
+
+from src.agent_mcp import MCPResumeMatchAgent
+
+RESUME = "Experienced Data Scientist with strong Python, SQL and pandas experience."
+ROLES = [["python", "sql", "statistics"], ["docker", "linux"], ["pandas"]]
+
+
+def test_arun_matches_run():
+    agent = MCPResumeMatchAgent()
+
+    assert asyncio.run(agent.arun(RESUME, ROLES[0])) == agent.run(RESUME, ROLES[0])
+
+
+def test_arun_many_yields_every_job():
+    agent = MCPResumeMatchAgent()
+    jobs = [(RESUME, role) for role in ROLES] + [("", ROLES[0])]
+
+    async def collect():
+        return [item async for item in agent.arun_many(iter(jobs), concurrency=2)]
+
+    results = dict(asyncio.run(collect()))
+
+    assert sorted(results) == [0, 1, 2, 3]
+    for i, (text, role) in enumerate(jobs):
+        assert results[i] == agent.run(text, role)
@@ -0,0 +1,57 @@
+import threading
+
+import pandas as pd
+
+from src.catalog_store import compile_catalog, open_catalog
+from src.matcher import SkillMatcher, _init_worker, _extract_chunk
+
+SKILLS = ["python", "machine learning", "kubernetes", "tableau", "sql"]
+
+TEXTS = [
+    "Python and SQL developer",
+    "Deployed kubernetes; some machine learning",
+    "",
+    "Built tableau dashboards with pythn",
+] * 5
+
+
+def test_batch_matches_single_document_in_order():
+    matcher = SkillMatcher(SKILLS)
+    expected = [matcher.extract_resume_skills(t) for t in TEXTS]
+
+    assert list(matcher.extract_resume_skills_batch(TEXTS, workers=1)) == expected
+    assert list(matcher.extract_resume_skills_batch(
+        iter(TEXTS), workers=2, chunksize=3
+    )) == expected
+
+
+def test_spawned_worker_reopens_artifact(tmp_path):
+    source = tmp_path / "skills.parquet"
+    pd.DataFrame({"skill": SKILLS}).to_parquet(source)
+    artifact = compile_catalog(source, tmp_path / "skills.skcat")
+
+    matcher = open_catalog(artifact).matcher()
+    spec = matcher._worker_spec()
+    assert spec[0] == str(artifact)
+
+    _init_worker(spec)
+    assert _extract_chunk(TEXTS[:2]) == [
+        matcher.extract_resume_skills(t) for t in TEXTS[:2]
+    ]
+
+
+def test_concurrent_batches_keep_their_own_matcher():
+    matchers = [SkillMatcher(["python", "sql"]), SkillMatcher(["kubernetes", "tableau"])]
+    results = [None, None]
+
+    def run(i):
+        results[i] = list(matchers[i].extract_resume_skills_batch(TEXTS, workers=2, chunksize=2))
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for matcher, result in zip(matchers, results):
+        assert result == [matcher.extract_resume_skills(t) for t in TEXTS]
@@ -0,0 +1,51 @@
+import json
+
+import pandas as pd
+
+from src.bulk_screen import CHECKPOINT_NAME, bulk_screen, load_roles
+from src.matcher import SkillMatcher
+
+ROLES = {"Data Scientist": ["python", "sql", "statistics"], "DevOps Engineer": ["docker", "linux"]}
+
+
+def _write_inputs(tmp_path):
+    rows = [
+        {"resume_id": i, "skills": text}
+        for i, text in enumerate(["Python, SQL", "Docker and Linux admin", None, "statistics"] * 3)
+    ]
+    path = tmp_path / "resumes.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in rows))
+    return path
+
+
+def test_bulk_screen_writes_role_partitions(tmp_path):
+    matcher = SkillMatcher(["python", "sql", "statistics", "docker", "linux"])
+    out = tmp_path / "out"
+
+    report = bulk_screen(_write_inputs(tmp_path), out, ROLES, matcher, batch_size=5, workers=1)
+
+    assert report["rows_done"] == 12 and report["batches_done"] == 3
+    ds = pd.read_parquet(out / "role=Data Scientist").sort_values("resume_id")
+    assert len(ds) == 12
+    assert list(ds.iloc[0]["matched_skills"]) == ["python", "sql"]
+    assert list(ds.iloc[0]["missing_skills"]) == ["statistics"]
+
+
+def test_bulk_screen_resumes_from_checkpoint(tmp_path):
+    matcher = SkillMatcher(["python", "sql", "statistics", "docker", "linux"])
+    source = _write_inputs(tmp_path)
+    out = tmp_path / "out"
+
+    bulk_screen(source, out, ROLES, matcher, batch_size=5, workers=1)
+    again = bulk_screen(source, out, ROLES, matcher, batch_size=5, workers=1)
+
+    assert again["batches_skipped"] == 3 and again["rows_this_run"] == 0
+    assert json.loads((out / CHECKPOINT_NAME).read_text())["rows_done"] == 12
+    assert len(pd.read_parquet(out / "role=DevOps Engineer")) == 12
+
+
+def test_load_roles_lowercases(tmp_path):
+    path = tmp_path / "roles.yaml"
+    path.write_text("ML Engineer: [Python, Docker]\n")
+
+    assert load_roles(path) == {"ML Engineer": ["docker", "python"]}
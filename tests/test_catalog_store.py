@@ -0,0 +1,80 @@
+import gc
+import os
+
+import pandas as pd
+
+from src import catalog_store
+from src.catalog_store import compile_catalog, load_catalog, open_catalog
+from src.matcher import SkillMatcher
+
+SKILLS = ["Python", "SQL ", "machine learning", "c++", "pandas", "python"]
+
+
+def _write_catalog(path, skills):
+    pd.DataFrame({"skill": skills, "source": "test"}).to_parquet(path)
+
+
+def test_compiled_catalog_round_trip(tmp_path):
+    source = tmp_path / "skills.parquet"
+    _write_catalog(source, SKILLS)
+
+    store = open_catalog(compile_catalog(source, tmp_path / "skills.skcat"))
+
+    assert store.skills.tolist() == ["c++", "machine learning", "pandas", "python", "sql"]
+
+    text = "Python, SQL and machine learning with pandsa"
+    from_store = store.matcher().extract_resume_skills(text)
+    rebuilt = SkillMatcher(SKILLS).extract_resume_skills(text)
+
+    key = lambda r: sorted((s["skill"], s["method"], s["confidence"]) for s in r)
+    assert key(from_store) == key(rebuilt)
+
+
+def test_load_catalog_recompiles_when_source_changes(tmp_path):
+    source = tmp_path / "skills.parquet"
+    artifact = tmp_path / "skills.skcat"
+
+    _write_catalog(source, ["python"])
+    first = load_catalog(source, artifact)
+    assert load_catalog(source, artifact) is first
+
+    _write_catalog(source, ["python", "docker"])
+    second = load_catalog(source, artifact)
+
+    assert second.content_hash != first.content_hash
+    assert "docker" in second.skill_set
+
+
+def test_load_catalog_hashes_source_only_when_its_stat_changes(tmp_path, monkeypatch):
+    source = tmp_path / "skills.parquet"
+    artifact = tmp_path / "skills.skcat"
+    _write_catalog(source, ["python"])
+    first = load_catalog(source, artifact)
+
+    hashed = []
+    real_sha256 = catalog_store.file_sha256
+    monkeypatch.setattr(catalog_store, "file_sha256", lambda p: hashed.append(p) or real_sha256(p))
+
+    assert load_catalog(source, artifact) is first
+    assert hashed == []
+
+    # Same content, new mtime: hashed once, not recompiled
+    os.utime(source, ns=(1, 10**18))
+    assert load_catalog(source, artifact) is first
+    assert load_catalog(source, artifact) is first
+    assert hashed == [source]
+
+
+def test_replaced_stores_are_released(tmp_path):
+    source = tmp_path / "skills.parquet"
+    artifact = tmp_path / "skills.skcat"
+    _write_catalog(source, ["golang"])
+    old_hash = load_catalog(source, artifact).content_hash
+
+    _write_catalog(source, ["golang", "rust"])
+    os.utime(source, ns=(1, 10**18))
+    new_hash = load_catalog(source, artifact).content_hash
+    gc.collect()
+
+    assert old_hash not in catalog_store._STORES
+    assert new_hash in catalog_store._STORES
@@ -0,0 +1,41 @@
+import threading
+
+import pandas as pd
+
+from src.engine_registry import EngineRegistry
+
+
+def _write_catalog(path, skills):
+    pd.DataFrame({"skill": skills}).to_parquet(path)
+
+
+def test_registry_reuses_engine_across_threads(tmp_path):
+    source = tmp_path / "skills.parquet"
+    _write_catalog(source, ["python", "sql"])
+    registry = EngineRegistry(source, tmp_path / "skills.skcat", semantic=False)
+
+    engines = []
+    threads = [threading.Thread(target=lambda: engines.append(registry.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(e) for e in engines}) == 1
+
+
+def test_registry_swaps_engine_when_catalog_changes(tmp_path):
+    source = tmp_path / "skills.parquet"
+    _write_catalog(source, ["python", "sql"])
+    registry = EngineRegistry(source, tmp_path / "skills.skcat", semantic=False, check_interval=0)
+
+    old = registry.get()
+    _write_catalog(source, ["python", "sql", "kubernetes"])
+
+    # The first call after the change still serves the previous engine
+    assert registry.get() is old
+    registry.wait()
+
+    new = registry.get()
+    assert new is not old and new.version != old.version
+    assert "kubernetes" in new.store.skill_set
@@ -0,0 +1,23 @@
+from rapidfuzz import fuzz
+
+from src.fuzzy_index import FuzzySkillIndex
+
+
+def test_fuzzy_index_matches_brute_force():
+    skills = ["python", "pandas", "tensorflow", "kubernetes", "sql", "statistics"]
+    tokens = "experienced in pythn, pandass, tensorflw and kubernete sql".split()
+
+    expected = {}
+    for skill in skills:
+        score = max(fuzz.ratio(skill, t) for t in tokens)
+        if score >= 90:
+            expected[skill] = score
+
+    assert FuzzySkillIndex(skills, threshold=90).match(tokens) == expected
+
+
+def test_fuzzy_index_skips_incompatible_lengths():
+    index = FuzzySkillIndex(["kubernetes", "sql"], threshold=90)
+
+    assert list(index.candidates("sq")) == []
+    assert [index.skills[i] for i in index.candidates("kubernete")] == ["kubernetes"]
@@ -0,0 +1,48 @@
+from src.indexer import SkillIndexer
+
+SKILLS = ["python", "machine learning", "deep learning", "sql", "data analysis"]
+
+
+def test_save_load_round_trip(tmp_path):
+    fitted = SkillIndexer(SKILLS)
+    loaded = SkillIndexer.load(fitted.save(tmp_path / "index"))
+
+    assert loaded.skills == SKILLS
+    assert loaded.search("machine learning with python") == \
+        fitted.search("machine learning with python")
+
+
+def test_load_or_fit_refits_only_on_catalog_change(tmp_path, monkeypatch):
+    SkillIndexer.load_or_fit(SKILLS, cache_dir=tmp_path)
+
+    def _no_fit(self, skills):
+        raise AssertionError("index should come from cache")
+
+    monkeypatch.setattr(SkillIndexer, "__init__", _no_fit)
+    cached = SkillIndexer.load_or_fit(SKILLS, cache_dir=tmp_path)
+    assert cached.skills == SKILLS
+
+    monkeypatch.undo()
+    changed = SkillIndexer.load_or_fit(SKILLS + ["docker"], cache_dir=tmp_path)
+    assert "docker" in changed.skills
+
+
+def test_search_batch_matches_single_queries():
+    indexer = SkillIndexer(SKILLS)
+    texts = ["machine learning with python", "sql data analysis", "nothing relevant"]
+
+    batch = indexer.search_batch(texts, top_k=2, min_sim=0.2)
+
+    assert len(batch) == 3
+    assert batch == [indexer.search(t, top_k=2) for t in texts]
+    assert batch[2] == []
+
+
+def test_similarity_matrix_keeps_only_values_above_threshold():
+    indexer = SkillIndexer(SKILLS)
+
+    sims = indexer.similarity_matrix(["deep learning", "sql"], min_sim=0.5)
+
+    assert sims.shape == (2, len(SKILLS))
+    assert (sims.data > 0.5).all()
+    assert indexer.skills[sims[1].indices[0]] == "sql"
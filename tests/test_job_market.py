@@ -0,0 +1,66 @@
+import time
+
+from src.job_market import AdzunaBackend, FixtureServer, JobMarketClient
+
+LISTINGS = {
+    "Data Scientist": [{"title": "Data Scientist", "company": {"display_name": "Acme"}}],
+    "ML Engineer": [{"title": "ML Engineer", "company": {"display_name": "Initech"}}],
+}
+
+
+def test_backend_talks_to_fixture_server():
+    with FixtureServer(LISTINGS) as server:
+        backend = AdzunaBackend(app_id="id", app_key="key", base_url=server.url)
+        assert backend.search("data scientist", "gb") == LISTINGS["Data Scientist"]
+        assert backend.search("Unknown Role") == []
+
+    assert server.requests[0]["path"] == "/jobs/gb/search/1"
+    assert server.requests[0]["app_key"] == "key"
+
+
+def test_ttl_cache_and_concurrent_prefetch():
+    with FixtureServer(LISTINGS, delay=0.2) as server:
+        client = JobMarketClient(AdzunaBackend(base_url=server.url), ttl=60, workers=4)
+
+        started = time.monotonic()
+        for future in client.prefetch(list(LISTINGS)):
+            future.result()
+        # Both roles fetched in parallel, not back to back
+        assert time.monotonic() - started < 0.35
+
+        assert client.get("ml engineer") == LISTINGS["ML Engineer"]
+        assert client.get("Data Scientist", "US") == LISTINGS["Data Scientist"]
+        assert len(server.requests) == 2
+        client.close()
+
+
+class FlakyBackend:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def search(self, role, location):
+        self.calls += 1
+        if self.fail:
+            raise TimeoutError("upstream timed out")
+        return [{"title": f"{role} #{self.calls}"}]
+
+
+def test_stale_while_revalidate_and_failures():
+    backend = FlakyBackend()
+    client = JobMarketClient(backend, ttl=0.0, stale_ttl=60)
+
+    assert client.get("sre") == [{"title": "sre #1"}]
+
+    # Past TTL: the stale value comes back at once, refresh runs behind it
+    time.sleep(0.01)
+    assert client.get("sre") == [{"title": "sre #1"}]
+    for future in client.prefetch(["sre"]):
+        future.result()
+    assert backend.calls >= 2
+    assert client.get("sre")[0]["title"].startswith("sre #")
+
+    # Upstream failure on a cold key degrades to an empty list
+    backend.fail = True
+    assert client.get("cold role") == []
+    client.close()
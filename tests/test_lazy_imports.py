@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src.lazy import LazyModule, lazy_import
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_lazy_module_imports_on_first_use():
+    assert lazy_import("json") is sys.modules["json"]
+
+    module = lazy_import("colorsys")
+    if isinstance(module, LazyModule):
+        assert "colorsys" not in sys.modules
+    assert module.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+
+
+def test_entry_points_do_not_load_heavy_libraries():
+    code = (
+        "import sys, mcp_server.server, src.job_market, src.resume_parser, src.shortlist\n"
+        "print(' '.join(m for m in ('sklearn', 'fitz', 'requests', 'scipy.sparse', 'langchain') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == ""
@@ -10,3 +10,53 @@ def test_extract_skills_tool():
 
     assert len(resp.skills) > 0
     assert any(s.skill == "python" for s in resp.skills)
+
+
+def test_score_matrix_tool_matches_single_scores():
+    from mcp_server.schemas import MatchScoreRequest, RoleSkills, ScoreMatrixRequest
+    from mcp_server.tools.match_tools import match_score_tool, score_matrix_tool
+
+    resumes = [["python", "sql"], ["docker"], []]
+    roles = [
+        RoleSkills(role="Data Scientist", skills=["python", "sql", "statistics"]),
+        RoleSkills(role="DevOps Engineer", skills=["docker", "linux"]),
+    ]
+
+    resp = score_matrix_tool(ScoreMatrixRequest(resume_skills=resumes, roles=roles))
+
+    assert resp.roles == ["Data Scientist", "DevOps Engineer"]
+    for i, resume in enumerate(resumes):
+        for j, role in enumerate(roles):
+            single = match_score_tool(
+                MatchScoreRequest(resume_skills=resume, role_skills=role.skills)
+            )
+            assert resp.scores[i][j] == single.score
+            assert resp.results[i][j] == single
+
+
+def test_extract_skills_batch_tool():
+    from mcp_server.schemas import ExtractSkillsBatchRequest
+    from mcp_server.tools.resume_tools import extract_skills_batch_tool
+
+    resp = extract_skills_batch_tool(
+        ExtractSkillsBatchRequest(resume_texts=["Python developer", "SQL analyst"])
+    )
+
+    assert len(resp.results) == 2
+    assert any(s.skill == "python" for s in resp.results[0].skills)
+    assert any(s.skill == "sql" for s in resp.results[1].skills)
+
+
+def test_trusted_tools_match_validated_tools():
+    from mcp_server.schemas import MatchScoreRequest
+    from mcp_server.server import MCP_TOOLS, TRUSTED_TOOLS
+
+    text = "Experienced in Python and SQL"
+    validated = MCP_TOOLS["resume.extract_skills"](ExtractSkillsRequest(resume_text=text))
+    assert TRUSTED_TOOLS["resume.extract_skills"](text) == [
+        s.model_dump(exclude_unset=True) for s in validated.skills
+    ]
+
+    req = MatchScoreRequest(resume_skills=["python"], role_skills=["python", "sql"])
+    assert TRUSTED_TOOLS["match.score"](req.resume_skills, req.role_skills) == \
+        MCP_TOOLS["match.score"](req).model_dump()
@@ -0,0 +1,44 @@
+from rapidfuzz import fuzz
+
+from src.partial_ratio_index import PartialRatioIndex
+from src.skill_extractor import extract_skills_from_text
+
+
+SKILLS = [
+    "Python", "pandas", "TensorFlow", "Kubernetes", "SQL", "machine learning",
+    "data visualization", "go", "r", "statistics", "project management",
+    "natural language processing and large scale information retrieval systems",
+]
+
+TEXT = (
+    "Senior engineer. Built pipelines in pythn and pandas, deployed on "
+    "kubernetis clusters; strong background in machine-learning and "
+    "statistical modelling. Led data visualisation and project managment "
+    "for natural language processing and large scale retrieval systems."
+)
+
+
+def brute_force(text, skills, threshold):
+    found = []
+    text_lower = text.lower()
+    for skill in skills:
+        skill_lower = skill.lower()
+        if skill_lower in text_lower:
+            found.append({"skill": skill, "method": "exact", "confidence": 1.0})
+        else:
+            score = fuzz.partial_ratio(skill_lower, text_lower)
+            if score >= threshold:
+                found.append({"skill": skill, "method": "fuzzy", "confidence": score / 100})
+    return found
+
+
+def test_partial_ratio_index_matches_brute_force():
+    index = PartialRatioIndex(SKILLS)
+
+    for threshold in (70, 85, 95):
+        assert index.match(TEXT, threshold) == brute_force(TEXT, SKILLS, threshold)
+
+
+def test_extract_skills_from_text_uses_index():
+    assert extract_skills_from_text(TEXT, SKILLS) == brute_force(TEXT, SKILLS, 85)
+    assert extract_skills_from_text("", SKILLS) == brute_force("", SKILLS, 85)
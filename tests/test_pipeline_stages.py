@@ -0,0 +1,46 @@
+from src.pipeline_stages import StageCache, score_roles_stage, stage_key
+from src.role_matrix import RoleMatrix
+
+ROLES = {
+    "Data Scientist": ["python", "sql", "statistics"],
+    "DevOps Engineer": ["docker", "kubernetes"],
+}
+MATRIX = RoleMatrix(ROLES)
+
+
+def test_only_changed_stages_recompute():
+    cache = StageCache()
+    calls = []
+
+    def run(timings, resume, roles):
+        cache.run("extract", stage_key(resume), lambda: calls.append("extract") or resume.split(), timings)
+        cache.run(
+            "score", stage_key(resume, roles),
+            lambda: calls.append("score") or score_roles_stage(resume.split(), MATRIX, roles),
+            timings
+        )
+
+    first, second = [], []
+    run(first, "python sql docker", ["Data Scientist"])
+    run(second, "python sql docker", ["Data Scientist", "DevOps Engineer"])
+
+    assert calls == ["extract", "score", "score"]
+    assert [t["hit"] for t in first] == [False, False]
+    assert [(t["stage"], t["hit"]) for t in second] == [("extract", True), ("score", False)]
+    assert all(t["seconds"] >= 0 for t in first + second)
+
+
+def test_ttl_expires_entries():
+    cache = StageCache()
+    calls = []
+    cache.run("jobs", "k", lambda: calls.append(1), ttl=60)
+    cache.run("jobs", "k", lambda: calls.append(1), ttl=60)
+    cache.run("jobs", "k", lambda: calls.append(1), ttl=-1)
+    assert len(calls) == 2
+
+
+def test_score_roles_best_first():
+    rows = score_roles_stage(["Docker", "kubernetes", "python"], MATRIX, list(ROLES))
+    assert [r["Role"] for r in rows] == ["DevOps Engineer", "Data Scientist"]
+    assert rows[0]["Match %"] == 100.0
+    assert rows[1]["Matched"] == 1
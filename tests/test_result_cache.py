@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from src.matcher import SkillMatcher
+from src.result_cache import ResultCache, cache_key, extract_resume_skills_cached
+
+
+def test_disk_tier_survives_restart_and_evicts(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = ResultCache(path, memory_items=2, max_disk_bytes=200)
+
+    cache.set("a", {"x": 1})
+    assert cache.get("a") == {"x": 1}
+    assert cache.stats["memory_hits"] == 1
+    cache.close()
+
+    reopened = ResultCache(path, memory_items=2, max_disk_bytes=200)
+    assert reopened.get("a") == {"x": 1}
+    assert reopened.get("missing") is None
+    assert reopened.stats["disk_hits"] == 1 and reopened.stats["misses"] == 1
+
+    for i in range(10):
+        reopened.set(f"k{i}", "v" * 40)
+    assert reopened.stats["evictions"] > 0
+    assert reopened._disk_bytes <= 200
+
+
+@pytest.mark.skipif(bool(os.environ.get("HIRING_CACHE_PATH")), reason="disk tier configured")
+def test_disk_tier_is_opt_in():
+    cache = ResultCache()
+    cache.set("a", 1)
+    assert cache.path is None and cache._db is None
+    assert cache.get("a") == 1
+
+
+def test_cache_key_depends_on_catalog_and_normalised_text():
+    assert cache_key("extract", "Python", "v1") == cache_key("extract", "PYTHON", "v1")
+    assert cache_key("extract", "Python", "v1") != cache_key("extract", "Python", "v2")
+    assert cache_key("extract", "Python", "v1", semantic=True) != cache_key("extract", "Python", "v1")
+
+
+def test_cached_extraction_reslices_snippets(tmp_path):
+    matcher = SkillMatcher(["python", "machine learning"])
+    cache = ResultCache(tmp_path / "cache.sqlite")
+
+    first = extract_resume_skills_cached(matcher, "Python and Machine Learning", cache)
+    second = extract_resume_skills_cached(matcher, "python and machine learning", cache)
+
+    assert cache.stats["memory_hits"] == 1
+    assert first == matcher.extract_resume_skills("Python and Machine Learning")
+    assert second == matcher.extract_resume_skills("python and machine learning")
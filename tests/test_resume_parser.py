@@ -0,0 +1,78 @@
+import io
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.matcher import SkillMatcher
+from src.resume_parser import (
+    PARALLEL_MIN_PAGES,
+    PdfLimitError,
+    extract_text_from_pdf,
+    iter_pdf_pages
+)
+
+SAMPLE = Path(__file__).resolve().parents[1] / "sample_resume.pdf"
+
+
+def test_pdf_text_from_bytes_and_buffers_matches_path():
+    data = SAMPLE.read_bytes()
+    expected = extract_text_from_pdf(str(SAMPLE))
+
+    assert expected.strip()
+    assert extract_text_from_pdf(data) == expected
+    assert extract_text_from_pdf(memoryview(data)) == expected
+    assert extract_text_from_pdf(io.BytesIO(data)) == expected
+
+
+def _pdf(pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def test_iter_pdf_pages_limits():
+    data = _pdf([f"page {i}" for i in range(5)])
+
+    assert [p.strip() for p in iter_pdf_pages(data)] == [f"page {i}" for i in range(5)]
+    assert len(list(iter_pdf_pages(data, max_pages=2))) == 2
+    assert list(iter_pdf_pages(data, time_budget=0.0)) == []
+
+    with pytest.raises(PdfLimitError):
+        list(iter_pdf_pages(data, max_pages=2, strict=True))
+    with pytest.raises(PdfLimitError):
+        list(iter_pdf_pages(data, max_bytes=10))
+
+
+def test_parallel_pages_match_serial():
+    data = _pdf([f"page {i} python" for i in range(PARALLEL_MIN_PAGES + 2)])
+
+    assert list(iter_pdf_pages(data, workers=2)) == list(iter_pdf_pages(data))
+
+
+def test_parallel_pages_stop_waiting_at_the_time_budget():
+    data = _pdf([f"page {i}" for i in range(PARALLEL_MIN_PAGES)])
+
+    # Spawned workers take far longer than 10 ms to start
+    started = time.monotonic()
+    with pytest.raises(PdfLimitError):
+        list(iter_pdf_pages(data, workers=2, time_budget=0.01, strict=True))
+    assert list(iter_pdf_pages(data, workers=2, time_budget=0.01)) == []
+    assert time.monotonic() - started < 5
+
+
+def test_incremental_extraction_offsets_span_joined_pages():
+    pages = ["Python developer", "SQL and python", "Kubernetes"]
+    matcher = SkillMatcher(["python", "sql", "kubernetes"])
+
+    seen = {}
+    for page_no, records in matcher.extract_resume_skills_incremental(pages):
+        for r in records:
+            seen[r["skill"]] = (page_no, r)
+
+    text = "\n".join(pages)
+    assert {s: p for s, (p, _) in seen.items()} == {"python": 0, "sql": 1, "kubernetes": 2}
+    for _, r in seen.values():
+        assert text[r["start"]:r["end"]].lower() == r["skill"]
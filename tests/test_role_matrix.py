@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+
+from src.role_matrix import RoleMatrix, match_role
+
+ROLES = {
+    "Data Scientist": ["python", "sql", "machine learning", "statistics"],
+    "DevOps Engineer": ["docker", "kubernetes", "aws", "linux"],
+    "Empty": [],
+}
+
+
+def reference(resume, role_skills):
+    resume_set, role_set = set(resume), set(role_skills)
+    coverage = len(resume_set & role_set) / max(len(role_set), 1)
+    return {
+        "score": round(coverage * 100, 2),
+        "coverage": round(coverage, 3),
+        "matched_skills": sorted(resume_set & role_set),
+        "missing_skills": sorted(role_set - resume_set),
+    }
+
+
+def test_batch_matches_set_reference():
+    rng = random.Random(7)
+    vocab = sorted({s for skills in ROLES.values() for s in skills}) + ["rust", "go"]
+    resumes = [rng.sample(vocab, rng.randint(0, len(vocab))) for _ in range(40)]
+
+    matrix = RoleMatrix(ROLES)
+    scores = matrix.score_batch(resumes)
+    assert scores.coverage.shape == (40, 3)
+
+    for i, resume in enumerate(resumes):
+        for j, role in enumerate(matrix.roles):
+            report = scores.report(i, j)
+            assert report.pop("role") == role
+            assert report == reference(resume, ROLES[role])
+        # Single-row fast path agrees with the batch product
+        single = matrix.score(resume)
+        assert np.array_equal(single.counts[0], scores.counts[i])
+        assert single.reports(0) == scores.reports(i)
+
+
+def test_indices_ranking_and_subset():
+    matrix = RoleMatrix(ROLES)
+    scores = matrix.score(["docker", "aws", "python"])
+
+    j = matrix.index["DevOps Engineer"]
+    assert [matrix.skills[c] for c in scores.matched(0, j)] == ["aws", "docker"]
+    assert [matrix.skills[c] for c in scores.missing(0, j)] == ["kubernetes", "linux"]
+    assert [matrix.roles[k] for k in scores.ranking(0)] == ["DevOps Engineer", "Data Scientist", "Empty"]
+
+    sub = matrix.subset(["DevOps Engineer"])
+    assert sub.roles == ["DevOps Engineer"]
+    assert sub.score(["docker"]).report(0, 0)["score"] == 25.0
+
+
+def test_match_role_single_list():
+    assert match_role(["sql", "excel"], ["sql", "tableau"]) == {
+        "role": "role",
+        "score": 50.0,
+        "coverage": 0.5,
+        "matched_skills": ["sql"],
+        "missing_skills": ["tableau"],
+    }
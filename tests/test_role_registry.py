@@ -0,0 +1,75 @@
+import os
+
+import pandas as pd
+
+from src.role_registry import DEFAULT_ROLES, RoleRegistry, RoleSet, load_role_file, title_key
+
+ROLES_YAML = """
+Data Scientist: [Python, " SQL ", Machine  Learning]
+ML Engineer:
+  skills: [python, docker]
+  aliases: [MLOps Engineer]
+"""
+
+
+def test_skills_lowercased_and_aliases_loaded(tmp_path):
+    path = tmp_path / "roles.yaml"
+    path.write_text(ROLES_YAML)
+
+    roles, aliases = load_role_file(path)
+    assert roles == {
+        "Data Scientist": ["machine learning", "python", "sql"],
+        "ML Engineer": ["docker", "python"],
+    }
+    assert aliases["ML Engineer"] == ["MLOps Engineer"]
+
+
+def test_shipped_roles_match_catalog_spelling():
+    roles = RoleRegistry(DEFAULT_ROLES).get()
+    devops = roles.matrix.index["DevOps Engineer"]
+
+    report = roles.matrix.score(["ci/cd", "docker"]).report(0, devops)
+    assert report["matched_skills"] == ["ci/cd", "docker"]
+    assert report["score"] == 40.0
+
+
+def test_parquet_role_file(tmp_path):
+    path = tmp_path / "roles.parquet"
+    pd.DataFrame({
+        "role": ["Data Analyst"],
+        "skills": [["SQL", "Tableau"]],
+        "aliases": [["BI Analyst"]],
+    }).to_parquet(path)
+
+    roles = RoleRegistry(path).get()
+    assert roles.skills("Senior BI Analyst") == ["sql", "tableau"]
+
+
+def test_title_resolution():
+    roles = RoleSet(
+        {"ML Engineer": ["python"], "Data Scientist": ["sql"], "Software Engineer": ["java"]},
+        {"Software Engineer": ["Backend Developer"]},
+    )
+
+    assert title_key("Sr. ML Eng") == title_key("Machine Learning Engineer") == "ml engineer"
+    assert roles.resolve("Sr. ML Eng") == "ML Engineer"
+    assert roles.resolve("MLE") == "ML Engineer"
+    assert roles.resolve("Lead Backend Dev") == "Software Engineer"
+    assert roles.resolve("Data Scintist") == "Data Scientist"   # fuzzy fallback
+    assert roles.resolve("Pastry Chef") is None
+    assert roles.skills("nope") is None
+
+
+def test_hot_reload_keeps_last_good_file(tmp_path):
+    path = tmp_path / "roles.yaml"
+    path.write_text("Data Analyst: [sql]\n")
+    registry = RoleRegistry(path, check_interval=0)
+    assert list(registry.get().roles) == ["Data Analyst"]
+
+    path.write_text("Data Analyst: [sql]\nData Engineer: [spark]\n")
+    os.utime(path, ns=(1, 10**18))
+    assert registry.get().skills("data eng") == ["spark"]
+
+    path.write_text("- not a mapping\n")
+    os.utime(path, ns=(1, 2 * 10**18))
+    assert len(registry.get()) == 2
@@ -0,0 +1,184 @@
+import io
+import json
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_server.rpc_server import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    REQUEST_TIMEOUT,
+    SERVER_BUSY,
+    SHUTTING_DOWN,
+    MCPClient,
+    MCPServer,
+    make_socket_server,
+    serve_stream,
+)
+
+
+class EchoRequest(BaseModel):
+    text: str
+
+
+class EchoResponse(BaseModel):
+    text: str
+
+
+release = threading.Event()
+
+
+def echo_tool(req: EchoRequest) -> EchoResponse:
+    return EchoResponse(text=req.text)
+
+
+def blocking_tool(req: EchoRequest) -> EchoResponse:
+    release.wait(5)
+    return EchoResponse(text=req.text)
+
+
+def _request(method, params, request_id=1):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def test_dispatch_validates_and_reports_errors():
+    server = MCPServer({"echo": echo_tool}, workers=2)
+
+    assert server.handle(_request("echo", {"text": "hi"}))["result"] == {"text": "hi"}
+    assert server.handle(_request("echo", {}))["error"]["code"] == INVALID_PARAMS
+    assert server.handle(_request("nope", {}))["error"]["code"] == METHOD_NOT_FOUND
+
+    call = server.handle(_request("tools/call", {"name": "echo", "arguments": {"text": "x"}}))
+    assert call["result"]["structuredContent"] == {"text": "x"}
+    assert [t["name"] for t in server.handle(_request("tools/list", {}))["result"]["tools"]] == ["echo"]
+    server.shutdown()
+
+
+def test_backpressure_timeout_and_drain():
+    release.clear()
+    server = MCPServer({"block": blocking_tool}, workers=1, max_queue=1, timeout=5)
+
+    first = server.submit(_request("block", {"text": "a"}, 1))
+    second = server.submit(_request("block", {"text": "b"}, 2))
+    rejected = server.handle(_request("block", {"text": "c"}, 3))
+    assert rejected["error"]["code"] == SERVER_BUSY
+
+    release.set()
+    assert server.shutdown(drain_timeout=5)
+    assert first.result()["result"] == {"text": "a"}
+    assert second.result()["result"] == {"text": "b"}
+    assert server.handle(_request("block", {"text": "d"}))["error"]["code"] == SHUTTING_DOWN
+
+    release.clear()
+    slow = MCPServer({"block": blocking_tool}, workers=1, timeout=0.05)
+    assert slow.handle(_request("block", {"text": "e"}))["error"]["code"] == REQUEST_TIMEOUT
+    release.set()
+    slow.shutdown()
+
+
+def test_malformed_params_get_error_replies():
+    server = MCPServer({"echo": echo_tool}, workers=2)
+    reader = io.StringIO("".join(json.dumps(m) + "\n" for m in [
+        _request("tools/call", [1], 1),
+        _request("tools/call", {"name": ["echo"]}, 2),
+        _request("echo", "text", 3),
+        _request("echo", {"text": "still up"}, 4),
+    ]))
+    writer = io.StringIO()
+
+    serve_stream(server, reader, writer)
+
+    replies = {r["id"]: r for r in map(json.loads, writer.getvalue().splitlines())}
+    assert replies[1]["error"]["code"] == INVALID_REQUEST
+    assert replies[2]["error"]["code"] == INVALID_PARAMS
+    assert replies[3]["error"]["code"] == INVALID_REQUEST
+    assert replies[4]["result"] == {"text": "still up"}
+    server.shutdown()
+
+
+def test_timed_out_call_keeps_its_slot_until_it_finishes():
+    release.clear()
+    server = MCPServer({"block": blocking_tool}, workers=1, max_queue=0, timeout=0.05)
+
+    assert server.handle(_request("block", {"text": "a"}))["error"]["code"] == REQUEST_TIMEOUT
+    # The tool is still running, so the only slot is still taken
+    assert server.in_flight == 1
+    assert server.handle(_request("block", {"text": "b"}))["error"]["code"] == SERVER_BUSY
+
+    release.set()
+    assert server.shutdown(drain_timeout=5)
+    assert server.in_flight == 0
+
+
+def test_tool_limit_rejects_without_blocking_other_tools():
+    release.clear()
+    server = MCPServer(
+        {"block": blocking_tool, "echo": echo_tool},
+        workers=2, max_queue=4, tool_limits={"block": 1}, timeout=5
+    )
+
+    first = server.submit(_request("block", {"text": "a"}, 1))
+    assert server.handle(_request("block", {"text": "b"}, 2))["error"]["code"] == SERVER_BUSY
+    assert server.handle(_request("echo", {"text": "c"}, 3))["result"] == {"text": "c"}
+
+    release.set()
+    assert first.result()["result"] == {"text": "a"}
+    server.shutdown()
+
+
+def test_timed_out_calls_still_count_against_workers():
+    release.clear()
+    running = []
+
+    def counting_tool(req: EchoRequest) -> EchoResponse:
+        running.append(req.text)
+        release.wait(5)
+        return EchoResponse(text=req.text)
+
+    server = MCPServer({"count": counting_tool}, workers=1, max_queue=4, timeout=0.05)
+    assert server.handle(_request("count", {"text": "a"}, 1))["error"]["code"] == REQUEST_TIMEOUT
+    assert server.handle(_request("count", {"text": "b"}, 2))["error"]["code"] == REQUEST_TIMEOUT
+    # "b" never started: the only worker is still busy with "a"
+    assert running == ["a"]
+
+    release.set()
+    assert server.shutdown(drain_timeout=5)
+
+
+def test_stdio_stream_round_trip():
+    server = MCPServer({"echo": echo_tool}, workers=2)
+    reader = io.StringIO(
+        json.dumps(_request("echo", {"text": "a"}, 1)) + "\n"
+        + "not json\n"
+        + json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + "\n"
+    )
+    writer = io.StringIO()
+
+    serve_stream(server, reader, writer)
+
+    replies = {r["id"]: r for r in map(json.loads, writer.getvalue().splitlines())}
+    assert replies[1]["result"] == {"text": "a"}
+    assert replies[None]["error"]["code"] == -32700
+    server.shutdown()
+
+
+def test_unix_socket_serves_mcp_tools(tmp_path):
+    pytest.importorskip("socket").AF_UNIX
+    server = MCPServer(workers=2, warm=False, tool_limits={"match.score": 1})
+    transport = make_socket_server(server, str(tmp_path / "mcp.sock"))
+    thread = threading.Thread(target=transport.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with MCPClient(str(tmp_path / "mcp.sock"), timeout=10) as client:
+            result = client.call("match.score", {
+                "resume_skills": ["python"], "role_skills": ["python", "sql"]
+            })
+    finally:
+        transport.shutdown()
+        transport.server_close()
+        server.shutdown()
+
+    assert result == {"score": 50.0, "matched_skills": ["python"], "missing_skills": ["sql"]}
@@ -0,0 +1,34 @@
+import pytest
+
+from src.indexer import SkillIndexer
+from src.matcher import SkillMatcher
+from src.text_document import sentence_windows
+
+SKILLS = ["kubernetes", "tableau", "statistics", "python"]
+
+
+def test_sentence_windows_trim_and_split():
+    text = "Summary.\n  Deployed on clusters.  Built dashboards; mentored\n\n"
+
+    windows = sentence_windows(text)
+
+    assert [text[s:e] for s, e in windows] == [
+        "Summary.", "Deployed on clusters.", "Built dashboards;", "mentored"
+    ]
+
+
+def test_window_mode_reports_offsets_per_skill():
+    indexer = SkillIndexer(SKILLS)
+    matcher = SkillMatcher(SKILLS, indexer, semantic_mode="window")
+    text = "Deployed kubernetes clusters.\nBuilt tableau reports. More tableau work."
+
+    semantic = {s["skill"]: s for s in matcher._semantic_windows(text)}
+
+    assert set(semantic) == {"kubernetes", "tableau"}
+    assert len(semantic["tableau"]["windows"]) == 2
+    assert semantic["kubernetes"]["evidence_snippet"] == "Deployed kubernetes clusters."
+
+
+def test_unknown_semantic_mode_rejected():
+    with pytest.raises(ValueError):
+        SkillMatcher(SKILLS, semantic_mode="paragraph")
@@ -0,0 +1,71 @@
+import io
+import zipfile
+
+import fitz
+
+from src.bias_diagnostics import BiasDiagnostics
+from src.matcher import SkillMatcher
+from src.shortlist import ShortlistJob, bias_flags, expand_uploads
+
+ROLES = {
+    "Data Scientist": ["python", "sql", "statistics"],
+    "DevOps Engineer": ["docker", "kubernetes", "aws"],
+}
+
+
+def _pdf(text):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+def _zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_expand_uploads_unzips_pdfs_only():
+    archive = _zip({"a.pdf": b"%PDF-a", "notes.txt": b"x", "__MACOSX/._a.pdf": b"junk", "dir/b.pdf": b"%PDF-b"})
+    files = list(expand_uploads([("one.pdf", b"%PDF-1"), ("batch.zip", archive)]))
+    assert [name for name, _ in files] == ["one.pdf", "batch.zip/a.pdf", "batch.zip/dir/b.pdf"]
+
+
+def test_job_ranks_streamed_results():
+    matcher = SkillMatcher(["python", "sql", "statistics", "docker", "kubernetes", "aws"])
+    uploads = [
+        ("devops.pdf", _pdf("Docker, Kubernetes and AWS on call")),
+        ("ds.pdf", _pdf("Python, SQL and statistics")),
+        ("broken.pdf", b"not a pdf"),
+    ]
+
+    job = ShortlistJob(uploads, ROLES, matcher, workers=2).start()
+    job.wait(timeout=30)
+
+    assert job.done and job.completed == job.total == 3
+    assert [name for name, _ in job.errors] == ["broken.pdf"]
+
+    table = job.table()
+    assert list(table["Best %"]) == [100.0, 100.0]
+    assert dict(zip(table["Candidate"], table["Best Role"])) == {
+        "devops.pdf": "DevOps Engineer", "ds.pdf": "Data Scientist"
+    }
+    assert list(table.columns[:3]) == ["Candidate", "Data Scientist %", "DevOps Engineer %"]
+    assert table.loc[0, "Gaps"] == ""
+
+
+def test_bias_flags_follow_bias_diagnostics():
+    sparse = BiasDiagnostics(
+        [{"skill": "python"}, {"skill": "python"}, {"skill": "sql"}],
+        ROLES, {"Data Scientist": 66.67, "DevOps Engineer": 0.0}
+    ).summary()
+    assert bias_flags(sparse) == ["few skills"]
+
+    skewed = BiasDiagnostics(
+        [{"skill": f"s{i}"} for i in range(10)],
+        {"A": ["a"] * 2, "B": ["b"] * 4, "C": ["c"] * 6},
+        {"A": 20.0, "B": 40.0, "C": 60.0}
+    ).summary()
+    assert bias_flags(skewed) == ["role-size skew"]
@@ -0,0 +1,37 @@
+from src.matcher import SkillMatcher
+from src.skill_automaton import SkillAutomaton
+
+
+def test_automaton_finds_multi_word_skills_with_offsets():
+    automaton = SkillAutomaton(["machine learning", "learning", "python"])
+    text = "Built Machine Learning pipelines in Python."
+
+    hits = {h["skill"]: h for h in automaton.find(text)}
+
+    assert set(hits) == {"machine learning", "learning", "python"}
+    ml = hits["machine learning"]
+    assert text[ml["start"]:ml["end"]] == "Machine Learning"
+    assert text[hits["python"]["start"]:hits["python"]["end"]] == "Python"
+
+
+def test_automaton_respects_word_boundaries():
+    automaton = SkillAutomaton(["java", "machine learning"])
+
+    assert automaton.find("javascript developer") == []
+    # Punctuation breaks a phrase
+    assert automaton.find("machine, learning") == []
+
+
+def test_matcher_exact_stage_reports_offsets():
+    matcher = SkillMatcher(["Python", "SQL", "machine learning", "c++"])
+    text = "Experienced in Python, SQL and machine learning"
+
+    exact = {
+        s["skill"]: s
+        for s in matcher.extract_resume_skills(text)
+        if s["method"] == "exact"
+    }
+
+    assert set(exact) == {"python", "sql", "machine learning"}
+    assert exact["machine learning"]["evidence_snippet"] == "machine learning"
+    assert text[exact["sql"]["start"]:exact["sql"]["end"]] == "SQL"
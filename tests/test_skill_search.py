@@ -0,0 +1,24 @@
+from src.skill_search import SkillSearchIndex
+
+SKILLS = ["C++", "c++ builder", "objective-c", "machine learning", "learning design",
+          "e-learning", "python", "pythonnet", "sql", "nosql", "mysql"]
+
+
+def test_search_ranks_by_match_kind_then_length():
+    index = SkillSearchIndex(SKILLS)
+
+    assert index.search("learning", top_k=10) == [
+        {"skill": "learning design", "match": "prefix"},
+        {"skill": "e-learning", "match": "word"},
+        {"skill": "machine learning", "match": "word"},
+    ]
+    assert [h["skill"] for h in index.search("SQL", top_k=3)] == ["sql", "mysql", "nosql"]
+
+
+def test_search_is_literal_and_honours_top_k():
+    index = SkillSearchIndex(SKILLS)
+
+    assert [h["skill"] for h in index.search("c++")] == ["c++", "c++ builder"]
+    assert index.search(".*") == []
+    assert len(index.search("python", top_k=1)) == 1
+    assert index.search("   ") == []
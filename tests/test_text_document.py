@@ -0,0 +1,24 @@
+from src.text_document import TokenizedDocument
+
+
+def test_tokens_carry_offsets_into_original_text():
+    doc = TokenizedDocument.from_text("Built ML pipelines (Python, SQL).\nLed teams.")
+
+    assert doc.tokens == ["built", "ml", "pipelines", "python", "sql", "led", "teams"]
+    assert [doc.span(s, e) for s, e in zip(doc.starts, doc.ends)][3:5] == ["Python", "SQL"]
+    assert [doc.span(s, e) for s, e in doc.sentences] == [
+        "Built ML pipelines (Python, SQL).", "Led teams."
+    ]
+
+
+def test_joins_break_at_punctuation():
+    doc = TokenizedDocument.from_text("machine learning, deep learning")
+
+    assert doc.joins.tolist() == [False, True, False, True]
+
+
+def test_normalized_text_keeps_offsets_aligned():
+    doc = TokenizedDocument.from_text("İstanbul Python")
+
+    assert len(doc.normalized) == len(doc.text)
+    assert doc.span(doc.starts[1], doc.ends[1]) == "Python"